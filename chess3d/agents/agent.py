@@ -1,5 +1,6 @@
 import logging
 import os
+import time
 import numpy as np
 from pandas import DataFrame
 
@@ -16,8 +17,10 @@ from chess3d.agents.planning.module import PlanningModule
 from chess3d.agents.science.module import ScienceModule
 from chess3d.agents.actions import *
 from chess3d.messages import *
+from chess3d.nodes.manager import BatchedClockConfig
+from chess3d.transport import ContextElement
 
-class SimulationAgent(Agent):
+class SimulationAgent(ContextElement, Agent):
     """
     # Abstract Simulation Agent
 
@@ -33,6 +36,9 @@ class SimulationAgent(Agent):
         - level (int): logging level
         - logger (logging.Logger): simulation logger 
     """
+    MESSAGE_GRACE_PERIOD = 1e-2         # maximum wall time [s] waited for messages still in flight from other agents
+    MESSAGE_GRACE_PERIOD_SHORT = 1e-3   # grace period [s] used when waiting on messages mid-simulation
+
     def __init__(   self, 
                     agent_name: str, 
                     results_path : str,
@@ -80,6 +86,7 @@ class SimulationAgent(Agent):
                         level, 
                         logger)
 
+        self.internal_modules : list = modules
         self.specs = specs
         if isinstance(self.specs, Spacecraft):
             self.payload = {instrument.name: instrument for instrument in self.specs.instrument}
@@ -90,10 +97,20 @@ class SimulationAgent(Agent):
 
 
         self.state_history : list = []
+
+        # wall time spent waiting for messages or clock updates vs working
+        self.t_start : float = None
+        self.t_wait : float = 0.0
         
         # setup results folder:
         self.results_path = os.path.join(results_path, self.get_element_name())
-    
+
+    def use_context(self, context) -> None:
+        # agent and its internal modules all create their sockets from the given context
+        super().use_context(context)
+        for module in self.internal_modules:
+            module.use_context(context)
+
     """
     --------------------
             SENSE       
@@ -102,6 +119,9 @@ class SimulationAgent(Agent):
 
     @runtime_tracker
     async def sense(self, statuses: list) -> list:
+        # start tracking wall time on the first sense-think-do cycle
+        if self.t_start is None: self.t_start = time.perf_counter()
+
         # initiate senses array
         senses = []
 
@@ -183,16 +203,41 @@ class SimulationAgent(Agent):
                     self.unsubscribe_to_broadcasts(resp_msg.target)
         return senses 
     
+    async def __wait_for_message(self, q : asyncio.Queue, timeout : float) -> tuple:
+        """ Waits for a message to arrive to a queue. Returns as soon as a message arrives or returns `None` once the timeout [s] passes. Wait time is tracked by the caller. """
+        receive = asyncio.create_task(q.get())
+
+        done, _ = await asyncio.wait([receive], timeout=timeout)
+        if receive in done: return receive.result()
+
+        # timeout reached; cancel message wait
+        receive.cancel()
+        try:
+            # message may have arrived while the wait was being cancelled
+            return await receive
+        except asyncio.CancelledError:
+            return None
+
     async def __empty_queue(self, q : asyncio.Queue) -> list:
         msgs = []
-        while not q.empty():
-            # save as senses to forward to planner
-            _, _, d = await q.get()
-            msgs.append(message_from_dict(**d))
+        if q.empty(): return msgs
 
-            # give other agents time to finish sending their messages
-            await asyncio.sleep(1e-2)
-        return msgs
+        while True:
+            # save all received messages as senses to forward to planner
+            while not q.empty():
+                _, _, d = q.get_nowait()
+                msgs.append(message_from_dict(**d))
+
+            # give other agents time to finish sending their messages; stop once no more messages arrive
+            t_0 = time.perf_counter()
+            try:
+                msg = await self.__wait_for_message(q, self.MESSAGE_GRACE_PERIOD)
+            finally:
+                self.t_wait += time.perf_counter() - t_0
+            if msg is None: return msgs
+
+            _, _, d = msg
+            msgs.append(message_from_dict(**d))
     
     @runtime_tracker
     async def get_environment_broadcasts(self) -> list:
@@ -349,7 +394,13 @@ class SimulationAgent(Agent):
     @runtime_tracker
     async def perform_wait_for_messages(self, action : WaitForMessages) -> str:
         """ Waits for a message from another agent to be received. """
-        
+        t_0 = time.perf_counter()
+        try:
+            return await self.__perform_wait_for_messages(action)
+        finally:
+            self.t_wait += time.perf_counter() - t_0
+
+    async def __perform_wait_for_messages(self, action : WaitForMessages) -> str:
         # get current start time
         t_curr = self.get_current_time()
         self.state.update_state(t_curr, status=SimulationAgentState.LISTENING)
@@ -362,13 +413,17 @@ class SimulationAgent(Agent):
         else: # no messages in inbox; wait for incoming messages
 
             # check type of simulation clock
-            if ((isinstance(self._clock_config, FixedTimesStepClockConfig) 
-                or isinstance(self._clock_config, EventDrivenClockConfig)) 
-                and self.external_inbox.empty()
+            if (isinstance(self._clock_config, FixedTimesStepClockConfig) 
+                or isinstance(self._clock_config, EventDrivenClockConfig)
                 ):
-                # give the agent time to finish processing messages before submitting a tic-request
-                t_wait = 1e-2 if t_curr < 1e-3 or action.t_end == np.Inf else 1e-3
-                await asyncio.sleep(t_wait)
+                # give other agents time to finish sending their messages before submitting a tic-request
+                t_wait = self.MESSAGE_GRACE_PERIOD if t_curr < 1e-3 or action.t_end == np.Inf else self.MESSAGE_GRACE_PERIOD_SHORT
+                msg = await self.__wait_for_message(self.external_inbox, t_wait)
+
+                if msg is not None:
+                    # restore message to inbox so it can be processed during `sense()`
+                    await self.external_inbox.put(msg)    
+                    return AgentAction.COMPLETED
 
             # initiate broadcast wait and timeout tasks
             receive_broadcast = asyncio.create_task(self.external_inbox.get())
@@ -440,7 +495,12 @@ class SimulationAgent(Agent):
 
             # wait for the designated duration of the measurmeent 
             dt = action.t_end - self.get_current_time()
-            if dt > 0: await self.sim_wait(dt) 
+            if dt > 0: 
+                t_0 = time.perf_counter()
+                try:
+                    await self.sim_wait(dt) 
+                finally:
+                    self.t_wait += time.perf_counter() - t_0
 
             # return action completion            
             return AgentAction.COMPLETED
@@ -469,7 +529,7 @@ class SimulationAgent(Agent):
 
         # log states
         n_decimals = 3
-        headers = ['t', 'x_pos', 'y_pos', 'z_pos', 'x_vel', 'y_vel', 'z_vel', 'attitude', 'status']
+        headers = ['t', 'x_pos', 'y_pos', 'z_pos', 'x_vel', 'y_vel', 'z_vel', 'attitude', 'status', 'eclipse']
         data = []
 
         for state_dict in self.state_history:
@@ -486,7 +546,8 @@ class SimulationAgent(Agent):
                             
                             np.round(state_dict['attitude'][0],n_decimals),
 
-                            state_dict['status']
+                            state_dict['status'],
+                            state_dict.get('eclipse', None)
                         ]
             data.append(line_data)
         
@@ -519,6 +580,17 @@ class SimulationAgent(Agent):
         self.log(f'\nAGENT RUN-TIME STATS\n{str(stats_df)}\n', level=logging.WARNING)
         stats_df.to_csv(f"{self.results_path}/agent_runtime_stats.csv", index=False)
 
+        # log time spent waiting for messages or clock updates vs working
+        t_total = time.perf_counter() - self.t_start if self.t_start is not None else 0.0
+        t_work = t_total - self.t_wait
+        wait_df = DataFrame([[np.round(t_total,n_decimals), 
+                              np.round(self.t_wait,n_decimals), 
+                              np.round(t_work,n_decimals), 
+                              np.round(self.t_wait / t_total,n_decimals) if t_total > 0.0 else 0.0]],
+                            columns=['t_total', 't_wait', 't_work', 'wait_fraction'])
+        self.log(f'\nAGENT WAIT STATS\n{str(wait_df)}\n', level=logging.WARNING)
+        wait_df.to_csv(f"{self.results_path}/agent_wait_stats.csv", index=False)
+
     async def sim_wait(self, delay: float) -> None:
         try:  
             if (
@@ -544,6 +616,28 @@ class SimulationAgent(Agent):
                 # wait for time update        
                 ignored = []   
 
+                if isinstance(self._clock_config, BatchedClockConfig):
+                    # register standing wake-up time
+                    tic_req = TicRequest(self.get_element_name(), t0, tf)
+                    toc_msg = None
+                    confirmation = await self._send_manager_msg(tic_req, zmq.PUB)
+                    self.log(f'wake-up time {tf}[s] registered! waiting on toc broadcasts...')
+
+                    # follow time updates until wake-up time is reached
+                    while self.get_current_time() < tf:
+                        dst, src, content = await self.manager_inbox.get()
+
+                        if content['msg_type'] == ManagerMessageTypes.TOC.value:
+                            # update clock
+                            toc_msg = TocMessage(**content)
+                            await self.update_current_time(toc_msg.t)
+                            self.log(f'toc received! time updated to: {self.get_current_time()}[s]')
+
+                        else:
+                            # ignore message
+                            self.log(f'some other manager message was received. ignoring...')
+                            ignored.append((dst, src, content))
+
                 while self.get_current_time() <= t0:
                     # send tic request
                     tic_req = TicRequest(self.get_element_name(), t0, tf)
@@ -573,7 +667,9 @@ class SimulationAgent(Agent):
         
         except asyncio.CancelledError as e:
             # if still waiting on  cancel request
-            if confirmation is not None and toc_msg is None:
+            if (confirmation is not None 
+                and (toc_msg is None 
+                     or (isinstance(self._clock_config, BatchedClockConfig) and self.get_current_time() < tf))):
                 tic_cancel = CancelTicRequest(self.get_element_name(), t0, tf)
                 await self._send_manager_msg(tic_cancel, zmq.PUB)
 
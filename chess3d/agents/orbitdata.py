@@ -1,14 +1,20 @@
 import copy
+import hashlib
 import json
 import os
 import random
 import re
+import shutil
 import time
+import weakref
 import pandas as pd
 import numpy as np
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta
+from orbitpy.contactfinder import ContactFinder
 from orbitpy.mission import Mission
+from orbitpy.util import Spacecraft
 
 class TimeInterval:
     def __init__(self, start, end):
@@ -40,7 +46,9 @@ class TimeInterval:
             raise ValueError("cannot merge two time intervals with no overlap")
 
         self.start = max(self.start, __other.start)
-        self.end = min(self.min, __other.min)
+        self.end = min(self.end, __other.end)
+
+        return self
 
     def extend(self, t: float) -> None:
         """ extends time interval """
@@ -86,6 +94,419 @@ class TimeInterval:
     def __hash__(self) -> int:
         return hash(str(self))
 
+class IntervalIndex:
+    """
+    Sorted array representation of a set of closed time intervals `[start, end]`.
+
+    Intervals are kept sorted by their start time along with a running maximum of their
+    end times, which allows membership and next-interval queries to be answered via 
+    binary search without requiring the intervals to be disjoint.
+    """
+    def __init__(self, starts, ends) -> None:
+        # sort intervals by start time; sorted inputs are kept as-is to avoid copying them
+        starts = np.asarray(starts, dtype=float)
+        ends = np.asarray(ends, dtype=float)
+        if len(starts) > 1 and np.any(starts[1:] < starts[:-1]):
+            order = np.argsort(starts, kind='stable')
+            starts, ends = starts[order], ends[order]
+
+        self.starts : np.ndarray = starts
+        self.ends : np.ndarray = ends
+
+        # running maximum of interval ends; monotonically increasing
+        self.max_ends : np.ndarray = np.maximum.accumulate(self.ends) if len(self.ends) > 0 else self.ends
+
+    def from_dataframe(data : pd.DataFrame, start_column : str = 'start index', end_column : str = 'end index') -> object:
+        """ creates an interval index from the start and end columns of a dataframe """
+        return IntervalIndex(data[start_column].values, data[end_column].values)
+
+    def contains(self, t : float) -> bool:
+        """ checks if `t` lies within any of the stored intervals """
+        # find last interval that starts at or before `t` 
+        k = np.searchsorted(self.starts, t, side='right')
+        
+        # check if any of the intervals starting before `t` ends after it
+        return bool(k > 0 and self.max_ends[k-1] >= t)
+
+    def contains_all(self, times : np.ndarray) -> np.ndarray:
+        """ checks which of the times in `times` lie within any of the stored intervals """
+        times = np.asarray(times, dtype=float)
+        if len(self.starts) == 0: return np.zeros(times.shape, dtype=bool)
+
+        # find last interval that starts at or before each time
+        k = np.searchsorted(self.starts, times, side='right')
+        return (k > 0) & (self.max_ends[np.maximum(k-1, 0)] >= times)
+
+    def next_interval(self, t : float, strict : bool = False) -> int:
+        """ 
+        Returns the index of the earliest-starting interval that ends at or after `t` 
+        (strictly after if `strict`). Returns `-1` if no such interval exists.
+        """
+        i = np.searchsorted(self.max_ends, t, side='right' if strict else 'left')
+        return int(i) if i < len(self.max_ends) else -1
+
+    def overlapping(self, t_start : float, t_end : float) -> np.ndarray:
+        """ Returns the indeces of the intervals that overlap with the interval `[t_start, t_end]` """
+        # find candidate intervals between the first one to end at or after `t_start` and the last one to start at or before `t_end`
+        i_start = np.searchsorted(self.max_ends, t_start, side='left')
+        i_end = np.searchsorted(self.starts, t_end, side='right')
+        candidates = np.arange(i_start, max(i_start, i_end))
+
+        # remove intervals that end before `t_start`
+        return candidates[self.ends[candidates] >= t_start]
+
+    def merge(self) -> object:
+        """ Returns an equivalent interval index in which all overlapping intervals have been merged """
+        if len(self.starts) == 0: return IntervalIndex([], [])
+
+        # an interval starts a new group if it starts after every preceding interval has ended
+        new_group = np.ones(len(self.starts), dtype=bool)
+        new_group[1:] = self.starts[1:] > self.max_ends[:-1]
+        
+        # each group spans from its first start to the latest end within it 
+        group_starts = np.flatnonzero(new_group)
+        group_ends = np.append(group_starts[1:], len(self.starts)) - 1
+        return IntervalIndex(self.starts[group_starts], self.max_ends[group_ends])
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+class ContactTimeline:
+    """
+    Sorted, merged access windows of every inter-satellite and ground station link of a scenario.
+
+    Windows are stored in time indeces and keyed by the unordered pair of agents involved in the link,
+    so both ends of a link share the same windows. Connectivity and next-window queries are answered 
+    via binary search. 
+    
+    Timelines are built once per orbit data directory and shared by every `OrbitData` object loaded 
+    from it; they must be treated as read-only. Cached timelines are released once no loaded orbit 
+    data uses them.
+    """
+    timelines = weakref.WeakValueDictionary()
+
+    def __init__(self, time_step : float, links : dict) -> None:
+        """
+        ### Arguments:
+            - time_step (`float`): propagation time-step [s]
+            - links (`dict`): list of interval indeces of the access windows of each link, keyed by the pair of agents involved
+        """
+        self.time_step : float = time_step
+        self.links : dict = {}
+
+        # merge windows reported by either end of each link
+        for (src, target), indeces in links.items():
+            self.links[self.__key(src, target)] \
+                = IntervalIndex(np.concatenate([index.starts for index in indeces]),
+                                np.concatenate([index.ends for index in indeces])).merge()
+
+    def __key(self, src : str, target : str) -> tuple:
+        return (src, target) if src <= target else (target, src)
+
+    def from_orbitdata(orbitdata : dict) -> object:
+        """ Compiles the contact timeline of a scenario from the orbit data of all of its agents """
+        links : dict = {}
+        time_step = None
+        for agent_name, agent_orbitdata in orbitdata.items():
+            agent_orbitdata : OrbitData
+            time_step = agent_orbitdata.time_step
+            
+            # collect inter-satellite links
+            for target, isl_data in agent_orbitdata.isl_data.items():
+                key = (agent_name, target) if agent_name <= target else (target, agent_name)
+                links.setdefault(key, []).append(IntervalIndex.from_dataframe(isl_data))
+
+            # collect ground station links
+            for gndStn_name, gndStn_data in agent_orbitdata.gs_access_data.groupby('gndStn name'):
+                key = (agent_name, gndStn_name) if agent_name <= gndStn_name else (gndStn_name, agent_name)
+                links.setdefault(key, []).append(IntervalIndex.from_dataframe(gndStn_data))
+
+        return ContactTimeline(time_step, links)
+    
+    def get_cache_key(orbitdata_dir : str) -> tuple:
+        """ Identifies the pre-computed data in an orbit data directory; changes whenever the data is re-computed """
+        return (os.path.abspath(orbitdata_dir), os.path.getmtime(os.path.join(orbitdata_dir, 'MissionSpecs.json')))
+
+    def load(orbitdata_dir : str) -> object:
+        """ Returns the contact timeline of the scenario in an orbit data directory. Compiled only the first time it is requested. """
+        key = ContactTimeline.get_cache_key(orbitdata_dir)
+        contacts : ContactTimeline = ContactTimeline.timelines.get(key, None)
+        if contacts is None:
+            # cached timelines are only kept while the orbit data using them is loaded
+            data : dict = OrbitData.from_directory(orbitdata_dir)
+            contacts = next(iter(data.values())).contacts if data else ContactTimeline.from_orbitdata(data)
+        return contacts
+
+    def get_windows(self, src : str, target : str) -> IntervalIndex:
+        """ Returns the merged access windows between two agents in time indeces """
+        return self.links.get(self.__key(src, target), None)
+
+    def has_link(self, src : str, target : str) -> bool:
+        return self.__key(src, target) in self.links
+
+    def is_connected(self, src : str, target : str, t : float) -> bool:
+        """ checks if two agents can communicate at time `t` [s] """
+        windows : IntervalIndex = self.get_windows(src, target)
+        return windows is not None and windows.contains(t / self.time_step)
+
+    def next_window(self, src : str, target : str, t : float) -> TimeInterval:
+        """ 
+        Returns the remainder of the current access window between two agents if they are connected at time `t` [s], 
+        or the next access window otherwise. Returns an infinite interval if none exists. 
+        """
+        windows : IntervalIndex = self.get_windows(src, target)
+        i = windows.next_interval(t / self.time_step) if windows is not None else -1
+
+        if i < 0:
+            return TimeInterval(np.Inf, np.Inf)
+        
+        t_start = max(t, windows.starts[i] * self.time_step)
+        t_end = windows.ends[i] * self.time_step
+        return TimeInterval(t_start, t_end)
+
+    def windows_between(self, src : str, target : str, t_start : float, t_end : float) -> list:
+        """ Returns all access windows between two agents that overlap with the interval `[t_start, t_end]` [s] """
+        windows : IntervalIndex = self.get_windows(src, target)
+        if windows is None: return []
+
+        return [TimeInterval(windows.starts[i] * self.time_step, windows.ends[i] * self.time_step)
+                for i in windows.overlapping(t_start / self.time_step, t_end / self.time_step)]
+
+class ConnectivityTimeline:
+    """
+    Sorted link up/down events of the links between every agent and the rest of the agents in a scenario.
+
+    Each agent has a cursor that is advanced through its own events as time moves forward, so only the links 
+    that changed status since the agent's cursor was last advanced are inspected. Links can either have a 
+    constant status or follow a set of access windows. 
+    
+    Cursors hold the state of a single simulation and are therefore not shared between simulations.
+    """
+    def __init__(self, time_step : float, links : dict) -> None:
+        """
+        ### Arguments:
+            - time_step (`float`): propagation time-step [s]
+            - links (`dict`): status of the links of each agent, indexed by agent and target name. 
+                Can be a `bool` if the status of a link is constant, or an `IntervalIndex` of its access windows in time indeces. 
+        """
+        self.time_step : float = time_step
+        self.initial : dict = {}
+        self.order : dict = {}
+        self.up_times : dict = {}
+        self.up_targets : dict = {}
+        self.down_times : dict = {}
+        self.down_targets : dict = {}
+
+        for src, targets in links.items():
+            targets : dict
+            self.initial[src] = {}
+            self.order[src] = {target : i for i, target in enumerate(targets)}
+            up_times, up_targets, down_times, down_targets = [], [], [], []
+
+            for target, status in targets.items():
+                if isinstance(status, IntervalIndex):
+                    # link is up from the start to the end of each of its disjoint access windows
+                    windows : IntervalIndex = status.merge()
+                    self.initial[src][target] = False
+                    up_times.append(windows.starts)
+                    up_targets.append(np.full(len(windows), target, dtype=object))
+                    down_times.append(windows.ends)
+                    down_targets.append(np.full(len(windows), target, dtype=object))
+                else:
+                    self.initial[src][target] = bool(status)
+
+            # sort events by time
+            for times, event_targets, times_dict, targets_dict in [(up_times, up_targets, self.up_times, self.up_targets), 
+                                                                   (down_times, down_targets, self.down_times, self.down_targets)]:
+                times = np.concatenate(times) if times else np.array([], dtype=float)
+                event_targets = np.concatenate(event_targets) if event_targets else np.array([], dtype=object)
+                order = np.argsort(times, kind='stable')
+                times_dict[src] = times[order]
+                targets_dict[src] = event_targets[order]
+
+        # initialize cursors
+        self.cursors : dict = {}
+        self.balances : dict = {}
+
+    def advance(self, src : str, t : float) -> list:
+        """
+        Advances an agent's cursor to time `t` [s]. 
+
+        ### Returns:
+            - transitions (`list`): name and connectivity status of every link of the agent that changed status since the cursor 
+                was last advanced. All of the agent's links are listed the first time its cursor is advanced.
+        """
+        t = t / self.time_step
+
+        # find events that occurred since the last update; windows are closed, so links go down right after they end
+        i_up, i_down = self.cursors.get(src, (0, 0))
+        j_up = max(i_up, int(np.searchsorted(self.up_times[src], t, side='right')))
+        j_down = max(i_down, int(np.searchsorted(self.down_times[src], t, side='left')))
+        self.cursors[src] = (j_up, j_down)
+
+        # count the number of up events not yet matched with a down event for each link
+        first_update = src not in self.balances
+        balances : dict = self.balances.setdefault(src, {})
+        previous = {target : balances.get(target, 0) for target in self.up_targets[src][i_up:j_up]}
+        previous.update({target : balances.get(target, 0) for target in self.down_targets[src][i_down:j_down]})
+
+        for target in self.up_targets[src][i_up:j_up]:
+            balances[target] = balances.get(target, 0) + 1
+        for target in self.down_targets[src][i_down:j_down]:
+            balances[target] -= 1
+
+        if first_update:
+            # report every link
+            return [(target, self.is_connected(src, target)) for target in self.order[src]]
+
+        # report links whose status changed
+        changed = [target for target, balance in previous.items() if (balance > 0) != (balances[target] > 0)]
+        changed.sort(key=self.order[src].get)
+        return [(target, self.is_connected(src, target)) for target in changed]
+
+    def is_connected(self, src : str, target : str) -> bool:
+        """ Checks if two agents were connected when the `src` agent's cursor was last advanced """
+        return self.initial[src][target] or self.balances.get(src, {}).get(target, 0) > 0
+
+class GroundPointIndex:
+    """
+    Spherical spatial index of a set of ground points used to answer nearest-point, radius, and tolerance queries.
+
+    Points are binned into a grid of latitude and longitude buckets. Queries only inspect the buckets overlapping 
+    the bounding box of the spherical cap being searched, so lookups on global grids only inspect a handful of points 
+    regardless of the size of the grid. Distances are measured as great-circle angles [deg].
+
+    Indeces are built once per orbit data directory and shared by every `OrbitData` object loaded from it; they must 
+    be treated as read-only. Cached indeces are released once no loaded orbit data uses them.
+    """
+    indeces = weakref.WeakValueDictionary()
+
+    POINTS_PER_BUCKET = 4       # target average number of points per bucket on a global grid
+    MIN_BUCKET_SIZE = 0.1       # [deg]
+    MAX_BUCKET_SIZE = 10.0      # [deg]
+    N_RINGS = 2                 # rings of buckets searched for an initial nearest-point estimate
+
+    def __init__(self, lats, lons, labels : list = None, bucket_size : float = None) -> None:
+        """
+        ### Arguments:
+            - lats (`array-like`): latitude of every point [deg]
+            - lons (`array-like`): longitude of every point [deg]
+            - labels (`list`): optional label of every point (e.g. its grid and ground point index)
+            - bucket_size (`float`): width of the latitude and longitude buckets [deg]. Sized to the number of points by default.
+        """
+        self.lats : np.ndarray = np.asarray(lats, dtype=float)
+        self.lons : np.ndarray = np.asarray(lons, dtype=float)
+        self.labels : list = list(labels) if labels is not None else None
+
+        # validate inputs
+        if self.lats.shape != self.lons.shape: raise ValueError('`lats` and `lons` must be of the same length.')
+        if self.labels is not None and len(self.labels) != len(self.lats): raise ValueError('`labels` must be of the same length as `lats`.')
+        if bucket_size is not None and bucket_size <= 0.0: raise ValueError(f'`bucket_size` must be a positive number. Is {bucket_size}.')
+
+        # size buckets to hold a few points each on a global grid
+        if bucket_size is None:
+            bucket_size = np.sqrt(self.POINTS_PER_BUCKET * 41253.0 / max(len(self.lats), 1))
+            bucket_size = float(np.clip(bucket_size, self.MIN_BUCKET_SIZE, self.MAX_BUCKET_SIZE))
+
+        # buckets must evenly divide the range of longitudes to wrap around the antimeridian
+        self.n_lon_buckets : int = int(np.ceil(360.0 / bucket_size))
+        self.bucket_size : float = 360.0 / self.n_lon_buckets
+        self.n_lat_buckets : int = int(np.ceil(180.0 / self.bucket_size))
+
+        # group points by bucket
+        keys = self.__lat_bucket(self.lats) * self.n_lon_buckets + self.__lon_bucket(self.lons)
+        order = np.argsort(keys, kind='stable')
+        unique_keys, i_starts = np.unique(keys[order], return_index=True)
+        self.buckets : dict = {divmod(int(key), self.n_lon_buckets) : positions
+                               for key, positions in zip(unique_keys, np.split(order, i_starts[1:]))}
+
+    def from_grid_data(grid_data : list) -> object:
+        """ Indexes the ground points of a list of grids. Points are labeled by their `(grid index, GP index)`. """
+        lats, lons, labels = [], [], []
+        for grid_datum in grid_data:
+            grid_datum : pd.DataFrame
+            lats.extend(grid_datum['lat [deg]'].values)
+            lons.extend(grid_datum['lon [deg]'].values)
+            labels.extend(zip(grid_datum['grid index'].values.astype(int).tolist(), 
+                              grid_datum['GP index'].values.astype(int).tolist()))
+        return GroundPointIndex(lats, lons, labels)
+
+    def __lat_bucket(self, lat):
+        return np.clip(np.floor((np.asarray(lat, dtype=float) + 90.0) / self.bucket_size), 0, self.n_lat_buckets - 1).astype(int)
+
+    def __lon_bucket(self, lon):
+        return np.clip(np.floor(np.mod(np.asarray(lon, dtype=float) + 180.0, 360.0) / self.bucket_size), 0, self.n_lon_buckets - 1).astype(int)
+
+    def angular_distance(lat_1, lon_1, lat_2, lon_2):
+        """ Calculates the great-circle angle [deg] between points on a sphere. Supports array broadcasting. """
+        lat_1, lon_1, lat_2, lon_2 = [np.radians(np.asarray(x, dtype=float)) for x in [lat_1, lon_1, lat_2, lon_2]]
+        a = np.sin((lat_2 - lat_1) / 2.0) ** 2 + np.cos(lat_1) * np.cos(lat_2) * np.sin((lon_2 - lon_1) / 2.0) ** 2
+        return np.degrees(2.0 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0))))
+
+    def __gather(self, lat_min : float, lat_max : float, lon : float, dlon : float) -> np.ndarray:
+        """ Returns the points in the buckets overlapping a latitude range and the longitude range `lon ± dlon` [deg] """
+        i_min, i_max = int(self.__lat_bucket(max(lat_min, -90.0))), int(self.__lat_bucket(min(lat_max, 90.0)))
+
+        j_min = int(np.floor((lon - dlon + 180.0) / self.bucket_size))
+        j_max = int(np.floor((lon + dlon + 180.0) / self.bucket_size))
+        if dlon >= 180.0 or j_max - j_min + 1 >= self.n_lon_buckets:
+            # search every longitude
+            js = range(self.n_lon_buckets)
+        else:
+            # search longitudes within range, wrapping around the antimeridian
+            js = {j % self.n_lon_buckets for j in range(j_min, j_max + 1)}
+
+        positions = [self.buckets[(i, j)] for i in range(i_min, i_max + 1) for j in js if (i, j) in self.buckets]
+        return np.sort(np.concatenate(positions)) if positions else np.array([], dtype=int)
+
+    def query_radius(self, lat : float, lon : float, radius : float) -> np.ndarray:
+        """ Returns the positions of all points within a great-circle angle `radius` [deg] of a given point, in ascending order """
+        # find bounding box of the spherical cap
+        if radius >= 90.0 or abs(lat) + radius >= 90.0:
+            dlon = 180.0
+        else:
+            dlon = np.degrees(np.arcsin(np.sin(np.radians(radius)) / np.cos(np.radians(lat))))
+
+        # check distance to candidate points
+        candidates = self.__gather(lat - radius, lat + radius, lon, dlon)
+        distances = GroundPointIndex.angular_distance(lat, lon, self.lats[candidates], self.lons[candidates])
+        return candidates[distances <= radius + 1e-9]
+
+    def query_box(self, lat : float, lon : float, tolerance : float) -> np.ndarray:
+        """ Returns the positions of all points whose latitude and longitude are within `tolerance` [deg] of a given point, in ascending order """
+        candidates = self.__gather(lat - tolerance, lat + tolerance, lon, tolerance)
+        dlon = np.abs(np.mod(self.lons[candidates] - lon + 180.0, 360.0) - 180.0)
+        return candidates[(np.abs(self.lats[candidates] - lat) <= tolerance) & (dlon <= tolerance)]
+
+    def nearest(self, lat : float, lon : float) -> int:
+        """ Returns the position of the point closest to a given point. Returns `-1` if the index is empty. """
+        if len(self.lats) == 0: return -1
+
+        # estimate nearest distance from the closest non-empty buckets
+        i_0, j_0 = int(self.__lat_bucket(lat)), int(self.__lon_bucket(lon))
+        candidates = []
+        for ring in range(self.N_RINGS + 1):
+            candidates = [self.buckets[(i, j % self.n_lon_buckets)]
+                          for i in range(i_0 - ring, i_0 + ring + 1)
+                          for j in range(j_0 - ring, j_0 + ring + 1)
+                          if max(abs(i - i_0), abs(j - j_0)) == ring
+                          and (i, j % self.n_lon_buckets) in self.buckets]
+            if candidates: break
+        candidates = np.concatenate(candidates) if candidates else np.arange(len(self.lats))
+        radius = np.min(GroundPointIndex.angular_distance(lat, lon, self.lats[candidates], self.lons[candidates]))
+
+        # search all points within the estimated distance
+        candidates = self.query_radius(lat, lon, radius)
+        distances = GroundPointIndex.angular_distance(lat, lon, self.lats[candidates], self.lons[candidates])
+        return int(candidates[np.argmin(distances)])
+
+    def nearest_all(self, lats, lons) -> np.ndarray:
+        """ Returns the position of the point closest to each of a list of points """
+        return np.array([self.nearest(lat, lon) for lat, lon in zip(lats, lons)], dtype=int)
+
+    def __len__(self) -> int:
+        return len(self.lats)
+
 class OrbitData:
     """
     Stores and queries data regarding an agent's orbital data. 
@@ -99,7 +520,9 @@ class OrbitData:
                  isl_data : dict,
                  gs_access_data : pd.DataFrame, 
                  gp_access_data : pd.DataFrame, 
-                 grid_data : list
+                 grid_data : list,
+                 indexed : bool = True,
+                 presorted : bool = False
                 ):
         # name of agent being represented by this object
         self.agent_name = agent_name
@@ -110,33 +533,90 @@ class OrbitData:
         self.epoc = time_data['epoc']
         self.duration = time_data['duration']
 
+        # sort tables by time; cached data is stored already sorted and is kept as-is to avoid copying memory-mapped arrays
+        if not presorted:
+            eclipse_data = eclipse_data.sort_values(by=['start index'])
+            position_data = position_data.sort_values(by=['time index'])
+            isl_data = { satellite_name : isl_data[satellite_name].sort_values(by=['start index']) 
+                         for satellite_name in isl_data.keys() }
+            gs_access_data = gs_access_data.sort_values(by=['start index'])
+            gp_access_data = gp_access_data.sort_values(by=['time index'])
+
         # agent position and eclipse information
-        self.eclipse_data = eclipse_data.sort_values(by=['start index'])
-        self.position_data = position_data.sort_values(by=['time index'])
+        self.eclipse_data : pd.DataFrame = eclipse_data
+        self.position_data : pd.DataFrame = position_data
 
         # inter-satellite communication access times
-        self.isl_data = { satellite_name : isl_data[satellite_name].sort_values(by=['start index']) 
-                         for satellite_name in isl_data.keys() }
+        self.isl_data : dict = isl_data
         
         # ground station access times
-        self.gs_access_data = gs_access_data.sort_values(by=['start index'])
+        self.gs_access_data : pd.DataFrame = gs_access_data
         
         # ground point access times
-        self.gp_access_data = gp_access_data.sort_values(by=['time index'])
+        self.gp_access_data : pd.DataFrame = gp_access_data
 
         # grid information
         self.grid_data = grid_data
+
+        # build array indeces for fast data queries
+        self.indexed = indexed
+        if self.indexed:
+            self._build_index()
+
+        # ground point access data partitioned by instrument; compiled on demand
+        self._gp_access_index = dict()
+
+        # ground point access data partitioned by target and instrument; compiled on demand
+        self._target_access_index : dict = None
+        self._target_points : GroundPointIndex = None
+
+        # contact timeline shared by all agents in the scenario; assigned when loaded from a directory
+        self.contacts : ContactTimeline = None
+
+        # spatial index of the ground points in the grid; shared by all agents when loaded from a directory
+        self.ground_points : GroundPointIndex = None
     
+    STATE_COLUMNS = ['x [km]', 'y [km]', 'z [km]', 'vx [km/s]', 'vy [km/s]', 'vz [km/s]']
+
+    def _build_index(self) -> None:
+        """ Compiles sorted numpy arrays used to answer state and access queries via binary search """
+        # eclipse intervals
+        self._eclipse_index = IntervalIndex.from_dataframe(self.eclipse_data)
+
+        # inter-satellite link intervals
+        self._isl_index = { target : IntervalIndex.from_dataframe(isl_data)
+                            for target, isl_data in self.isl_data.items() }
+
+        # ground station access intervals
+        self._gs_index = { gndStn_name : IntervalIndex.from_dataframe(gndStn_data)
+                           for gndStn_name, gndStn_data in self.gs_access_data.groupby('gndStn name') }
+
+        # cartesian states indexed by time; shares memory with tables stored as a single float block
+        self._position_times : np.ndarray = np.asarray(self.position_data['time index'].values, dtype=float)
+        i_states = self.position_data.columns.get_indexer(self.STATE_COLUMNS)
+        if np.all(np.diff(i_states) == 1):
+            states : np.ndarray = self.position_data.to_numpy(dtype=float, copy=False)
+            self._position_states : np.ndarray = states[:, i_states[0]:i_states[-1]+1]
+        else:
+            self._position_states : np.ndarray = self.position_data[self.STATE_COLUMNS].to_numpy(dtype=float)
+
     def copy(self) -> object:
-        return OrbitData(self.agent_name, 
-                         {'time step': self.time_step, 'epoc type' : self.epoc_type, 'epoc' : self.epoc},
+        orbitdata = OrbitData(self.agent_name, 
+                         {'time step': self.time_step, 'epoc type' : self.epoc_type, 'epoc' : self.epoc, 'duration' : self.duration},
                          self.eclipse_data,
                          self.position_data,
                          self.isl_data,
                          self.gs_access_data,
                          self.gp_access_data,
-                         self.grid_data
+                         self.grid_data,
+                         self.indexed,
+                         presorted=True
                          )
+        orbitdata.contacts = self.contacts
+        orbitdata.ground_points = self.ground_points
+        orbitdata._target_access_index = self._target_access_index
+        orbitdata._target_points = self._target_points
+        return orbitdata
     
     """
     GET NEXT methods
@@ -150,7 +630,22 @@ class OrbitData:
             raise ValueError(f'{src} cannot access {target}.')
 
     def get_next_isl_access_interval(self, target : str, t : float) -> TimeInterval:
+        if self.indexed and self.contacts is not None:
+            return self.contacts.next_window(self.agent_name, target, t)
+
         t = t/self.time_step
+
+        if self.indexed:
+            isl_index : IntervalIndex = self._isl_index[target]
+            i = isl_index.next_interval(t)
+
+            if i < 0:
+                return TimeInterval(np.Inf, np.Inf)
+            
+            t_start = max(t, isl_index.starts[i]) * self.time_step
+            t_end = isl_index.ends[i] * self.time_step
+            return TimeInterval(t_start, t_end)
+
         isl_data : pd.DataFrame = self.isl_data[target]
         isl_access : pd.DataFrame = isl_data.query('@t <= `end index`').sort_values('start index')
         
@@ -163,10 +658,15 @@ class OrbitData:
         return TimeInterval(np.Inf, np.Inf)
 
     def get_next_gs_access(self, t):
+        """ Returns the earliest time at or after `t` [s] in which this agent can access any ground station """
+        if self.indexed and self.contacts is not None:
+            return min([self.contacts.next_window(self.agent_name, gndStn_name, t).start
+                        for gndStn_name in self._gs_index], default=np.Inf)
+
         t = t/self.time_step
-        accesses = self.gp_access_data.query('`time index` >= @t').sort_values(by='time index')        
+        accesses = self.gs_access_data.query('@t <= `end index`').sort_values(by='start index')
         for _, row in accesses.iterrows():
-            return row['time index'] * self.time_step
+            return max(t, row['start index']) * self.time_step
         return np.Inf
 
     def get_next_gp_access_interval(self, lat: float, lon: float, t: float):
@@ -186,6 +686,16 @@ class OrbitData:
         return interval, instruments, modes
 
     def get_next_eclipse_interval(self, t: float):
+        if self.indexed:
+            i = self._eclipse_index.next_interval(t / self.time_step, strict=True)
+            
+            if i < 0:
+                return np.Infinity
+            
+            t_start = self._eclipse_index.starts[i] * self.time_step
+            t_end = self._eclipse_index.ends[i] * self.time_step
+            return t_start if t < t_start else t_end
+
         for _, row in self.eclipse_data.iterrows():
             t_start = row['start index'] * self.time_step
             t_end = row['end index'] * self.time_step
@@ -197,6 +707,144 @@ class OrbitData:
                 return t_end
         return np.Infinity
 
+    """
+    GROUND POINT ACCESS methods
+    """
+    GP_ACCESS_FLOAT_COLUMNS = ['time index', 'look angle [deg]']   # columns searched or compared numerically by access queries
+
+    def get_gp_access_index(self, instrument : str) -> dict:
+        """
+        Returns the ground point access data of a given instrument as a dictionary of column arrays,
+        all sorted by `time index`. Partitions are compiled the first time they are requested.
+        """
+        if instrument not in self._gp_access_index:
+            # select accesses performed by this instrument; keeps time-sorted order
+            matches : np.ndarray = self.gp_access_data['instrument'].values == instrument
+            instrument_data : pd.DataFrame = self.gp_access_data if matches.all() else self.gp_access_data[matches]
+
+            # store as contiguous column arrays; avoids copying columns that are already contiguous
+            self._gp_access_index[instrument] = OrbitData._index_gp_access_columns(
+                                                    {column : np.ascontiguousarray(instrument_data[column].values)
+                                                     for column in instrument_data.columns})
+
+        return self._gp_access_index[instrument]
+
+    def _index_gp_access_columns(columns : dict) -> dict:
+        """ Casts the numerically queried columns of a set of ground point access column arrays to `float` once, so queries do not need to """
+        for column in OrbitData.GP_ACCESS_FLOAT_COLUMNS:
+            columns[column] = columns[column].astype(float, copy=False)
+        return columns
+
+    TARGET_TOLERANCE = 1e-3     # maximum difference in latitude and longitude [deg] between matching targets
+
+    def get_target_access_index(self) -> dict:
+        """
+        Returns the ground point access data partitioned by target and instrument as a dictionary keyed by
+        `(grid index, GP index, instrument)`. Each entry contains the access times [s] and look angles [deg]
+        of a target sorted in ascending order. The index is compiled the first time it is requested.
+        """
+        if self._target_access_index is None:
+            # sort accesses by time and look angle
+            data : pd.DataFrame = self.gp_access_data
+            times : np.ndarray = data['time index'].values * self.time_step
+            look_angles : np.ndarray = data['look angle [deg]'].values.astype(float)
+            order = np.lexsort((look_angles, times))
+
+            # partition accesses by target and instrument
+            self._target_access_index = dict()
+            for key, rows in data.iloc[order].groupby(['grid index', 'GP index', 'instrument'], sort=False).indices.items():
+                self._target_access_index[key] = {'time [s]' : np.ascontiguousarray(times[order][rows]),
+                                                  'look angle [deg]' : np.ascontiguousarray(look_angles[order][rows])}
+
+            # index target coordinates
+            targets = data[['lat [deg]', 'lon [deg]', 'grid index', 'GP index']].drop_duplicates(['grid index', 'GP index'])
+            self._target_points = GroundPointIndex(targets['lat [deg]'].values, 
+                                                   targets['lon [deg]'].values,
+                                                   list(zip(targets['grid index'].values, targets['GP index'].values)))
+
+        return self._target_access_index
+
+    def find_targets(self, lat : float, lon : float) -> list:
+        """ Returns the `(grid index, GP index)` of the accessible targets within the matching tolerance of a given latitude and longitude [deg] """
+        self.get_target_access_index()
+        return [self._target_points.labels[i] for i in self._target_points.query_box(lat, lon, self.TARGET_TOLERANCE)]
+
+    def get_ground_point_index(self) -> GroundPointIndex:
+        """ Returns the spatial index of the ground points in the grid. Compiled the first time it is requested if not shared. """
+        if self.ground_points is None:
+            self.ground_points = GroundPointIndex.from_grid_data(self.grid_data)
+        return self.ground_points
+
+    def find_gp_index(self, lat: float, lon: float) -> tuple:
+        """
+        Returns the grid index, ground point index, latitude, and longitude [deg] of the ground point closest to 
+        a given latitude and longitude [deg]
+        """
+        ground_points : GroundPointIndex = self.get_ground_point_index()
+        i = ground_points.nearest(lat, lon)
+        if i < 0: return -1, -1, -1, -1
+
+        grid_index, gp_index = ground_points.labels[i]
+        return grid_index, gp_index, ground_points.lats[i], ground_points.lons[i]
+
+    def get_target_accesses(self, lat : float, lon : float, instrument : str, t_start : float, t_end : float) -> tuple:
+        """
+        Returns the times [s] and look angles [deg] at which an instrument can access a target located at a given
+        latitude and longitude [deg] between `t_start` and `t_end` [s], inclusive. Accesses are sorted by time.
+        """
+        access_index : dict = self.get_target_access_index()
+
+        times, look_angles = [], []
+        for grid_index, gp_index in self.find_targets(lat, lon):
+            target_accesses : dict = access_index.get((grid_index, gp_index, instrument), None)
+            if target_accesses is None: continue
+
+            # find bounds of the time window via binary search
+            target_times : np.ndarray = target_accesses['time [s]']
+            i_start = np.searchsorted(target_times, t_start, side='left')
+            i_end = np.searchsorted(target_times, t_end, side='right')
+
+            times.append(target_times[i_start:i_end])
+            look_angles.append(target_accesses['look angle [deg]'][i_start:i_end])
+
+        if not times: return np.array([]), np.array([])
+        if len(times) == 1: return times[0], look_angles[0]
+
+        # merge accesses of targets sharing the same coordinates
+        times, look_angles = np.concatenate(times), np.concatenate(look_angles)
+        order = np.lexsort((look_angles, times))
+        return times[order], look_angles[order]
+
+    """
+    EVENT TIME methods
+    """
+    def get_event_times(self) -> np.ndarray:
+        """
+        Returns the sorted times [s] at which this agent's eclipse status, connectivity, or ground point accesses may change.
+        Includes the start and the first time-step after the end of every eclipse, inter-satellite link, and ground 
+        station access interval, as well as the start of every ground point access window.
+        """
+        # collect interval boundaries in time indeces
+        interval_data = [self.eclipse_data, self.gs_access_data, *self.isl_data.values()]
+        boundaries = [np.concatenate([data['start index'].values, data['end index'].values + 1])
+                      for data in interval_data if not data.empty]
+
+        # collect the start of every ground point access window in time indeces
+        if not self.gp_access_data.empty:
+            keys = ['grid index', 'GP index', 'instrument']
+            accesses = self.gp_access_data[[*keys, 'time index']].drop_duplicates().sort_values(by=[*keys, 'time index'])
+            access_times = accesses['time index'].values.astype(float)
+
+            # a window starts when its ground point was not accessed by the same instrument in the previous time-step
+            same_target = np.all([accesses[key].values[1:] == accesses[key].values[:-1] for key in keys], axis=0)
+            is_start = np.ones(len(access_times), dtype=bool)
+            is_start[1:] = ~same_target | (access_times[1:] - access_times[:-1] > 1)
+            boundaries.append(access_times[is_start])
+
+        # convert to seconds
+        if not boundaries: return np.array([], dtype=float)
+        return np.unique(np.concatenate(boundaries).astype(float)) * self.time_step
+
     """
     STATE QUERY methods
     """
@@ -207,12 +855,25 @@ class OrbitData:
         if target not in self.isl_data.keys():
             return False 
 
+        if self.indexed and self.contacts is not None:
+            return self.contacts.is_connected(self.agent_name, target, t)
+
         t = t/self.time_step
 
+        if self.indexed:
+            return self._isl_index[target].contains(t)
+
         return any([t_start <= t <= t_end for t_start,t_end in self.isl_data[target].values])
 
     def is_accessing_ground_station(self, target : str, t: float) -> bool:
+        if self.indexed and self.contacts is not None:
+            return self.contacts.is_connected(self.agent_name, target, t)
+
         t = t/self.time_step
+
+        if self.indexed:
+            return target in self._gs_index and self._gs_index[target].contains(t)
+
         nrows, _ = self.gs_access_data.query('`start index` <= @t & @t <= `end index` & `gndStn name` == @target').shape
         return bool(nrows > 0)
 
@@ -237,6 +898,9 @@ class OrbitData:
         """ checks if a satellite is currently in eclise at time `t`. """
         t_e = t / self.time_step
 
+        if self.indexed:
+            return self._eclipse_index.contains(t_e)
+
         return any([t_start <= t_e <= t_end for t_start,t_end in self.eclipse_data.values])
 
     def get_position(self, t: float):
@@ -247,6 +911,62 @@ class OrbitData:
         _, vel, _ = self.get_orbit_state(t)
         return vel
         
+    def covers(self, t : float) -> bool:
+        """ checks if time `t` [s] lies within the span of the pre-computed orbit states """
+        times : np.ndarray = self._position_times if self.indexed \
+                                else self.position_data['time index'].values
+        return len(times) > 0 and times[0] * self.time_step <= t <= times[-1] * self.time_step
+
+    def interpolate_orbit_states(self, times : list) -> tuple:
+        """
+        Interpolates the pre-computed cartesian states of the agent at the given times 
+        using cubic Hermite interpolation between the two nearest propagated states.
+
+        ### Arguments:
+            - times (`list`): times [s] to interpolate at. Must lie within the span of the pre-computed data.
+
+        ### Returns:
+            - pos (`np.ndarray`): `(n,3)` array of positions [km]
+            - vel (`np.ndarray`): `(n,3)` array of velocities [km/s]
+            - eclipse (`np.ndarray`): `(n,)` array of eclipse flags
+        """
+        # get propagated states
+        if self.indexed:
+            state_times, states = self._position_times, self._position_states
+        else:
+            state_times = self.position_data['time index'].values.astype(float)
+            states = self.position_data[['x [km]', 'y [km]', 'z [km]', 
+                                         'vx [km/s]', 'vy [km/s]', 'vz [km/s]']].values.astype(float)
+
+        # find interval containing each time
+        t = np.asarray(times, dtype=float) / self.time_step
+        if np.any(t < state_times[0]) or np.any(t > state_times[-1]):
+            raise ValueError(f'Cannot interpolate orbit states of `{self.agent_name}` outside of the pre-computed time span.')
+        i = np.clip(np.searchsorted(state_times, t, side='right') - 1, 0, max(len(state_times) - 2, 0))
+        j = np.minimum(i + 1, len(state_times) - 1)
+
+        # normalize time within each interval
+        h = (state_times[j] - state_times[i]) * self.time_step
+        s = np.divide((t - state_times[i]) * self.time_step, h, out=np.zeros_like(t), where=h > 0)[:,np.newaxis]
+        h = h[:,np.newaxis]
+
+        # evaluate hermite basis functions and their derivatives
+        h00, h10, h01, h11 = 2*s**3 - 3*s**2 + 1, s**3 - 2*s**2 + s, -2*s**3 + 3*s**2, s**3 - s**2
+        dh00, dh10, dh01, dh11 = 6*s**2 - 6*s, 3*s**2 - 4*s + 1, -6*s**2 + 6*s, 3*s**2 - 2*s
+
+        # interpolate position and velocity
+        p0, v0, p1, v1 = states[i,:3], states[i,3:], states[j,:3], states[j,3:]
+        pos = h00*p0 + h10*h*v0 + h01*p1 + h11*h*v1
+        vel = np.divide(dh00*p0 + dh10*h*v0 + dh01*p1 + dh11*h*v1, h, out=v0.copy(), where=h > 0)
+
+        # check eclipse status
+        if self.indexed:
+            eclipse = self._eclipse_index.contains_all(t)
+        else:
+            eclipse = np.array([self.is_eclipse(t_i) for t_i in times], dtype=bool)
+
+        return pos, vel, eclipse
+
     def get_orbit_state(self, t: float):
         is_eclipse = self.is_eclipse(t)
 
@@ -254,6 +974,15 @@ class OrbitData:
         t_u = t + 0.5
         t_l = t - 0.5
 
+        if self.indexed:
+            # find first propagated state within half a time-step of `t`
+            i = np.searchsorted(self._position_times, t_l, side='right')
+            if i >= len(self._position_times) or self._position_times[i] > t_u:
+                raise ValueError(f'No orbit state available for `{self.agent_name}` at t={t*self.time_step}[s].')
+
+            x,y,z,vx,vy,vz = self._position_states[i]
+            return ([x, y, z], [vx, vy, vz], is_eclipse)
+
         data = [(t_i,x,y,z,vx,vy,vz) 
                 for t_i,x,y,z,vx,vy,vz in self.position_data.values
                 if t_l < t_i <= t_u]
@@ -343,61 +1072,26 @@ class OrbitData:
         
     #     x = 1
     
-    # def find_gp_index(self, lat: float, lon: float) -> tuple:
-    #     """
-    #     Returns the ground point and grid index to the point closest to the latitude and longitude given.
-
-    #     lat, lon must be given in degrees
-    #     """
-    #     grid_compiled = None
-    #     for grid in self.grid_data:
-    #         grid : pd.DataFrame
-        
-    #         perfect_match = grid.query('`lat [deg]` == @lat & `lon [deg]` == @lon')
-    #         for _, row in perfect_match.iterrows():
-    #             grid_index = row['grid index']
-    #             gp_index = row['GP index']
-    #             gp_lat = row['lat [deg]']
-    #             gp_lon = row['lon [deg]']
-
-    #             return grid_index, gp_index, gp_lat, gp_lon
-            
-    #         if grid_compiled is None:
-    #             grid_compiled = grid
-    #         else:
-    #             grid_compiled = pd.concat([grid_compiled, grid])
-            
-    #     grid_compiled['dr'] = np.sqrt( 
-    #                                     np.power(np.cos( grid_compiled['lat [deg]'] * np.pi / 360 ) * np.cos( grid_compiled['lon [deg]'] * np.pi / 360 ) \
-    #                                             - np.cos( lat * np.pi / 360 ) * np.cos( lon * np.pi / 360 ), 2) \
-    #                                     + np.power(np.cos( grid_compiled['lat [deg]'] * np.pi / 360 ) * np.sin( grid_compiled['lon [deg]'] * np.pi / 360 ) \
-    #                                             - np.cos( lat * np.pi / 360 ) * np.sin( lon * np.pi / 360 ), 2) \
-    #                                     + np.power(np.sin( grid_compiled['lat [deg]'] * np.pi / 360 ) \
-    #                                             - np.sin( lat * np.pi / 360 ), 2)
-    #                                 )
-    #     min_dist = grid_compiled['dr'].min()
-    #     min_rows = grid_compiled.query('dr == @min_dist')
-
-    #     for _, row in min_rows.iterrows():
-    #         grid_index = row['grid index']
-    #         gp_index = row['GP index']
-    #         gp_lat = row['lat [deg]']
-    #         gp_lon = row['lon [deg]']
-
-    #         return grid_index, gp_index, gp_lat, gp_lon
-
-    #     return -1, -1, -1, -1
-
     """
     LOAD FROM PRE-COMPUTED DATA
     """
-    def load(orbitdata_path : str, agent_name : str) -> object:
+    def load(orbitdata_path : str, agent_name : str, use_cache : bool = True) -> object:
         """
-        Loads agent orbit data from pre-computed csv files in scenario directory
+        Loads agent orbit data from pre-computed data in scenario directory. 
+        
+        If a compiled binary cache matching the current mission specifications exists, data 
+        is memory-mapped from it. Otherwise, it is parsed from the pre-computed csv files.
         """
         with open(os.path.join(orbitdata_path, 'MissionSpecs.json'), 'r') as mission_specs:
             # load json file as dictionary
             mission_dict : dict = json.load(mission_specs)
+
+            # check if data can be loaded from binary cache
+            if use_cache:
+                manifest : dict = OrbitData._load_cache_manifest(orbitdata_path, mission_dict)
+                if manifest is not None and agent_name in manifest['agents']:
+                    return OrbitData._load_from_cache(orbitdata_path, manifest['agents'][agent_name])
+
             spacecraft_list : list = mission_dict.get('spacecraft', None)
             ground_station_list = mission_dict.get('groundStation', None)
             
@@ -589,6 +1283,160 @@ class OrbitData:
                 return OrbitData(name, time_data, eclipse_data, position_data, isl_data, gs_access_data, gp_access_data, grid_data_compiled)
 
     
+    """
+    BINARY CACHE
+    """
+    CACHE_DIR = 'cache'
+    CACHE_MANIFEST = 'manifest.json'
+    CACHE_VERSION = 2
+    CACHE_FLOAT_COLUMNS = ['time index', 'start index', 'end index']
+
+    def _hash_specs(mission_dict : dict) -> str:
+        """ returns a hash of the mission specifications used to generate a set of pre-computed data """
+        return hashlib.sha256(json.dumps(mission_dict, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def _load_cache_manifest(orbitdata_path : str, mission_dict : dict) -> dict:
+        """ 
+        Returns the manifest of the binary cache in the orbit data directory. 
+        Returns `None` if no cache exists or if it was generated for a different set of mission specifications.
+        """
+        manifest_path = os.path.join(orbitdata_path, OrbitData.CACHE_DIR, OrbitData.CACHE_MANIFEST)
+        if not os.path.exists(manifest_path):
+            return None
+        
+        with open(manifest_path, 'r') as manifest_file:
+            manifest : dict = json.load(manifest_file)
+
+        if (manifest.get('hash', None) != OrbitData._hash_specs(mission_dict)
+            or manifest.get('version', None) != OrbitData.CACHE_VERSION):
+            return None
+        
+        return manifest
+
+    def _write_cache(orbitdata_path : str) -> None:
+        """ 
+        Compiles the pre-computed csv data of every spacecraft in the orbit data directory into a 
+        set of `.npy` files that can be memory-mapped when loading.
+
+        Tables are written sorted and in the dtypes used by the query indeces, so loaded agents can 
+        use the memory-mapped arrays directly. Fully numeric tables are stored as a single float block.
+        """
+        with open(os.path.join(orbitdata_path, 'MissionSpecs.json'), 'r') as mission_specs:
+            mission_dict : dict = json.load(mission_specs)
+
+        # check if an up-to-date cache already exists
+        if OrbitData._load_cache_manifest(orbitdata_path, mission_dict) is not None:
+            return
+        
+        # create cache directory
+        cache_path = os.path.join(orbitdata_path, OrbitData.CACHE_DIR)
+        if not os.path.exists(cache_path):
+            os.mkdir(cache_path)
+        
+        # clear any outdated manifest
+        manifest_path = os.path.join(cache_path, OrbitData.CACHE_MANIFEST)
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+
+        def write_table(prefix : str, table : pd.DataFrame) -> dict:
+            """ saves a numeric table as a single float block, or each column of a mixed table as a separate array file """
+            columns = []
+            values_list = []
+            for column in table.columns:
+                values : np.ndarray = table[column].values
+
+                # convert generic objects to numeric or fixed-width string arrays
+                if values.dtype == object:
+                    try:
+                        values = values.astype(float)
+                    except (ValueError, TypeError):
+                        values = values.astype(str)
+
+                # store time columns as floats, as used by the query indeces
+                if column in OrbitData.CACHE_FLOAT_COLUMNS and values.dtype.kind in 'iuf':
+                    values = values.astype(float)
+                
+                values_list.append(values)
+
+            if table.columns.size > 0 and all(values.dtype.kind == 'f' for values in values_list):
+                # save as a single block
+                file_name = f'{prefix}.npy'
+                block = np.column_stack(values_list) if len(table) > 0 else np.zeros((0, len(values_list)), dtype=float)
+                np.save(os.path.join(cache_path, file_name), block, allow_pickle=False)
+                return {'columns' : list(table.columns), 'block' : file_name}
+
+            for i_col, (column, values) in enumerate(zip(table.columns, values_list)):
+                file_name = f'{prefix}_{i_col}.npy'
+                np.save(os.path.join(cache_path, file_name), values, allow_pickle=False)
+                columns.append([column, file_name])
+            
+            return {'columns' : columns}
+
+        # compile each agent's data
+        manifest = {'hash' : OrbitData._hash_specs(mission_dict), 'version' : OrbitData.CACHE_VERSION, 'agents' : dict()}
+        for i_sat, spacecraft in enumerate(mission_dict.get('spacecraft', [])):
+            agent_name = spacecraft.get('name')
+            orbitdata : OrbitData = OrbitData.load(orbitdata_path, agent_name, use_cache=False)
+            prefix = f'sat{i_sat}'
+
+            manifest['agents'][agent_name] = {
+                'agent name' : agent_name,
+                'time data' : {'epoc' : orbitdata.epoc, 
+                               'epoc type' : orbitdata.epoc_type, 
+                               'time step' : orbitdata.time_step,
+                               'duration' : orbitdata.duration},
+                'eclipse data' : write_table(f'{prefix}_eclipse', orbitdata.eclipse_data),
+                'position data' : write_table(f'{prefix}_position', orbitdata.position_data),
+                'isl data' : {target : write_table(f'{prefix}_isl{i_target}', isl_data)
+                              for i_target, (target, isl_data) in enumerate(orbitdata.isl_data.items())},
+                'gs access data' : write_table(f'{prefix}_gs', orbitdata.gs_access_data),
+                'gp access data' : write_table(f'{prefix}_gp', orbitdata.gp_access_data),
+                'gp access partitions' : {instrument : write_table(f'{prefix}_gp{i_ins}', instrument_data)
+                                          for i_ins, (instrument, instrument_data) 
+                                          in enumerate(orbitdata.gp_access_data.groupby('instrument', sort=False))}
+                                          if orbitdata.gp_access_data['instrument'].nunique() > 1 else dict(),
+                'grid data' : [write_table(f'{prefix}_grid{i_grid}', grid_data) 
+                               for i_grid, grid_data in enumerate(orbitdata.grid_data)]
+            }
+
+        # write manifest last so that partially written caches are never used
+        with open(manifest_path, 'w') as manifest_file:
+            manifest_file.write(json.dumps(manifest, indent=4))
+
+    def _load_from_cache(orbitdata_path : str, agent_manifest : dict) -> object:
+        """ Loads an agent's orbit data by memory-mapping its cached binary data """
+        cache_path = os.path.join(orbitdata_path, OrbitData.CACHE_DIR)
+
+        def read_table(table_manifest : dict) -> pd.DataFrame:
+            """ memory-maps a table without copying it into memory """
+            if 'block' in table_manifest:
+                block = np.load(os.path.join(cache_path, table_manifest['block']), mmap_mode='r', allow_pickle=False)
+                return pd.DataFrame(block, columns=table_manifest['columns'], copy=False)
+
+            data = {column : np.load(os.path.join(cache_path, file_name), mmap_mode='r', allow_pickle=False)
+                    for column, file_name in table_manifest['columns']}
+            return pd.DataFrame(data, copy=False)
+        
+        orbitdata = OrbitData(agent_manifest['agent name'],
+                         agent_manifest['time data'],
+                         read_table(agent_manifest['eclipse data']),
+                         read_table(agent_manifest['position data']),
+                         {target : read_table(isl_manifest) 
+                          for target, isl_manifest in agent_manifest['isl data'].items()},
+                         read_table(agent_manifest['gs access data']),
+                         read_table(agent_manifest['gp access data']),
+                         [read_table(grid_manifest) for grid_manifest in agent_manifest['grid data']],
+                         presorted=True
+                         )
+        
+        # use time-sorted partitions of ground point accesses of each instrument 
+        for instrument, partition_manifest in agent_manifest['gp access partitions'].items():
+            partition : pd.DataFrame = read_table(partition_manifest)
+            orbitdata._gp_access_index[instrument] = OrbitData._index_gp_access_columns(
+                                                        {column : partition[column].values for column in partition.columns})
+
+        return orbitdata
+    
     def from_directory(orbitdata_dir: str):
         """
         Loads orbit data from a directory containig a json file specifying the details of the mission being simulated.
@@ -622,11 +1470,39 @@ class OrbitData:
             if ground_station_list:
                 raise NotImplementedError('Orbitdata for ground stations not yet supported')
 
+            # compile contact timeline shared by all agents; reuse if previously compiled
+            key = ContactTimeline.get_cache_key(orbitdata_dir)
+            contacts : ContactTimeline = ContactTimeline.timelines.get(key, None)
+            if contacts is None:
+                contacts = ContactTimeline.from_orbitdata(data)
+                ContactTimeline.timelines[key] = contacts
+            for agent_orbitdata in data.values(): 
+                agent_orbitdata.contacts = contacts
+
+            # index ground points shared by all agents; reuse if previously compiled
+            ground_points : GroundPointIndex = GroundPointIndex.indeces.get(key, None)
+            if data and ground_points is None:
+                ground_points = GroundPointIndex.from_grid_data(next(iter(data.values())).grid_data)
+                GroundPointIndex.indeces[key] = ground_points
+            for agent_orbitdata in data.values(): 
+                agent_orbitdata.ground_points = ground_points
+
             return data
                
+    """
+    PRECOMPUTATION
+    """
+    PRECOMPUTE_MANIFEST = 'precompute_manifest.json'
+    PRECOMPUTE_DIR = 'precompute'
+    NON_ORBITAL_KEYS = ['planner', 'science', 'notifier', 'missionProfile']
+
     def precompute(scenario_specs : dict) -> str:
         """
         Pre-calculates coverage and position data for a given scenario
+
+        The inputs of every satellite and of every pair of satellites are hashed separately, so only the 
+        satellite and inter-satellite link data invalidated by changes to the scenario are recomputed. 
+        Independent propagation, coverage, and contact jobs are run across a pool of processes.
         """
         
         # get desired orbit data path
@@ -634,8 +1510,10 @@ class OrbitData:
         settings_dict : dict = scenario_specs.get('settings', None)
         if settings_dict is None:
             data_dir = None
+            n_processes = None
         else:
             data_dir = settings_dict.get('outDir', None)
+            n_processes = settings_dict.get('precomputeProcesses', None)
 
         if data_dir is None:
             data_dir = os.path.join(scenario_dir, 'orbit_data')
@@ -657,21 +1535,32 @@ class OrbitData:
             else:
                 print('Orbit data not found.')
 
-            # clear files if they exist
-            print('Clearing \'orbitdata\' directory...')    
-            if os.path.exists(data_dir):
-                for f in os.listdir(data_dir):
-                    f_dir = os.path.join(data_dir, f)
-                    if os.path.isdir(f_dir):
-                        for h in os.listdir(f_dir):
-                            os.remove(os.path.join(f_dir, h))
-                        os.rmdir(f_dir)
-                    else:
-                        os.remove(f_dir) 
-            print('\'orbitdata\' cleared!')
+            # hash the inputs of every satellite and pair of satellites
+            manifest : dict = OrbitData._hash_precompute_inputs(scenario_specs)
+            previous_manifest : dict = OrbitData._load_precompute_manifest(data_dir)
+
+            if (previous_manifest is None 
+                or not manifest['incremental']
+                or previous_manifest['common'] != manifest['common']):
+                # inputs shared by all satellites changed; clear files if they exist
+                previous_manifest = None
+                print('Clearing \'orbitdata\' directory...')    
+                if os.path.exists(data_dir):
+                    for f in os.listdir(data_dir):
+                        f_dir = os.path.join(data_dir, f)
+                        if os.path.isdir(f_dir):
+                            shutil.rmtree(f_dir)
+                        else:
+                            os.remove(f_dir) 
+                print('\'orbitdata\' cleared!')
 
             # set grid 
             grid_dicts : list = scenario_specs.get("grid", None)
+            if previous_manifest is not None:
+                # reuse the grids used to generate the existing data
+                with open(os.path.join(data_dir,'MissionSpecs.json'), 'r') as mission_specs:
+                    grid_dicts = json.load(mission_specs)['grid']
+            
             for grid_dict in grid_dicts:
                 grid_dict : dict
                 if grid_dict is not None:
@@ -719,16 +1608,209 @@ class OrbitData:
 
             # propagate data and save to orbit data directory
             print("Propagating orbits...")
-            mission : Mission = Mission.from_json(scenario_specs)  
-            mission.execute()                
+            manifest_path = os.path.join(data_dir, OrbitData.PRECOMPUTE_MANIFEST)
+            if os.path.exists(manifest_path):
+                os.remove(manifest_path)
+
+            if manifest['incremental']:
+                # only propagate satellites and links whose inputs changed
+                OrbitData._propagate_incremental(scenario_specs, data_dir, manifest, previous_manifest, n_processes)
+            else:
+                # time-step depends on every satellite; propagate whole constellation
+                mission : Mission = Mission.from_json(scenario_specs)  
+                mission.execute()                
             print("Propagation done!")
 
             # save specifications of propagation in the orbit data directory
             with open(os.path.join(data_dir,'MissionSpecs.json'), 'w') as mission_specs:
                 mission_specs.write(json.dumps(scenario_specs, indent=4))
 
+            # save input hashes of the propagated data
+            if manifest['incremental']:
+                with open(manifest_path, 'w') as manifest_file:
+                    manifest_file.write(json.dumps(manifest, indent=4))
+
+        # compile binary cache of the pre-computed data
+        print('Compiling orbit data cache...')
+        OrbitData._write_cache(data_dir)
+        print('Orbit data cache compiled!')
+
         return data_dir
     
+    def _hash_precompute_inputs(scenario_specs : dict) -> dict:
+        """
+        Hashes the inputs used to pre-compute the data of each satellite and of each pair of satellites in a scenario
+
+        ### Returns:
+            - manifest (`dict`) containing:
+                - common (`str`): hash of the inputs shared by all satellites
+                - satellites (`list`): hash of the inputs of each satellite
+                - pairs (`dict`): name of the inter-satellite link file of each pair of satellites, indexed by the pair's hash
+                - incremental (`bool`): whether satellites can be propagated independently from each other
+        """
+        # hash inputs shared by all satellites
+        settings_dict : dict = scenario_specs.get('settings', None)
+        common_inputs = {key : scenario_specs.get(key, None) 
+                         for key in ['epoch', 'duration', 'propagator', 'grid', 'groundStation']}
+        common_inputs['coverageType'] = settings_dict.get('coverageType', None) if settings_dict else None
+        common = OrbitData._hash_specs(common_inputs)
+
+        # hash inputs of each satellite
+        satellites = []
+        for spacecraft in scenario_specs.get('spacecraft', []):
+            spacecraft : dict
+            spacecraft_inputs = {key : value for key, value in spacecraft.items() 
+                                 if key not in OrbitData.NON_ORBITAL_KEYS}
+            satellites.append(OrbitData._hash_specs([common, spacecraft_inputs]))
+
+        # identify each satellite by its hash and the number of preceding satellites with the same hash
+        satellite_keys = [[satellite_hash, satellites[:i_sat].count(satellite_hash)]
+                          for i_sat, satellite_hash in enumerate(satellites)]
+
+        # hash inputs of each pair of satellites; satellites with identical inputs still produce distinct pairs
+        pairs = {OrbitData._hash_specs(sorted([satellite_keys[i], satellite_keys[j]])) : f'sat{i}_to_sat{j}.csv'
+                 for i in range(len(satellites))
+                 for j in range(i+1, len(satellites))}
+
+        # propagator's time-step is derived from all satellites if not specified
+        propagator : dict = scenario_specs.get('propagator', None)
+        incremental = propagator is not None and propagator.get('stepSize', None) is not None
+
+        return {'common' : common, 'satellites' : satellites, 'pairs' : pairs, 'incremental' : incremental}
+
+    def _load_precompute_manifest(orbitdata_path : str) -> dict:
+        """ Returns the input hashes of the data in the orbit data directory. Returns `None` if none were saved. """
+        manifest_path = os.path.join(orbitdata_path, OrbitData.PRECOMPUTE_MANIFEST)
+        if not os.path.exists(manifest_path):
+            return None
+        
+        with open(manifest_path, 'r') as manifest_file:
+            return json.load(manifest_file)
+
+    def _propagate_incremental(scenario_specs : dict, 
+                               data_dir : str, 
+                               manifest : dict, 
+                               previous_manifest : dict,
+                               n_processes : int = None
+                               ) -> None:
+        """
+        Propagates the satellites and inter-satellite links whose inputs are not found in the existing orbit data. 
+        Existing data with matching inputs is reused and renamed to the satellites' current indeces.
+
+        ### Arguments:
+            - scenario_specs (`dict`): scenario specifications
+            - data_dir (`str`): orbit data directory
+            - manifest (`dict`): input hashes of the scenario
+            - previous_manifest (`dict`): input hashes of the existing orbit data. `None` if no data can be reused.
+            - n_processes (`int`): maximum number of processes used to run the propagation jobs. Defaults to the number of processors available.
+        """
+        spacecraft_list : list = scenario_specs.get('spacecraft', [])
+        previous_satellites : list = previous_manifest['satellites'] if previous_manifest else []
+        previous_pairs : dict = previous_manifest['pairs'] if previous_manifest else dict()
+
+        # move existing data to a staging directory
+        staging_dir = os.path.join(data_dir, OrbitData.PRECOMPUTE_DIR)
+        if os.path.exists(staging_dir):
+            shutil.rmtree(staging_dir)
+        previous_dir = os.path.join(staging_dir, 'previous')
+        os.makedirs(previous_dir)
+        for f in os.listdir(data_dir):
+            if re.fullmatch('sat[0-9]+', f) or f == 'comm':
+                shutil.move(os.path.join(data_dir, f), os.path.join(previous_dir, f))
+
+        # match satellites to existing data with the same inputs
+        available = dict()
+        for i_prev, satellite_hash in enumerate(previous_satellites):
+            available.setdefault(satellite_hash, []).append(i_prev)
+
+        pending_satellites = []
+        for i_sat, satellite_hash in enumerate(manifest['satellites']):
+            if available.get(satellite_hash, None):
+                # reuse existing data
+                i_prev = available[satellite_hash].pop(0)
+                shutil.move(os.path.join(previous_dir, f'sat{i_prev}'), os.path.join(data_dir, f'sat{i_sat}'))
+            else:
+                pending_satellites.append(i_sat)
+
+        # match satellite pairs to existing inter-satellite link data with the same inputs
+        comm_dir = os.path.join(data_dir, 'comm')
+        os.mkdir(comm_dir)
+        pending_pairs = []
+        for pair_hash, filename in manifest['pairs'].items():
+            previous_path = os.path.join(previous_dir, 'comm', previous_pairs.get(pair_hash, filename))
+            if pair_hash in previous_pairs and os.path.exists(previous_path):
+                # reuse existing data
+                shutil.move(previous_path, os.path.join(comm_dir, filename))
+            else:
+                i_sat, j_sat = [int(re.sub("[^0-9]", "", sat)) for sat in re.sub(".csv", "", filename).split('_to_')]
+                pending_pairs.append((i_sat, j_sat, filename))
+
+        print(f'Reusing data of {len(spacecraft_list) - len(pending_satellites)} satellites and '\
+              + f'{len(manifest["pairs"]) - len(pending_pairs)} inter-satellite links.')
+
+        # propagate satellites and compute their coverage 
+        if pending_satellites:
+            with ProcessPoolExecutor(max_workers=n_processes) as executor:
+                jobs = {i_sat : executor.submit(OrbitData._propagate_satellite, 
+                                                OrbitData._get_satellite_specs(scenario_specs, i_sat, 
+                                                                               os.path.join(staging_dir, f'sat{i_sat}')))
+                        for i_sat in pending_satellites}
+
+                for i_sat, job in jobs.items():
+                    out_dir : str = job.result()
+                    shutil.move(os.path.join(out_dir, 'sat0'), os.path.join(data_dir, f'sat{i_sat}'))
+
+        # compute inter-satellite links
+        if pending_pairs:
+            with ProcessPoolExecutor(max_workers=n_processes) as executor:
+                jobs = [executor.submit(OrbitData._find_satellite_contacts, 
+                                        spacecraft_list[i_sat], 
+                                        spacecraft_list[j_sat], 
+                                        comm_dir,
+                                        os.path.join(data_dir, f'sat{i_sat}', 'state_cartesian.csv'),
+                                        os.path.join(data_dir, f'sat{j_sat}', 'state_cartesian.csv'),
+                                        filename)
+                        for i_sat, j_sat, filename in pending_pairs]
+                
+                for job in jobs: job.result()
+
+        # remove unused data
+        shutil.rmtree(staging_dir)
+
+    def _get_satellite_specs(scenario_specs : dict, i_sat : int, out_dir : str) -> dict:
+        """ Returns the specifications of a scenario containing only one of its satellites """
+        satellite_specs : dict = copy.deepcopy(scenario_specs)
+        satellite_specs['spacecraft'] = [satellite_specs['spacecraft'][i_sat]]
+        satellite_specs['settings']['outDir'] = out_dir
+        return satellite_specs
+
+    def _propagate_satellite(satellite_specs : dict) -> str:
+        """ Propagates a single-satellite scenario. Returns the directory where the results were saved. """
+        out_dir : str = satellite_specs['settings']['outDir']
+        os.makedirs(out_dir, exist_ok=True)
+
+        mission : Mission = Mission.from_json(satellite_specs)
+        mission.execute()
+
+        return out_dir
+    
+    def _find_satellite_contacts(spacecraft_1 : dict, 
+                                 spacecraft_2 : dict, 
+                                 comm_dir : str, 
+                                 state_file_1 : str, 
+                                 state_file_2 : str, 
+                                 filename : str
+                                 ) -> None:
+        """ Computes the line-of-sight contact intervals between two propagated satellites """
+        ContactFinder.execute(Spacecraft.from_dict(spacecraft_1), 
+                              Spacecraft.from_dict(spacecraft_2), 
+                              comm_dir, 
+                              state_file_1, 
+                              state_file_2, 
+                              filename, 
+                              ContactFinder.OutType.INTERVAL, 
+                              opaque_atmos_height_km=30)
+    
     def _check_changes_to_scenario(scenario_dict : dict, orbitdata_dir : str) -> bool:
         """ 
         Checks if the scenario has already been pre-computed 
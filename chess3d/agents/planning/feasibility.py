@@ -0,0 +1,170 @@
+import numpy as np
+
+from orbitpy.util import Spacecraft
+
+from chess3d.agents.actions import ObservationAction
+from chess3d.agents.states import SimulationAgentState
+
+
+class ManeuverFeasibility:
+    """
+    ## Maneuver Feasibility Service
+
+    Answers slew-feasibility queries between observations for a single agent.
+
+    ADCS limits are parsed once from the agent's specifications. Minimum transition times between observations
+    are computed as vectorized matrices (or as a band of successors for time-sorted observations), and path-validity
+    checks can be performed incrementally when a single observation is inserted into an already valid path.
+
+    Slewing is assumed to be performed at the maximum slew rate about the roll axis.
+    """
+    TOLERANCE = 1e-6
+
+    def __init__(self,
+                 max_slew_rate : float,
+                 max_torque : float,
+                 instruments : list
+                 ) -> None:
+        """
+        ### Arguments:
+            - max_slew_rate (`float`): maximum slew rate of the agent [deg/s]
+            - max_torque (`float`): maximum torque of the agent's reaction wheels
+            - instruments (`list`): names of the instruments in the agent's payload
+        """
+        # validate inputs
+        if max_slew_rate <= 0.0: raise ValueError(f'`max_slew_rate` must be a positive number. Is {max_slew_rate}.')
+
+        # set parameters
+        self.max_slew_rate : float = max_slew_rate
+        self.max_torque : float = max_torque
+        self.instruments : set = set(instruments)
+
+    def from_specs(specs : Spacecraft) -> object:
+        """ Parses the ADCS and payload specifications of a spacecraft """
+        # get pointing agility specifications
+        adcs_specs : dict = specs.spacecraftBus.components.get('adcs', None)
+        if adcs_specs is None: raise ValueError('ADCS component specifications missing from agent specs object.')
+
+        max_slew_rate = float(adcs_specs['maxRate']) if adcs_specs.get('maxRate', None) is not None else None
+        if max_slew_rate is None: raise ValueError('ADCS `maxRate` specification missing from agent specs object.')
+
+        max_torque = float(adcs_specs['maxTorque']) if adcs_specs.get('maxTorque', None) is not None else None
+        if max_torque is None: raise ValueError('ADCS `maxTorque` specification missing from agent specs object.')
+
+        return ManeuverFeasibility(max_slew_rate, max_torque, [instrument.name for instrument in specs.instrument])
+
+    def calc_transition_times(self, th_from, th_to) -> np.ndarray:
+        """ Calculates the minimum time [s] required to slew between look angles [deg]. Supports array broadcasting. """
+        return np.abs(np.asarray(th_to, dtype=float) - np.asarray(th_from, dtype=float)) / self.max_slew_rate
+
+    def __is_feasible(self, dt_measurements, dt_maneuvers):
+        """ Checks if there is enough time between measurements to perform the required maneuvers """
+        # negated comparisons keep transitions with undefined times or look angles feasible
+        return ~(dt_measurements < 0.0) & ~((dt_maneuvers > dt_measurements)
+                                             & (np.abs(dt_maneuvers - dt_measurements) > self.TOLERANCE))
+
+    def is_transition_feasible(self, t_from : float, th_from : float, t_to : float, th_to : float) -> bool:
+        """ Checks if the agent can slew from look angle `th_from` at time `t_from` to `th_to` by time `t_to` """
+        # check if observation sequence is correct
+        dt_measurements = t_to - t_from
+        if dt_measurements < 0.0: return False
+
+        # check if there's enough time to maneuver from one observation to another
+        dt_maneuver = abs(th_to - th_from) / self.max_slew_rate
+        return not (dt_maneuver > dt_measurements and abs(dt_maneuver - dt_measurements) > self.TOLERANCE)
+
+    def calc_transition_matrix(self, observations : list, successors : list = None) -> np.ndarray:
+        """ 
+        Calculates the minimum slew time [s] from the end of observation `i` to the start of observation `j` for every 
+        pair of observations. If `successors` is given, `j` indexes the successors instead.
+        """
+        successors = observations if successors is None else successors
+        th_from = np.array([observation.look_angle for observation in observations], dtype=float)
+        th_to = np.array([observation.look_angle for observation in successors], dtype=float)
+        return self.calc_transition_times(th_from[:, np.newaxis], th_to[np.newaxis, :])
+
+    def calc_feasibility_matrix(self, observations : list, successors : list = None) -> np.ndarray:
+        """ 
+        Checks if observation `j` can be performed after observation `i` for every pair of observations.
+        If `successors` is given, `j` indexes the successors instead.
+        """
+        successors = observations if successors is None else successors
+        t_end = np.array([observation.t_end for observation in observations], dtype=float)
+        t_start = np.array([observation.t_start for observation in successors], dtype=float)
+
+        dt_measurements = t_start[np.newaxis, :] - t_end[:, np.newaxis]
+        return self.__is_feasible(dt_measurements, self.calc_transition_matrix(observations, successors))
+
+    def calc_state_feasibility(self, state : SimulationAgentState, observations : list) -> np.ndarray:
+        """ Checks if each observation can be performed directly after the agent's current state """
+        th = np.array([observation.look_angle for observation in observations], dtype=float)
+        t_start = np.array([observation.t_start for observation in observations], dtype=float)
+        has_instrument = np.array([observation.instrument_name in self.instruments for observation in observations], dtype=bool)
+
+        return has_instrument & self.__is_feasible(t_start - state.t, self.calc_transition_times(state.attitude[0], th))
+
+    def calc_feasibility_band(self, observations : list, bandwidth : int) -> np.ndarray:
+        """
+        Checks if observation `i+d+1` can be performed after observation `i` for a band of `bandwidth` successors of
+        every observation. Observations must be sorted by start time. Entries beyond the last observation are `False`.
+        """
+        n = len(observations)
+        th = np.array([observation.look_angle for observation in observations], dtype=float)
+        t_start = np.array([observation.t_start for observation in observations], dtype=float)
+        t_end = np.array([observation.t_end for observation in observations], dtype=float)
+
+        # indeces of the successors of every observation
+        successors = np.arange(n)[:, np.newaxis] + np.arange(1, bandwidth+1)[np.newaxis, :]
+        in_range = successors < n
+        successors = np.minimum(successors, n-1) if n > 0 else successors
+
+        # check feasibility of every transition within the band
+        dt_measurements = t_start[successors] - t_end[:, np.newaxis]
+        dt_maneuvers = self.calc_transition_times(th[:, np.newaxis], th[successors])
+        return in_range & self.__is_feasible(dt_measurements, dt_maneuvers)
+
+    def calc_path_feasibility(self, state : SimulationAgentState, observations : list) -> np.ndarray:
+        """ Checks if each observation in a sequence can be performed after the one preceding it, or after the agent's current state for the first one """
+        th = np.array([state.attitude[0], *[observation.look_angle for observation in observations]], dtype=float)
+        t_start = np.array([observation.t_start for observation in observations], dtype=float)
+        t_end = np.array([state.t, *[observation.t_end for observation in observations[:-1]]], dtype=float)
+
+        # check if desired instrument is contained within the satellite's specifications
+        has_instrument = np.array([observation.instrument_name in self.instruments for observation in observations], dtype=bool)
+
+        return has_instrument & self.__is_feasible(t_start - t_end, self.calc_transition_times(th[:-1], th[1:]))
+
+    def is_path_valid(self, state : SimulationAgentState, observations : list) -> bool:
+        """ Checks if a given sequence of observations can be performed by the agent """
+        return bool(np.all(self.calc_path_feasibility(state, observations)))
+
+    def is_insertion_valid(self,
+                           state : SimulationAgentState,
+                           observations : list,
+                           observation : ObservationAction,
+                           i : int
+                           ) -> bool:
+        """
+        Checks if an observation can be inserted at position `i` of a sequence of observations.
+        Only the transitions to and from the inserted observation are checked; the rest of the sequence is assumed to be valid.
+        """
+        # check if desired instrument is contained within the satellite's specifications
+        if observation.instrument_name not in self.instruments: return False
+
+        # check transition from the preceding observation or current state
+        if i > 0:
+            prev_observation : ObservationAction = observations[i-1]
+            t_prev, th_prev = prev_observation.t_end, prev_observation.look_angle
+        else:
+            t_prev, th_prev = state.t, state.attitude[0]
+
+        if not self.is_transition_feasible(t_prev, th_prev, observation.t_start, observation.look_angle):
+            return False
+
+        # check transition to the following observation
+        if i < len(observations):
+            next_observation : ObservationAction = observations[i]
+            return self.is_transition_feasible(observation.t_end, observation.look_angle,
+                                               next_observation.t_start, next_observation.look_angle)
+
+        return True
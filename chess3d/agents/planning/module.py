@@ -11,13 +11,15 @@ from dmas.utils import runtime_tracker
 from chess3d.agents.planning.plan import Plan, Preplan
 from chess3d.agents.planning.planner import AbstractPreplanner
 from chess3d.agents.planning.planner import AbstractReplanner
+from chess3d.agents.planning.planners.consensus.consensus import AbstractConsensusReplanner
 from chess3d.agents.orbitdata import OrbitData
 from chess3d.agents.planning.planners.rewards import RewardGrid
 from chess3d.agents.states import *
 from chess3d.agents.science.requests import *
 from chess3d.messages import *
+from chess3d.transport import ContextElement
 
-class PlanningModule(InternalModule):
+class PlanningModule(ContextElement, InternalModule):
     def __init__(self, 
                 results_path : str, 
                 parent_agent_specs : object,
@@ -694,4 +696,10 @@ class PlanningModule(InternalModule):
         self.log(f'\nPLANNER RUN-TIME STATS\n{str(stats_df)}\n', level=logging.WARNING)
         stats_df.to_csv(f"{self.results_path}/{self.get_parent_name()}/planner_runtime_stats.csv", index=False)
 
+        # log bid exchange counters
+        if isinstance(self.replanner, AbstractConsensusReplanner):
+            counters_df = pd.DataFrame([self.replanner.bid_counters])
+            self.log(f'\nBID EXCHANGE COUNTERS\n{str(counters_df)}\n', level=logging.WARNING)
+            counters_df.to_csv(f"{self.results_path}/{self.get_parent_name()}/bid_exchange_stats.csv", index=False)
+
         await super().teardown()
@@ -0,0 +1,149 @@
+import weakref
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+from chess3d.agents.orbitdata import OrbitData, TimeInterval
+
+
+class AccessOpportunityProvider:
+    """
+    ## Access Opportunity Provider
+
+    Compiles the access intervals of an agent's instruments to every ground point within a sliding planning horizon.
+
+    Accesses are loaded from the agent's ground point access data as the horizon moves forward. Consecutive accesses
+    to the same ground point separated by at most one propagation time-step are merged into a single access interval.
+    Intervals that end before the start of the horizon are evicted, so moving the horizon only costs time proportional
+    to the accesses entering and leaving it. Moving the horizon backwards reloads all accesses from its new start.
+
+    A single provider is shared by all planners using the same orbit data.
+    """
+    providers = weakref.WeakKeyDictionary()
+
+    def __init__(self, orbitdata : OrbitData) -> None:
+        """
+        ### Arguments:
+            - orbitdata (`OrbitData`): pre-computed orbit data of the agent
+        """
+        # set parameters
+        self.time_step : float = orbitdata.time_step
+
+        # store access data as time-sorted columns
+        data = orbitdata.gp_access_data
+        self._t_indeces : list = list(data['time index'].values)
+        self._grid_indeces : list = list(data['grid index'].values)
+        self._gp_indeces : list = list(data['GP index'].values)
+        self._lats : list = list(data['lat [deg]'].values)
+        self._lons : list = list(data['lon [deg]'].values)
+        self._instruments : list = list(data['instrument'].values)
+        self._look_angles : list = list(data['look angle [deg]'].values)
+
+        # initialize horizon
+        self.__reset(0.0)
+
+    def get(orbitdata : OrbitData) -> object:
+        """ Returns the access opportunity provider of a given agent's orbit data. Created the first time it is requested. """
+        if orbitdata not in AccessOpportunityProvider.providers:
+            AccessOpportunityProvider.providers[orbitdata] = AccessOpportunityProvider(orbitdata)
+        return AccessOpportunityProvider.providers[orbitdata]
+
+    def __reset(self, t_index_start : float) -> None:
+        """ Discards all loaded accesses and restarts the horizon at a given time index """
+        self._t_index_start : float = t_index_start
+        self._i_next : int = bisect_left(self._t_indeces, t_index_start)
+
+        # access intervals per (grid index, gp index, instrument); each interval is stored as `[interval, t, th, rows]`
+        self._intervals : dict = dict()
+
+    def __update(self, t_index_start : float, t_index_end : float) -> None:
+        """ Moves the horizon to start at `t_index_start` and loads all accesses up to `t_index_end` """
+        # reload data if the horizon moved backwards
+        if t_index_start < self._t_index_start:
+            self.__reset(t_index_start)
+        self._t_index_start = t_index_start
+
+        # skip accesses that were never loaded and are already in the past
+        self._i_next = max(self._i_next, bisect_left(self._t_indeces, t_index_start))
+
+        # load accesses entering the horizon
+        while self._i_next < len(self._t_indeces) and self._t_indeces[self._i_next] <= t_index_end:
+            i = self._i_next
+            t_img = self._t_indeces[i] * self.time_step
+            key = (self._grid_indeces[i], self._gp_indeces[i], self._instruments[i])
+            intervals : deque = self._intervals.setdefault(key, deque())
+
+            if intervals and intervals[-1][0].end >= t_img - self.time_step:
+                # extend latest access interval
+                interval, t, th, rows = intervals[-1]
+                interval.extend(t_img)
+                t.append(t_img); th.append(self._look_angles[i]); rows.append(i)
+            else:
+                # start new access interval
+                intervals.append([TimeInterval(t_img, t_img), [t_img], [self._look_angles[i]], [i]])
+
+            self._i_next += 1
+
+        # evict access intervals that ended before the start of the horizon
+        for key in list(self._intervals.keys()):
+            intervals : deque = self._intervals[key]
+            while intervals and self._t_indeces[intervals[0][3][-1]] < t_index_start:
+                intervals.popleft()
+            if not intervals: self._intervals.pop(key)
+
+    def get_access_opportunities(self,
+                                 t_start : float,
+                                 t_end : float,
+                                 instruments : list,
+                                 include_start : bool = True
+                                 ) -> tuple:
+        """
+        Compiles the access intervals to every ground point between `t_start` and `t_end` [s]
+
+        ### Arguments:
+            - t_start (`float`): start of the planning horizon [s]
+            - t_end (`float`): end of the planning horizon [s], inclusive
+            - instruments (`list`): names of the instruments onboard the agent
+            - include_start (`bool`): toggles including accesses that occur exactly at `t_start`
+
+        ### Returns:
+            - access_opportunities (`list`): access intervals as tuples of `(grid index, gp index, instrument, interval, t, th)`
+            - ground_points (`dict`): latitude and longitude [deg] of every accessed ground point, indexed by grid and gp index
+        """
+        # move horizon
+        t_index_start = t_start / self.time_step
+        t_index_end = t_end / self.time_step
+        self.__update(t_index_start, t_index_end)
+
+        # clip loaded access intervals to the horizon
+        instrument_order = {instrument : i for i, instrument in enumerate(instruments)}
+        opportunities = []
+        for (grid_index, gp_index, instrument), intervals in self._intervals.items():
+            if instrument not in instrument_order: continue
+
+            for _, t, th, rows in intervals:
+                i_start = bisect_left(rows, t_index_start, key=self._t_indeces.__getitem__) if include_start \
+                            else bisect_right(rows, t_index_start, key=self._t_indeces.__getitem__)
+                i_end = bisect_right(rows, t_index_end, key=self._t_indeces.__getitem__)
+                if i_start >= i_end: continue
+
+                opportunities.append((rows[i_start], grid_index, gp_index, instrument,
+                                      TimeInterval(t[i_start], t[i_end-1]), t[i_start:i_end], th[i_start:i_end]))
+
+        # group ground points in order of first access within the horizon
+        first_access = {}
+        for row, grid_index, gp_index, *_ in opportunities:
+            first_access[grid_index] = min(first_access.get(grid_index, row), row)
+            first_access[(grid_index, gp_index)] = min(first_access.get((grid_index, gp_index), row), row)
+
+        opportunities.sort(key=lambda opportunity : (first_access[opportunity[1]],
+                                                     first_access[(opportunity[1], opportunity[2])],
+                                                     instrument_order[opportunity[3]],
+                                                     opportunity[0]))
+
+        # compile ground point coordinates
+        ground_points = {}
+        for row, grid_index, gp_index, *_ in opportunities:
+            if row == first_access[(grid_index, gp_index)]:
+                ground_points.setdefault(grid_index, {})[gp_index] = (self._lats[row], self._lons[row])
+
+        return [opportunity[1:] for opportunity in opportunities], ground_points
@@ -1,5 +1,7 @@
 from abc import ABC
+import bisect
 import copy
+import heapq
 import uuid
 import numpy as np
 
@@ -7,7 +9,13 @@ from chess3d.agents.actions import *
 
 
 class Plan(ABC):
-    """ Describes a plan to be performed by an agent """
+    """ 
+    Describes a plan to be performed by an agent 
+    
+    Actions are kept in a list sorted by start time, with zero-duration actions placed before any other action 
+    starting at the same time. Feasible plans contain no overlapping actions, so end times are sorted as well. 
+    Actions are located via binary search on either time and indexed by their id.
+    """
     
     def __init__(   self, 
                     *actions,  
@@ -16,6 +24,7 @@ class Plan(ABC):
         # initialize values
         self.t = t
         self.actions : list[AgentAction] = []
+        self._ids : dict[str, list] = {}
         
         # load preplan
         if actions:
@@ -33,11 +42,69 @@ class Plan(ABC):
         
         return counts
 
+    def _sort_key(action : AgentAction) -> tuple:
+        """ orders actions by start time, placing zero-duration actions first """
+        return (action.t_start, action.t_end)
+
+    def __reset(self, actions : list) -> None:
+        """ replaces all actions in the plan with a sorted list of actions """
+        self.actions = actions
+        self._ids = {}
+        for action in actions: self._ids.setdefault(action.id, []).append(action)
+
+    def __insert(self, action : AgentAction) -> None:
+        """ inserts an action into the plan while keeping it sorted """
+        bisect.insort_right(self.actions, action, key=Plan._sort_key)
+        self._ids.setdefault(action.id, []).append(action)
+
+    def __find(self, action : AgentAction) -> int:
+        """ returns the position of an action in the plan. Returns `-1` if not contained in the plan """
+        i = bisect.bisect_left(self.actions, Plan._sort_key(action), key=Plan._sort_key)
+        while i < len(self.actions) and Plan._sort_key(self.actions[i]) == Plan._sort_key(action):
+            if self.actions[i] is action: return i
+            i += 1
+        
+        # action times may have been modified outside of the plan; search linearly
+        for i, planned_action in enumerate(self.actions):
+            if planned_action is action: return i
+        return -1
+
+    def __pop(self, i : int) -> AgentAction:
+        """ removes the action at a given position of the plan """
+        action : AgentAction = self.actions.pop(i)
+        self.__unindex(action)
+        return action
+
+    def __unindex(self, action : AgentAction) -> None:
+        """ removes an action from the id index """
+        matching_actions : list = self._ids[action.id]
+        matching_actions[:] = [matching_action for matching_action in matching_actions 
+                               if matching_action is not action]
+        if not matching_actions: self._ids.pop(action.id)
+
+    def __check_neighborhood(self, actions : list) -> None:
+        """ checks the feasibility of the plan around a set of newly placed actions """
+        for action in actions:
+            i = self.__find(action)
+            if i < 0: continue
+            self.__is_feasible(self.actions[max(i-1, 0) : i+2])
+
+    def remove(self, action : AgentAction) -> None:
+        """ removes an action from the plan """
+        i = self.__find(action)
+        if i < 0: raise ValueError(f'Action with id `{action.id}` is not in plan.')
+        self.__pop(i)
+
+    def get_action(self, action_id : str) -> AgentAction:
+        """ returns the earliest action in the plan with a given id. Returns `None` if no such action exists """
+        matching_actions : list = self._ids.get(action_id, [])
+        return min(matching_actions, key=Plan._sort_key) if matching_actions else None
+
     def update(self, *action_lists, t : float) -> None:
         """ Updates the current plan to a new list of actions """
         
         # reset current plan
-        self.actions = []
+        self.__reset([])
 
         # add actions from iterable set of actions
         for actions in action_lists:
@@ -64,37 +131,15 @@ class Plan(ABC):
         """ adds a set of actions to plan """
         
         # sort new set of actions by start time 
-        actions.sort(key= lambda a : a.t_start)
+        actions = sorted(actions, key=Plan._sort_key)
 
         # if there are no actions in current plan
         if not self.actions:
-            self.actions.extend(actions)
+            self.__reset(actions)
         
         else:
             # create preliminary plan
-            prelim_plan = []
-
-            curr_actions = [action for action in self.actions]
-            new_actions = [action for action in actions]
-
-            while curr_actions and new_actions:
-                curr_action : AgentAction = curr_actions[0]
-                new_action : AgentAction = new_actions[0]
-
-                if curr_action.t_start < new_action.t_start:
-                    prelim_plan.append(curr_actions.pop(0))
-                
-                elif curr_action.t_start > new_action.t_start:
-                    prelim_plan.append(new_actions.pop(0))
-
-                elif abs(curr_action.t_end - curr_action.t_start) <= 1e-3:
-                    prelim_plan.append(curr_actions.pop(0))
-                
-                elif abs(new_action.t_end - new_action.t_start) <= 1e-3:
-                    prelim_plan.append(new_actions.pop(0))
-
-            if curr_actions: prelim_plan.extend(curr_actions)
-            if new_actions: prelim_plan.extend(new_actions)
+            prelim_plan = list(heapq.merge(self.actions, actions, key=Plan._sort_key))
 
             # check feasibility
             try:
@@ -105,7 +150,7 @@ class Plan(ABC):
             
             if feasible:
                 # is feasible, no need to repair 
-                self.actions = [action for action in prelim_plan]
+                self.__reset(prelim_plan)
                 
             else:
                 # possible conflicts exist, may need to repair 
@@ -118,26 +163,29 @@ class Plan(ABC):
         if not isinstance(action, AgentAction):
             raise ValueError(f"Cannot place action of type `{type(action)}` in plan. Must be of type `{AgentAction}`.")
 
+        # keep track of actions placed in the plan
+        placed_actions = []
+
         try:
+            # find actions starting before and after this action's start
+            i_start = bisect.bisect_left(self.actions, action.t_start, key=lambda a : a.t_start)
+            i_after = bisect.bisect_right(self.actions, action.t_start, key=lambda a : a.t_start)
+            
+            # find actions ending before this action's start and its end
+            i_prev = bisect.bisect_right(self.actions, action.t_start, key=lambda a : a.t_end)
+            i_concurrent = bisect.bisect_left(self.actions, action.t_end, key=lambda a : a.t_end)
+
             # check if action is scheduled to occur during while another action is being performed
             interrupted_actions = [interrupted_action 
-                                   for interrupted_action in self.actions
-                                   if isinstance(interrupted_action, AgentAction)
-                                   and interrupted_action.t_start < action.t_start < interrupted_action.t_end]
+                                   for interrupted_action in self.actions[i_prev:i_start]
+                                   if interrupted_action.t_start < action.t_start < interrupted_action.t_end]
             
             # check if another action is schduled during this action
             concurrent_actions = [concurrent_action 
-                                  for concurrent_action in self.actions
-                                  if isinstance(concurrent_action, AgentAction)
-                                  and action.t_start < concurrent_action.t_start
+                                  for concurrent_action in self.actions[i_after:max(i_after, i_concurrent)]
+                                  if action.t_start < concurrent_action.t_start
                                   and concurrent_action.t_end < action.t_end
                                   ]
-            concurrent_actions.sort(key=lambda a : a.t_start)
-
-            # check if action occurs after another action was completed 
-            previous_actions = [completed_action 
-                                for completed_action in self.actions
-                                if completed_action.t_end <= action.t_start]
 
             if interrupted_actions:
                 earliest_interrupted_action : AgentAction = interrupted_actions.pop(0)
@@ -145,11 +193,11 @@ class Plan(ABC):
                     or  isinstance(earliest_interrupted_action, BroadcastMessageAction)
                     ):
                     # interrupted action has no duration, schedule broadcast for right after
-                    self.actions.insert(self.actions.index(earliest_interrupted_action) + 1, action)
+                    self.__insert(action)
+                    placed_actions.append(action)
                     
                 else:
                     # interrupted action has a non-zero duration; split interrupted action into two 
-                    i_plan = self.actions.index(earliest_interrupted_action)
 
                     # create duplciate of interrupted action with a new ID
                     continued_action : AgentAction = action_from_dict(**earliest_interrupted_action.to_dict())
@@ -160,14 +208,15 @@ class Plan(ABC):
                         ## change start and end positions TODO
                         pass
 
-                    ## change start and end times for the interrupted and continued actions
+                    ## change start and end times for the interrupted and continued actions; 
+                    ## shortening the interrupted action does not change its position in the plan
                     earliest_interrupted_action.t_end = action.t_start
                     continued_action.t_start = action.t_end
 
                     # place action in between the two split parts
-                    self.actions[i_plan] = earliest_interrupted_action
-                    self.actions.insert(i_plan + 1, continued_action)
-                    self.actions.insert(i_plan + 1, action)
+                    self.__insert(action)
+                    self.__insert(continued_action)
+                    placed_actions.extend([earliest_interrupted_action, action, continued_action])
 
             elif concurrent_actions:
                 # split action between concurent actions
@@ -187,40 +236,31 @@ class Plan(ABC):
                         action.t_start = concurrent_action.t_end
                         
                         # add new action to plan
-                        self.actions.insert(self.actions.index(concurrent_action), shortened_action)
-                    else:
-                        x = 1
+                        self.__insert(shortened_action)
+                        placed_actions.append(shortened_action)
 
                 # check if there is still time left in the action
                 if abs(action.t_end - action.t_start) >= 1e-6:   
                     # place action after last concurrent_action 
-                    latest_action : AgentAction = concurrent_actions[-1]
-                    self.actions.insert(self.actions.index(latest_action) + 1, action) 
+                    self.__insert(action)
+                    placed_actions.append(action)
                 else:
                     # action is too short after splitting; do not add to plan
                     pass
-            
-            elif previous_actions:
-                # place action after latest action ends
-                latest_action : AgentAction = previous_actions[-1]
-                self.actions.insert(self.actions.index(latest_action) + 1, action)
 
             else:
-                # place action at the start of the plan
-                self.actions.insert(0, action)
+                # place action after latest action ends or at the start of the plan
+                self.__insert(action)
+                placed_actions.append(action)
 
         finally:
-            # sort actions chronollogically 
-            self.actions.sort(key=lambda a : a.t_start)
-            
             # update latest update time
             self.t = t  
 
             try:
                 # check plan feasibility
-                self.__is_feasible(self.actions)
+                self.__check_neighborhood(placed_actions)
             except ValueError as e:
-                # self.__is_feasible(self.actions)
                 raise RuntimeError(f"Cannot place action in plan. {e} \n {str(self)}\ncurrent plan:\n{str(self)}")
 
     def update_action_completion(   self, 
@@ -241,22 +281,23 @@ class Plan(ABC):
 
         # remove performed actions from plan
         for performed_action in performed_actions:
-            matching_actions = [action for action in self.actions
-                                if performed_action.id == action.id]
-            for action in matching_actions: self.actions.remove(action)
+            for action in list(self._ids.get(performed_action.id, [])): 
+                self.remove(action)
 
-        # removed expired actions
-        expired_actions = [action for action in self.actions
-                           if action.t_end < t]
-        for action in expired_actions: self.actions.remove(action)
+        # removed expired actions; end times are sorted so they are all at the start of the plan
+        i_expired = bisect.bisect_left(self.actions, t, key=lambda a : a.t_end)
+        for action in self.actions[:i_expired]: self.__unindex(action)
+        del self.actions[:i_expired]
 
     def get_next_actions(self, t : float) -> list:
         """ returns a list of dicts """
 
         # get next available action to perform
         eps = 1e-6
+        i_start = bisect.bisect_left(self.actions, t - eps, key=lambda a : a.t_end)
+        i_end = bisect.bisect_right(self.actions, t + eps, key=lambda a : a.t_start)
         plan_out : list[AgentAction] = [action
-                                        for action in self.actions 
+                                        for action in self.actions[i_start:max(i_start, i_end)] 
                                         if action.t_start - eps <= t <= action.t_end + eps]
         
         # sort plan in order of ascending start time 
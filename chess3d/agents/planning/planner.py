@@ -1,6 +1,6 @@
 
+import bisect
 import math
-import queue
 from typing import Dict
 
 from instrupy.base import Instrument, BasicSensorModel
@@ -12,7 +12,10 @@ from dmas.utils import runtime_tracker
 from tqdm import tqdm
 
 from chess3d.agents.planning.plan import Plan, Preplan
-from chess3d.agents.orbitdata import OrbitData, TimeInterval
+from chess3d.agents.orbitdata import ContactTimeline, OrbitData, TimeInterval
+from chess3d.agents.planning.feasibility import ManeuverFeasibility
+from chess3d.agents.planning.opportunities import AccessOpportunityProvider
+from chess3d.agents.planning.routing import ContactGraphRouter
 from chess3d.agents.planning.planners.rewards import RewardGrid
 from chess3d.agents.states import *
 from chess3d.agents.science.requests import *
@@ -38,6 +41,9 @@ class AbstractPlanner(ABC):
         self.pending_relays : set[SimulationMessage] = set()                # set of relay messages to be broadcasted
         self.completed_broadcasts = set()                                   # set of completed broadcasts
         self.stats = {}                                                     # collector for runtime performance statistics
+        self.router : ContactGraphRouter = None                             # contact graph router for broadcast relay paths
+        self.feasibility : ManeuverFeasibility = None                       # maneuver feasibility service for the agent's specs
+        self._feasibility_specs : object = None                             # specs used to build the maneuver feasibility service
         
         # set attribute parameters
         self._debug = debug                 # toggles debugging features
@@ -177,18 +183,34 @@ class AbstractPlanner(ABC):
         # return scheduled broadcasts
         return broadcasts 
     
+    def _get_router(self, orbitdata : OrbitData) -> ContactGraphRouter:
+        """ Returns the contact graph router for the agent's scenario. Built the first time it is requested. """
+        # use contact timeline shared by the scenario; only the agent's own links are known otherwise
+        contacts : ContactTimeline = orbitdata.contacts if orbitdata.contacts is not None \
+                                        else ContactTimeline.from_orbitdata({orbitdata.agent_name : orbitdata})
+        
+        if self.router is None or self.router.contacts is not contacts:
+            agents = [orbitdata.agent_name, *[agent for agent in orbitdata.isl_data if agent != orbitdata.agent_name]]
+            self.router = ContactGraphRouter(contacts, agents)
+
+        return self.router
+
     @runtime_tracker
     def _create_broadcast_path(self, 
                                state : SimulationAgentState, 
                                orbitdata : OrbitData = None,
                                t_init : float = None
                                ) -> tuple:
-        """ Finds the best path for broadcasting a message to all agents using depth-first-search 
+        """ Finds the earliest path for broadcasting a message to all agents using contact graph routing 
         
         ### Arguments:
             - state (`SimulationAgentState`): current state of the agent
             - orbitdata (`OrbitData`): coverage data of agent if it is of type `SatelliteAgent`
             - t_init (`float`): ealiest desired broadcast time
+
+        ### Returns:
+            - path (`list`): agents meant to receive the message, sorted by their earliest arrival time
+            - t_start (`float`): broadcast start time. Infinite if not all agents can be reached.
         """
         if not isinstance(state, SatelliteAgentState):
             raise NotImplementedError(f'Broadcast routing path not yet supported for agents of type `{type(state)}`')
@@ -220,57 +242,28 @@ class AbstractPlanner(ABC):
             # all agents are accessing eachother at the same time; no need for mesasge relays
             return ([], t_init)   
 
-        # look for relay path using depth-first search
+        # find earliest arrival routes to all agents 
+        router : ContactGraphRouter = self._get_router(orbitdata)
+        router.evict(state.t)
+        arrivals, predecessors = router.flood(state.agent_name, t_init)
 
-        # initialize queue
-        q = queue.Queue()
+        # check if all agents can be reached
+        if any([target_agent not in arrivals for target_agent in target_agents]):
+            return ([], np.Inf)
         
-        # initialize min path and min path cost
-        min_path = []
-        min_times = []
-        min_cost = np.Inf
-
-        # add parent agent as the root node
-        q.put((state.agent_name, [], [], 0.0))
-
-        while not q.empty():
-            # get next node in the search
-            _, current_path, current_times, path_cost = q.get()
-
-            # check if path is complete
-            if len(target_agents) == len(current_path):
-                # check if minimum cost
-                if path_cost < min_cost:
-                    min_cost = path_cost
-                    min_path = [path_element for path_element in current_path]
-                    min_times = [path_time for path_time in current_times]
-
-            # add children nodes to queue
-            for receiver_agent in [receiver_agent for receiver_agent in target_agents 
-                                    if receiver_agent not in current_path
-                                    and receiver_agent != state.agent_name
-                                    ]:
-                # query next access interval to children nodes
-                t_access : float = state.t + path_cost
-
-                access_interval : TimeInterval = orbitdata.get_next_agent_access(receiver_agent, t_access)
-                
-                if access_interval.start < np.Inf:
-                    new_path = [path_element for path_element in current_path]
-                    new_path.append(receiver_agent)
-
-                    new_cost = access_interval.start - state.t
-
-                    new_times = [path_time for path_time in current_times]
-                    new_times.append(new_cost + state.t)
-
-                    q.put((receiver_agent, new_path, new_times, new_cost))
+        # sort agents by their arrival time
+        path = sorted(target_agents, key=lambda target_agent : arrivals[target_agent])
 
+        # broadcast starts when the first agent is reached by the parent agent
+        t_start = min([arrivals[target_agent] 
+                       for target_agent in target_agents 
+                       if predecessors[target_agent] == state.agent_name])
+        
         # check if earliest broadcast time is valid
-        if min_times: assert state.t <= min_times[0]
+        assert state.t <= t_start
 
         # return path and broadcast start time
-        return (min_path, min_times[0]) if min_path else ([], np.Inf)
+        return (path, t_start)
     
     @runtime_tracker
     def _schedule_relay(self, relay_message : SimulationMessage) -> list:
@@ -327,21 +320,14 @@ class AbstractPlanner(ABC):
         cross_track_fovs = self.collect_fov_specs(specs)
 
         # get pointing agility specifications
-        adcs_specs : dict = specs.spacecraftBus.components.get('adcs', None)
-        if adcs_specs is None: raise ValueError('ADCS component specifications missing from agent specs object.')
-
-        max_slew_rate = float(adcs_specs['maxRate']) if adcs_specs.get('maxRate', None) is not None else None
-        if max_slew_rate is None: raise ValueError('ADCS `maxRate` specification missing from agent specs object.')
-
-        max_torque = float(adcs_specs['maxTorque']) if adcs_specs.get('maxTorque', None) is not None else None
-        if max_torque is None: raise ValueError('ADCS `maxTorque` specification missing from agent specs object.')
-
-        if state.agent_name == 'vis_sat_1_0':
-            x = 1
+        max_slew_rate, _ = self.collect_agility_specs(specs)
 
         # initialize maneuver list
         maneuvers : list[ManeuverAction] = []
 
+        # estimate states at the end of every observation
+        prev_states : list = state.propagate_batch([observation.t_end for observation in observations[:-1]])
+
         for i in tqdm(range(len(observations)), 
                       desc=f'{state.agent_name}-PLANNER: Scheduling Maneuvers', 
                       leave=False):
@@ -356,7 +342,7 @@ class AbstractPlanner(ABC):
             else:
                 prev_observation : ObservationAction = observations[i-1]
                 t_prev = prev_observation.t_end
-                prev_state : SimulationAgentState = state.propagate(t_prev)
+                prev_state : SimulationAgentState = prev_states[i-1]
                 prev_state.attitude = [prev_observation.look_angle, 0.0, 0.0]
 
             # maneuver to point to target
@@ -397,20 +383,22 @@ class AbstractPlanner(ABC):
                                cross_track_fovs : dict
                                ) -> bool:
 
+        # sort maneuvers by start time
+        maneuvers = sorted(maneuvers, key=lambda a : a.t_start)
+        maneuver_starts = [maneuver.t_start for maneuver in maneuvers]
+
         for observation in observations:
             observation : ObservationAction
 
             # get fov for this observation's instrument
             cross_track_fov : float = cross_track_fovs[observation.instrument_name]
 
-            # check if previous maneuvers were performed
-            prev_maneuvers = [maneuver for maneuver in maneuvers
-                              if maneuver.t_start <= observation.t_start]
-            prev_maneuvers.sort(key=lambda a : a.t_start)
+            # count maneuvers started before this observation
+            n_prev_maneuvers = bisect.bisect_right(maneuver_starts, observation.t_start)
 
-            if prev_maneuvers: # there was a maneuver performed before this observation
+            if n_prev_maneuvers > 0: # there was a maneuver performed before this observation
                 # get latest maneuver
-                latest_maneuver : ManeuverAction = prev_maneuvers.pop()
+                latest_maneuver : ManeuverAction = maneuvers[n_prev_maneuvers-1]
 
                 # check status of completion of this maneuver
                 if latest_maneuver.t_end < observation.t_start: # maneuver ended before observation started
@@ -418,8 +406,8 @@ class AbstractPlanner(ABC):
                     dth = abs(observation.look_angle - latest_maneuver.final_attitude[0])
 
                 else: # maneuver was being performed during meneuver
-                    if prev_maneuvers:
-                        prev_maneuver : ManeuverAction = prev_maneuvers.pop()
+                    if n_prev_maneuvers > 1:
+                        prev_maneuver : ManeuverAction = maneuvers[n_prev_maneuvers-2]
                         th_0 = prev_maneuver.final_attitude[0]
                     else:
                         th_0 = state.attitude[0]
@@ -456,17 +444,16 @@ class AbstractPlanner(ABC):
 
         return cross_track_fovs
 
-    def collect_agility_specs(self, specs : Spacecraft) -> tuple:
-        adcs_specs : dict = specs.spacecraftBus.components.get('adcs', None)
-        if adcs_specs is None: raise ValueError('ADCS component specifications missing from agent specs object.')
-
-        max_slew_rate = float(adcs_specs['maxRate']) if adcs_specs.get('maxRate', None) is not None else None
-        if max_slew_rate is None: raise ValueError('ADCS `maxRate` specification missing from agent specs object.')
-
-        max_torque = float(adcs_specs['maxTorque']) if adcs_specs.get('maxTorque', None) is not None else None
-        if max_torque is None: raise ValueError('ADCS `maxTorque` specification missing from agent specs object.')
+    def get_maneuver_feasibility(self, specs : Spacecraft) -> ManeuverFeasibility:
+        """ Returns the maneuver feasibility service of the agent. Specifications are only parsed when they change. """
+        if self.feasibility is None or self._feasibility_specs is not specs:
+            self.feasibility = ManeuverFeasibility.from_specs(specs)
+            self._feasibility_specs = specs
+        return self.feasibility
 
-        return max_slew_rate, max_torque
+    def collect_agility_specs(self, specs : Spacecraft) -> tuple:
+        feasibility : ManeuverFeasibility = self.get_maneuver_feasibility(specs)
+        return feasibility.max_slew_rate, feasibility.max_torque
         
     @runtime_tracker
     def is_observation_path_valid(self, 
@@ -477,67 +464,9 @@ class AbstractPlanner(ABC):
         """ Checks if a given sequence of observations can be performed by a given agent """
 
         if isinstance(state, SatelliteAgentState) and isinstance(specs, Spacecraft):
-
-            # get pointing agility specifications
-            adcs_specs : dict = specs.spacecraftBus.components.get('adcs', None)
-            if adcs_specs is None: raise ValueError('ADCS component specifications missing from agent specs object.')
-
-            max_slew_rate = float(adcs_specs['maxRate']) if adcs_specs.get('maxRate', None) is not None else None
-            if max_slew_rate is None: raise ValueError('ADCS `maxRate` specification missing from agent specs object.')
-
-            max_torque = float(adcs_specs['maxTorque']) if adcs_specs.get('maxTorque', None) is not None else None
-            if max_torque is None: raise ValueError('ADCS `maxTorque` specification missing from agent specs object.')
-            
             # check if every observation can be reached from the prior measurement
-            for j in range(len(observations)):
-
-                # estimate the state of the agent at the given measurement
-                observation_j : ObservationAction = observations[j]
-                th_j = observation_j.look_angle
-                t_j = observation_j.t_start
-                # fov = cross_track_fovs[observation_j.instrument_name]
-
-                # compare to prior measurements
-                
-                if j > 0: # there was a prior observation performed
-
-                    # estimate the state of the agent at the prior mesurement
-                    observation_i : ObservationAction = observations[j-1]
-                    th_i = observation_i.look_angle
-                    t_i = observation_i.t_end
-
-                else: # there was prior measurement
-
-                    # use agent's current state as previous state
-                    th_i = state.attitude[0]
-                    t_i = state.t                
-
-                # check if desired instrument is contained within the satellite's specifications
-                if observation_j.instrument_name not in [instrument.name for instrument in specs.instrument]:
-                    return False 
-                
-                assert th_j != np.NAN and th_i != np.NAN # TODO: add case where the target is not visible by the agent at the desired time according to the precalculated orbitdata
-
-                # estimate maneuver time betweem states
-                dt_maneuver = abs(th_j - th_i) / max_slew_rate
-
-                # calculate time between measuremnets
-                dt_measurements = t_j - t_i
-
-                # check if observation sequence is correct 
-                if dt_measurements < 0.0:
-                    return False
-
-                # Slewing constraint: check if there's enough time to maneuver from one observation to another
-                if dt_maneuver > dt_measurements and abs(dt_maneuver - dt_measurements) > 1e-6:
-                    # there is not enough time to maneuver; flag current observation plan as unfeasible for rescheduling
-                    return False              
-                
-                # Torque constraint:
-                # TODO check if the agent has enough torque in its reaction wheels to perform the maneuver
-                            
-            # if all measurements passed the check; observation path is valid
-            return True
+            # TODO check if the agent has enough torque in its reaction wheels to perform the maneuver
+            return self.get_maneuver_feasibility(specs).is_path_valid(state, observations)
         else:
             raise NotImplementedError(f'Observation path validity check for agents with state type {type(state)} not yet implemented.')
         
@@ -727,66 +656,10 @@ class AbstractPreplanner(AbstractPlanner):
         # define planning horizon
         t_start = state.t
         t_end = self.plan.t_next+self.horizon
-        t_index_start = t_start / orbitdata.time_step
-        t_index_end = t_end / orbitdata.time_step
-
-        # compile coverage data
-        orbitdata_columns : list = list(orbitdata.gp_access_data.columns.values)
-        raw_coverage_data = [(t_index*orbitdata.time_step, *_)
-                             for t_index, *_ in orbitdata.gp_access_data.values
-                             if t_index_start <= t_index <= t_index_end]
-        raw_coverage_data.sort(key=lambda a : a[0])
-
-        # initiate accestimes 
-        access_opportunities = {}
-        ground_points = {}
-        
-        for data in raw_coverage_data:
-            t_img = data[orbitdata_columns.index('time index')]
-            grid_index = data[orbitdata_columns.index('grid index')]
-            gp_index = data[orbitdata_columns.index('GP index')]
-            lat = data[orbitdata_columns.index('lat [deg]')]
-            lon = data[orbitdata_columns.index('lon [deg]')]
-            instrument = data[orbitdata_columns.index('instrument')]
-            look_angle = data[orbitdata_columns.index('look angle [deg]')]
-            
-            # initialize dictionaries if needed
-            if grid_index not in access_opportunities:
-                access_opportunities[grid_index] = {}
-                ground_points[grid_index] = {}
-            if gp_index not in access_opportunities[grid_index]:
-                access_opportunities[grid_index][gp_index] = {instr.name : [] 
-                                                        for instr in specs.instrument}
-                ground_points[grid_index][gp_index] = (lat, lon)
-
-            # compile time interval information 
-            found = False
-            for interval, t, th in access_opportunities[grid_index][gp_index][instrument]:
-                interval : TimeInterval
-                t : list
-                th : list
-
-                if (   interval.is_during(t_img - orbitdata.time_step) 
-                    or interval.is_during(t_img + orbitdata.time_step)):
-                    interval.extend(t_img)
-                    t.append(t_img)
-                    th.append(look_angle)
-                    found = True
-                    break                        
-
-            if not found:
-                access_opportunities[grid_index][gp_index][instrument].append([TimeInterval(t_img, t_img), [t_img], [look_angle]])
-
-        # convert to `list`
-        access_opportunities = [    (grid_index, gp_index, instrument, interval, t, th)
-                                    for grid_index in access_opportunities
-                                    for gp_index in access_opportunities[grid_index]
-                                    for instrument in access_opportunities[grid_index][gp_index]
-                                    for interval, t, th in access_opportunities[grid_index][gp_index][instrument]
-                                ]
-                
-        # return access times and grid information
-        return access_opportunities, ground_points
+
+        # compile access intervals from the agent's shared access opportunity provider
+        provider : AccessOpportunityProvider = AccessOpportunityProvider.get(orbitdata)
+        return provider.get_access_opportunities(t_start, t_end, [instr.name for instr in specs.instrument])
 
 class AbstractReplanner(AbstractPlanner):
     """ Repairs plans previously constructed by another planner """
@@ -8,6 +8,7 @@ from dmas.utils import runtime_tracker
 
 from chess3d.agents.actions import ObservationAction
 from chess3d.agents.orbitdata import OrbitData
+from chess3d.agents.planning.feasibility import ManeuverFeasibility
 from chess3d.agents.planning.planners.consensus.bids import Bid
 from chess3d.agents.planning.planners.consensus.consensus import AbstractConsensusReplanner
 from chess3d.agents.science.requests import MeasurementRequest
@@ -19,9 +20,21 @@ class ACBBAPlanner(AbstractConsensusReplanner):
                  max_bundle_size: int = 1, 
                  replan_threshold: int = 1,
                  planning_horizon: float = np.Inf, 
+                 search_strategy : str = 'bfs',
+                 beam_width : int = 3,
+                 memoize : bool = True,
+                 batch_bids : bool = False,
                  debug : bool = False,
                  logger: Logger = None) -> None:
-        super().__init__(max_bundle_size, replan_threshold, planning_horizon, debug, logger)
+        super().__init__(max_bundle_size, 
+                         replan_threshold, 
+                         planning_horizon, 
+                         search_strategy, 
+                         beam_width, 
+                         memoize, 
+                         batch_bids,
+                         debug, 
+                         logger)
 
     @runtime_tracker    
     def _generate_bids_from_request(self, 
@@ -150,13 +163,32 @@ class ACBBAPlanner(AbstractConsensusReplanner):
         else:
             t_start = max(state.t, req.t_start)
 
-        accesses = [(t_img*orbitdata.time_step, th_img) 
-                        for t_img,_,_,lat,lon,_,th_img,_,_,_,instrument,_ in orbitdata.gp_access_data.values
-                        if  abs(req.target[0] - lat) <= 1e-3
-                        and abs(req.target[1] - lon) <= 1e-3
-                        and t_start <= t_img*orbitdata.time_step <= req.t_end
-                        and instrument == main_measurement]
-        accesses.sort()
+        accesses = list(zip(*orbitdata.get_target_accesses(req.target[0], req.target[1], main_measurement, t_start, req.t_end)))
+
+        if isinstance(state, SatelliteAgentState) and accesses:
+            # check the rest of the path once; only transitions to and from the proposed observation change between accesses
+            other_elements = [*proposed_path[:j], *proposed_path[j+1:]]
+            if any([t_img < 0.0 for _,_,t_img,*_ in other_elements]): return -1, np.NAN
+
+            other_observations = [ObservationAction(path_main_measurement, path_req.target, th_img, t_img)
+                                  for path_req, path_main_measurement, t_img, th_img, _ in other_elements]
+            feasibility : ManeuverFeasibility = self.get_maneuver_feasibility(specs)
+            other_feasibility = feasibility.calc_path_feasibility(state, other_observations)
+
+            # the transition into the element following the proposed observation is checked separately
+            if not all([feasible if k != j else other_observations[k].instrument_name in feasibility.instruments
+                        for k, feasible in enumerate(other_feasibility)]): 
+                return -1, np.NAN
+
+            # find earliest access that can be inserted into the path
+            for t_img, th_img in accesses:
+                observation = ObservationAction(main_measurement, req.target, th_img, t_img)
+                if feasibility.is_insertion_valid(state, other_observations, observation, j):
+                    # earliest valid path found
+                    return t_img, th_img
+
+            # no valid path was found
+            return -1, np.NAN
         
         # find earliest time that is allowed
         while accesses:
@@ -10,6 +10,7 @@ from chess3d.agents.planning.planners.rewards import RewardGrid
 from chess3d.agents.states import SimulationAgentState
 from chess3d.agents.planning.plan import Plan, Preplan, Replan
 from chess3d.agents.planning.planners.consensus.bids import Bid, BidComparisonResults, RebroadcastComparisonResults
+from chess3d.agents.planning.feasibility import ManeuverFeasibility
 from chess3d.agents.planning.planner import AbstractReplanner
 from chess3d.agents.science.utility import *
 from chess3d.agents.orbitdata import OrbitData
@@ -18,15 +19,42 @@ from chess3d.agents.states import *
 from chess3d.messages import *
 
 class AbstractConsensusReplanner(AbstractReplanner):    
+    # bundle-building search strategies
+    BFS = 'bfs'
+    BRANCH_AND_BOUND = 'branch-and-bound'
+    BEAM = 'beam'
+
     def __init__(self, 
                  max_bundle_size : int = 1,
                  replan_threshold : int = 1,
                  planning_horizon : float = np.Inf,
+                 search_strategy : str = 'bfs',
+                 beam_width : int = 3,
+                 memoize : bool = True,
+                 batch_bids : bool = False,
                  debug : bool = False,
                  logger: logging.Logger = None
                  ) -> None:
+        """
+        ## Consensus Replanner
+
+        #### Arguments:
+            - max_bundle_size (`int`) : maximum number of tasks in an agent's bundle
+            - replan_threshold (`int`) : number of bid changes required to trigger a replan
+            - planning_horizon (`float`) : planning horizon in seconds [s]
+            - search_strategy (`str`) : bundle-building search strategy; `bfs`, `branch-and-bound`, or `beam`
+            - beam_width (`int`) : number of partial paths kept per level when using the `beam` search strategy
+            - memoize (`bool`) : toggle for reusing imaging-time and feasibility checks within a bundle search
+            - batch_bids (`bool`) : toggle for broadcasting a single table with the bids that changed since the last broadcast or respond to other agents' bids instead of one message per bid
+            - logger (`logging.Logger`) : debugging logger
+        """
         super().__init__(debug, logger)
 
+        # check parameters
+        if search_strategy not in [self.BFS, self.BRANCH_AND_BOUND, self.BEAM]:
+            raise ValueError(f'Bundle search strategy `{search_strategy}` not supported.')
+        if beam_width < 1: raise ValueError(f'`beam_width` must be a positive integer. Is {beam_width}.')
+
         # initialize variables
         self.bundle = []
         # self.path = []
@@ -41,11 +69,17 @@ class AbstractConsensusReplanner(AbstractReplanner):
         self.agent_orbitdata : OrbitData = None
         self.preplan : Preplan = None
         self.plan : Plan = None
+        self.broadcasted_bids = {}
+        self.bid_counters = {'received' : 0, 'applied' : 0, 'sent' : 0, 'suppressed' : 0}
 
         # set paremeters
         self.max_bundle_size = max_bundle_size
         self.replan_threshold = replan_threshold
         self.planning_horizon = planning_horizon
+        self.search_strategy = search_strategy
+        self.beam_width = beam_width
+        self.memoize = memoize
+        self.batch_bids = batch_bids
 
     @runtime_tracker
     def update_percepts(self, 
@@ -112,15 +146,24 @@ class AbstractConsensusReplanner(AbstractReplanner):
             # remove fromself.preplan plan
             for preplanned_observation in preplanned_observations:
                 preplanned_observation : ObservationAction
-                self.preplan.actions.remove(preplanned_observation)
+                self.preplan.remove(preplanned_observation)
 
         # check if any new measurement requests have been received
         self.incoming_bids : list[Bid] = self.compile_new_measurement_request_bids(state)
 
         # update incoming bids
-        self.incoming_bids.extend([ Bid.from_dict(msg.bid) 
-                                    for msg in misc_messages 
-                                    if isinstance(msg, MeasurementBidMessage)])
+        received_bids = [ Bid.from_dict(msg.bid) 
+                          for msg in misc_messages 
+                          if isinstance(msg, MeasurementBidMessage)]
+        received_bids.extend([ Bid.from_dict(bid) 
+                               for msg in misc_messages 
+                               if isinstance(msg, MeasurementBidTableMessage)
+                               for bid in msg.bids])
+        self.incoming_bids.extend(received_bids)
+        self.bid_counters['received'] += len(received_bids)
+
+        # record bids shared by this agent's broadcasts that were successfully completed
+        self.__record_completed_broadcasts(state, completed_actions)
 
         # check if any request refers to an action in the pre-plan
         for req in incoming_reqs:
@@ -135,7 +178,7 @@ class AbstractConsensusReplanner(AbstractReplanner):
             
             # remove from pre-plan
             for observation in matching_planned_observations: 
-                self.preplan.actions.remove(observation)
+                self.preplan.remove(observation)
         
     def _compile_completed_observations(self, 
                                         completed_actions : list, 
@@ -344,7 +387,10 @@ class AbstractConsensusReplanner(AbstractReplanner):
                                 if isinstance(action, ObservationAction)]
         planned_observations.sort(key=lambda a : a.t_start)
 
-        # combine observation list
+        # get maneuver feasibility service
+        feasibility : ManeuverFeasibility = self.get_maneuver_feasibility(specs)
+
+        # combine observation list; every observation is only appended to a sequence already known to be valid
         observations = []
         while proposed_observations and planned_observations:
             # get next actions in the lists
@@ -359,7 +405,7 @@ class AbstractConsensusReplanner(AbstractReplanner):
                 temp_observations.append(planned_observation)
 
             # check if the temporary observation sequence is valid
-            if self.is_observation_path_valid(state, specs, temp_observations):
+            if feasibility.is_insertion_valid(state, observations, temp_observations[-1], len(observations)):
                 # is valid; remove added action from queue
                 if proposed_observation.t_start <= planned_observation.t_start:
                     observations.append(proposed_observations.pop(0))
@@ -392,7 +438,7 @@ class AbstractConsensusReplanner(AbstractReplanner):
             temp_observations.append(proposed_observation)  
 
             # check if the temporary observation sequence is valid
-            if self.is_observation_path_valid(state, specs, temp_observations):
+            if feasibility.is_insertion_valid(state, observations, temp_observations[-1], len(observations)):
                 # is valid; remove added action from queue
                 observations.append(proposed_observations.pop(0))
             else:
@@ -410,7 +456,7 @@ class AbstractConsensusReplanner(AbstractReplanner):
             temp_observations.append(planned_observation) 
 
             # check if the temporary observation sequence is valid
-            if self.is_observation_path_valid(state, specs, temp_observations):
+            if feasibility.is_insertion_valid(state, observations, temp_observations[-1], len(observations)):
                 # is valid; check if already being observed:
                 if (    observations
                     and abs(observations[-1].target[0]-planned_observation.target[0]) <= 1e-3
@@ -471,13 +517,34 @@ class AbstractConsensusReplanner(AbstractReplanner):
         # find best path for broadcasts
         relay_path, t_start = self._create_broadcast_path(state, orbitdata, state.t)       
 
-        # schedule bid re-broadcast and planner changes
-        bids_out = [MeasurementBidMessage(state.agent_name, state.agent_name, bid_to_rebroadcast.to_dict(), path=relay_path) 
-                    for req_id in bids 
-                    for _, bid_to_rebroadcast in bids[req_id].items() 
-                    if bid_to_rebroadcast is not None
-                    and t_start >=0]
-        broadcasts.extend([BroadcastMessageAction(msg.to_dict(), t_start) for msg in bids_out])
+        if self.batch_bids:
+            # bids queued by the consensus phase respond to other agents' bids and are always shared
+            responses = {(bid.req_id, bid.main_measurement) for bid in self.bids_to_rebroadcasts}
+
+            # only share planner changes that differ from their last broadcast
+            latest_bids = [bid_to_rebroadcast 
+                           for req_id in bids 
+                           for _, bid_to_rebroadcast in bids[req_id].items() 
+                           if bid_to_rebroadcast is not None]
+            bids_out = [bid for bid in latest_bids 
+                        if (bid.req_id, bid.main_measurement) in responses
+                        or self.broadcasted_bids.get((bid.req_id, bid.main_measurement), None) != self.__bid_signature(bid)]
+            self.bid_counters['suppressed'] += len(latest_bids) - len(bids_out)
+
+            # schedule a single bid table broadcast; bids are recorded as shared once the broadcast is completed
+            if bids_out and 0 <= t_start < np.Inf:
+                msg = MeasurementBidTableMessage(state.agent_name, state.agent_name, 
+                                                 [bid.to_dict() for bid in bids_out], 
+                                                 path=relay_path)
+                broadcasts.append(BroadcastMessageAction(msg.to_dict(), t_start))
+        else:
+            # schedule bid re-broadcast and planner changes
+            bids_out = [MeasurementBidMessage(state.agent_name, state.agent_name, bid_to_rebroadcast.to_dict(), path=relay_path) 
+                        for req_id in bids 
+                        for _, bid_to_rebroadcast in bids[req_id].items() 
+                        if bid_to_rebroadcast is not None
+                        and t_start >=0]
+            broadcasts.extend([BroadcastMessageAction(msg.to_dict(), t_start) for msg in bids_out])
 
         # reset broadcast list
         self.bids_to_rebroadcasts = []
@@ -487,6 +554,26 @@ class AbstractConsensusReplanner(AbstractReplanner):
         
         return broadcasts
 
+    def __record_completed_broadcasts(self, state : SimulationAgentState, completed_actions : list) -> None:
+        """ Records the bids shared by this agent's bid broadcasts that were successfully completed """
+        for action in completed_actions:
+            if not isinstance(action, BroadcastMessageAction) or action.msg.get('src', None) != state.agent_name:
+                continue
+
+            if action.msg.get('msg_type', None) == SimulationMessageTypes.MEASUREMENT_BID.value:
+                self.bid_counters['sent'] += 1
+
+            elif action.msg.get('msg_type', None) == SimulationMessageTypes.MEASUREMENT_BID_TABLE.value:
+                for bid in action.msg['bids']:
+                    bid : Bid = Bid.from_dict(bid)
+                    self.broadcasted_bids[(bid.req_id, bid.main_measurement)] = self.__bid_signature(bid)
+                self.bid_counters['sent'] += len(action.msg['bids'])
+
+    def __bid_signature(self, bid : Bid) -> tuple:
+        """ Returns the values of a bid that are shared with other agents. Undefined values are normalized so that they can be compared. """
+        return tuple(None if isinstance(value, float) and np.isnan(value) else value 
+                     for value in bid.to_dict().values())
+
     @runtime_tracker
     def _compile_broadcast_bids(self, planner_changes : list) -> list:        
         """ Compiles changes in bids from consensus and planning phase and returns a list of the most updated bids """
@@ -712,13 +799,16 @@ class AbstractConsensusReplanner(AbstractReplanner):
         changes = []
         rebroadcasts = []
 
+        # index known requests once for the whole batch of incoming bids
+        known_reqs = {req.id : req for req in self.known_reqs}
+
         for their_bid in tqdm(bids_received,
                               desc=f'{state.agent_name}-CONSENSUS: Comparing bids',
                               leave=False):
             their_bid : Bid            
             
             # get matching request
-            req : MeasurementRequest = self._get_matching_request(their_bid.req_id)
+            req : MeasurementRequest = known_reqs.get(their_bid.req_id, None)
 
             # check bids are for new requests
             is_new_req : bool = their_bid.req_id not in results
@@ -753,6 +843,7 @@ class AbstractConsensusReplanner(AbstractReplanner):
                 # changed_bid : Bid = updated_bid if not is_new_req else my_bid
                 # changes.append(changed_bid)
                 changes.append(updated_bid)
+                self.bid_counters['applied'] += 1
 
             if (rebroadcast_result is RebroadcastComparisonResults.REBROADCAST_EMPTY 
                   or rebroadcast_result is RebroadcastComparisonResults.REBROADCAST_SELF):
@@ -891,6 +982,28 @@ class AbstractConsensusReplanner(AbstractReplanner):
                        available_reqs : list, 
                        reward_grid : RewardGrid,
                        orbitdata : OrbitData) -> list:
+        """ Searches for the path of maximum utility that can be built from the available requests """
+        # initialize feasibility memo for this search
+        memo = {} if self.memoize else None
+
+        if self.search_strategy == self.BFS:
+            return self.__generate_path_bfs(state, specs, results, available_reqs, reward_grid, orbitdata, memo)
+        elif self.search_strategy == self.BRANCH_AND_BOUND:
+            return self.__generate_path_branch_and_bound(state, specs, results, available_reqs, reward_grid, orbitdata, memo)
+        elif self.search_strategy == self.BEAM:
+            return self.__generate_path_beam(state, specs, results, available_reqs, reward_grid, orbitdata, memo)
+        else:
+            raise ValueError(f'Bundle search strategy `{self.search_strategy}` not supported.')
+
+    def __generate_path_bfs(self, 
+                            state :SimulationAgentState, 
+                            specs : object, 
+                            results : dict, 
+                            available_reqs : list, 
+                            reward_grid : RewardGrid,
+                            orbitdata : OrbitData,
+                            memo : dict) -> list:
+        """ Exhaustive breadth-first search over every permutation of available requests """
         # count maximum number of paths to be searched
         n_max = 0
         for n in range(1,self.max_bundle_size+1):
@@ -920,30 +1033,17 @@ class AbstractConsensusReplanner(AbstractReplanner):
                 # get next path on the queue
                 path_i : list = queue.get()
 
-                # create potential bids for observations in the path
-                path_bids : list[Bid] = [Bid(req.id, 
-                                            main_measurement, 
-                                            state.agent_name, 
-                                            u_exp, 
-                                            t_img=t_img, 
-                                            th_img=th_img)
-                                        for req,main_measurement,t_img,th_img,u_exp in path_i
-                                        if isinstance(req,MeasurementRequest)]
-                    
+                # evaluate path
+                outbid, path_utility, outbids_competitors \
+                    = self._evaluate_path(state, specs, results, path_i, reward_grid)
+                
                 # check if it out-performs the current best path
-                if any([results[bid.req_id][bid.main_measurement] >= bid
-                        for bid in path_bids]):
+                if outbid:
                     # at least one proposed bid is outbid by existing bid; ignore path
                     continue
-                
-                # calculate path utility 
-                path_utility : float = self.calc_path_utility(state, specs, path_i, reward_grid)
 
                 # check if it outbids competitors
-                if (path_utility > max_path_utility                             # path utility is increased
-                    and all([results[bid.req_id][bid.main_measurement] < bid    # all new bids outbid competitors
-                            for bid in path_bids])
-                    ):
+                if path_utility > max_path_utility and outbids_competitors:
                     # outbids competitors; set new max utility path
                     max_path = [path_element for path_element in path_i]
                     max_path_utility = path_utility
@@ -953,42 +1053,251 @@ class AbstractConsensusReplanner(AbstractReplanner):
                     continue
 
                 # add available requests to the path and place it in the queue
-                path_reqs = [(req, main_measurement) 
-                            for req,main_measurement,*_ in path_i]
-                reqs_to_add = [(req, main_measurement) 
-                            for req, main_measurement in available_reqs
-                            if (req, main_measurement) not in path_reqs
-                            ]
-                
-                for req, main_measurement in reqs_to_add:
-                    req : MeasurementRequest                
-                    # copy current path
-                    path_j = [path_element_i for path_element_i in path_i]
-                    
-                    # add request to path
-                    path_j.append((req, main_measurement, -1, -1))
-                    
-                    # estimate observation time and look angle
-                    t_img,th_img = self.calc_imaging_time(state, specs, path_j, req, main_measurement, orbitdata)
-                    
-                    # check if imaging time was found
-                    if t_img < 0.0: continue # skip
+                for path_j in self._expand_path(state, specs, path_i, available_reqs, reward_grid, orbitdata, memo):
+                    queue.put(path_j)
+
+            # update progress bar with remaining nodes
+            pbar.update(n_max-n_visited)
+
+        # return path of maximum utility
+        return max_path
+    
+    def __generate_path_branch_and_bound(self, 
+                                         state :SimulationAgentState, 
+                                         specs : object, 
+                                         results : dict, 
+                                         available_reqs : list, 
+                                         reward_grid : RewardGrid,
+                                         orbitdata : OrbitData,
+                                         memo : dict) -> list:
+        """ 
+        Depth-first branch-and-bound search. Partial paths are pruned if an admissible upper bound of 
+        the utility of any of their extensions cannot improve on the best path found so far. 
+        """
+        # calculate optimistic reward for every available request
+        max_rewards = {(req.id, main_measurement) : self._estimate_max_reward(state, req, main_measurement, reward_grid, orbitdata)
+                       for req, main_measurement in available_reqs}
+        
+        # calculate reward of every preplanned observation
+        preplan_reward = float(np.sum(reward_grid.estimate_rewards([action for action in self.preplan
+                                                                     if isinstance(action, ObservationAction)])))
+
+        def upper_bound(path : list) -> float:
+            """ upper bound of the utility of any path that starts with `path` """
+            # rewards of requests that can still be added to the path
+            path_reqs = {(req.id, main_measurement) for req, main_measurement, *_ in path}
+            remaining_rewards = sorted([max_reward for key, max_reward in max_rewards.items() 
+                                        if key not in path_reqs], reverse=True)
+            n_remaining = self.max_bundle_size - len(path)
+
+            return (preplan_reward 
+                    + sum([u_exp for *_, u_exp in path])
+                    + sum(remaining_rewards[:n_remaining]))
 
-                    # calculate performance
-                    observation = ObservationAction(main_measurement, req.target, th_img, t_img)
-                    u_exp = reward_grid.estimate_reward(observation)
+        # initialize tree search
+        stack = [(upper_bound([]), [])]
+        max_path = []
+        max_path_utility = 0.0
 
-                    # update values
-                    path_j[-1] = (req, main_measurement, t_img, th_img, u_exp)
+        while stack:
+            # get next path on the stack
+            bound, path_i = stack.pop()
 
-                    # only add to queue if the path can be performed
-                    if self.is_task_path_valid(state, specs, path_j, orbitdata): queue.put(path_j)
+            # check if path can still improve on the best path found 
+            if bound <= max_path_utility: continue
 
-            # update progress bar with remaining nodes
-            pbar.update(n_max-n_visited)
+            # evaluate path
+            outbid, path_utility, outbids_competitors \
+                = self._evaluate_path(state, specs, results, path_i, reward_grid)
+            
+            if outbid:
+                # at least one proposed bid is outbid by existing bid; ignore path
+                continue
+
+            # check if it outbids competitors
+            if path_utility > max_path_utility and outbids_competitors:
+                # outbids competitors; set new max utility path
+                max_path = [path_element for path_element in path_i]
+                max_path_utility = path_utility
+
+            # check if there is room to be added to the bundle
+            if len(path_i) >= self.max_bundle_size:
+                continue
+
+            # bound extended paths; most promising paths are explored first
+            children = [(upper_bound(path_j), path_j) 
+                        for path_j in self._expand_path(state, specs, path_i, available_reqs, reward_grid, orbitdata, memo)]
+            children.sort(key=lambda child : child[0])
+            stack.extend([child for child in children if child[0] > max_path_utility])
 
         # return path of maximum utility
         return max_path
+    
+    def __generate_path_beam(self, 
+                             state :SimulationAgentState, 
+                             specs : object, 
+                             results : dict, 
+                             available_reqs : list, 
+                             reward_grid : RewardGrid,
+                             orbitdata : OrbitData,
+                             memo : dict) -> list:
+        """ Level-wise beam search keeping only the `beam_width` highest-utility partial paths on every level """
+        # initialize search
+        frontier = [[]]
+        max_path = []
+        max_path_utility = 0.0
+
+        while frontier:
+            # evaluate paths in this level
+            beam = []
+            for path_i in frontier:
+                outbid, path_utility, outbids_competitors \
+                    = self._evaluate_path(state, specs, results, path_i, reward_grid)
+
+                if outbid:
+                    # at least one proposed bid is outbid by existing bid; ignore path
+                    continue
+
+                # check if it outbids competitors
+                if path_utility > max_path_utility and outbids_competitors:
+                    # outbids competitors; set new max utility path
+                    max_path = [path_element for path_element in path_i]
+                    max_path_utility = path_utility
+
+                # check if there is room to be added to the bundle
+                if len(path_i) < self.max_bundle_size:
+                    beam.append((path_utility, path_i))
+
+            # keep best paths in this level
+            beam.sort(key=lambda a : a[0], reverse=True)
+            
+            # expand paths into the next level
+            frontier = [path_j 
+                        for _, path_i in beam[:self.beam_width]
+                        for path_j in self._expand_path(state, specs, path_i, available_reqs, reward_grid, orbitdata, memo)]
+
+        # return path of maximum utility
+        return max_path
+
+    def _evaluate_path(self, 
+                       state : SimulationAgentState, 
+                       specs : object, 
+                       results : dict, 
+                       path : list, 
+                       reward_grid : RewardGrid
+                       ) -> tuple:
+        """
+        Evaluates a candidate path against the current results
+
+        ### Returns:
+            - outbid (`bool`): whether any of the proposed bids is outbid by an existing bid
+            - path_utility (`float`): utility of the path merged with the current preplan
+            - outbids_competitors (`bool`): whether all proposed bids outbid existing bids
+        """
+        # create potential bids for observations in the path
+        path_bids : list[Bid] = [Bid(req.id, 
+                                    main_measurement, 
+                                    state.agent_name, 
+                                    u_exp, 
+                                    t_img=t_img, 
+                                    th_img=th_img)
+                                for req,main_measurement,t_img,th_img,u_exp in path
+                                if isinstance(req,MeasurementRequest)]
+            
+        # check if it out-performs the current best path
+        if any([results[bid.req_id][bid.main_measurement] >= bid
+                for bid in path_bids]):
+            return True, 0.0, False
+        
+        # calculate path utility 
+        path_utility : float = self.calc_path_utility(state, specs, path, reward_grid)
+
+        # check if it outbids competitors
+        outbids_competitors = all([results[bid.req_id][bid.main_measurement] < bid 
+                                   for bid in path_bids])
+
+        return False, path_utility, outbids_competitors
+
+    def _expand_path(self, 
+                     state : SimulationAgentState, 
+                     specs : object, 
+                     path_i : list, 
+                     available_reqs : list, 
+                     reward_grid : RewardGrid,
+                     orbitdata : OrbitData,
+                     memo : dict = None
+                     ) -> list:
+        """ 
+        Returns every valid path obtained by appending one available request to `path_i`. 
+        
+        The imaging time and feasibility of an appended request only depend on the last task in 
+        the path and its imaging time. If a `memo` is given, these are stored and reused.
+        """
+        # add available requests to the path
+        path_reqs = [(req, main_measurement) 
+                    for req,main_measurement,*_ in path_i]
+        reqs_to_add = [(req, main_measurement) 
+                    for req, main_measurement in available_reqs
+                    if (req, main_measurement) not in path_reqs
+                    ]
+        
+        # key describing the last task in the path
+        last_task = (path_i[-1][0].id, *path_i[-1][1:4]) if path_i else None
+        
+        paths = []
+        for req, main_measurement in reqs_to_add:
+            req : MeasurementRequest                
+
+            # check memo
+            key = (last_task, req.id, main_measurement)
+            if memo is not None and key in memo:
+                path_element = memo[key]
+                if path_element is not None: paths.append([*path_i, path_element])
+                continue
+
+            # copy current path
+            path_j = [path_element_i for path_element_i in path_i]
+            
+            # add request to path
+            path_j.append((req, main_measurement, -1, -1))
+            
+            # estimate observation time and look angle
+            t_img,th_img = self.calc_imaging_time(state, specs, path_j, req, main_measurement, orbitdata)
+            
+            # check if imaging time was found
+            if t_img < 0.0: 
+                if memo is not None: memo[key] = None
+                continue # skip
+
+            # calculate performance
+            observation = ObservationAction(main_measurement, req.target, th_img, t_img)
+            u_exp = reward_grid.estimate_reward(observation)
+
+            # update values
+            path_j[-1] = (req, main_measurement, t_img, th_img, u_exp)
+
+            # only add to paths if the path can be performed
+            valid = self.is_task_path_valid(state, specs, path_j, orbitdata)
+            if valid: paths.append(path_j)
+            if memo is not None: memo[key] = path_j[-1] if valid else None
+        
+        return paths
+    
+    @runtime_tracker
+    def _estimate_max_reward(self, 
+                             state : SimulationAgentState, 
+                             req : MeasurementRequest, 
+                             main_measurement : str, 
+                             reward_grid : RewardGrid, 
+                             orbitdata : OrbitData
+                             ) -> float:
+        """ Returns the maximum reward obtainable from observing a request at any of its future access times """
+        t_start = max(state.t, req.t_start)
+        t_imgs, th_imgs = orbitdata.get_target_accesses(req.target[0], req.target[1], main_measurement, t_start, req.t_end)
+        observations = [ObservationAction(main_measurement, req.target, th_img, t_img)
+                        for t_img,th_img in zip(t_imgs, th_imgs)]
+        
+        return float(np.max(reward_grid.estimate_rewards(observations))) if observations else 0.0
         
     @runtime_tracker
     def calc_path_utility(self, 
@@ -1025,21 +1334,12 @@ class AbstractConsensusReplanner(AbstractReplanner):
         # sort biddable requests by earliest access times
         biddable_reqs_accesses = []
         for req,main_measurement in biddable_reqs:
-            # find access times for a given request
-            req_accesses = [
-                (t_img*orbitdata.time_step,req.id,req,main_measurement)
-                for t_img,_,_,lat,lon,*_,instrument,_ in orbitdata.gp_access_data.values
-                if req.t_start <= t_img*orbitdata.time_step <= req.t_end
-                and instrument == main_measurement
-                and abs(lat - req.target[0]) <= 1e-3
-                and abs(lon - req.target[1]) <= 1e-3
-            ]
-
-            # sort in ascending order 
-            req_accesses.sort()
+            # find access times for a given request; sorted in ascending order
+            t_imgs, _ = orbitdata.get_target_accesses(req.target[0], req.target[1], main_measurement, req.t_start, req.t_end)
+            if len(t_imgs) == 0: continue
 
             # save only the earliest access time to request target
-            biddable_reqs_accesses.append(req_accesses.pop(0))
+            biddable_reqs_accesses.append((t_imgs[0],req.id,req,main_measurement))
         
         # sort requests by ascending access time 
         biddable_reqs_accesses.sort()
@@ -1059,16 +1359,10 @@ class AbstractConsensusReplanner(AbstractReplanner):
                      ) -> bool:
         """ Checks if an agent can access the location of a measurement request """
         if isinstance(state, SatelliteAgentState):
-            t_arrivals = [t_img*orbitdata.time_step 
-                          for t_img,_,_,lat,lon,*_,instrument,_ in orbitdata.gp_access_data.values
-                          if req.t_start <= t_img*orbitdata.time_step <= req.t_end
-                          and t_img <= self.preplan.t_next
-                          and instrument in req.observation_types
-                          and abs(lat - req.target[0]) <= 1e-3
-                          and abs(lon - req.target[1]) <= 1e-3
-                          ]
-            
-            return len(t_arrivals) > 0
+            # access time indeces are bounded by the time of the next planning cycle
+            t_end = min(req.t_end, self.preplan.t_next * orbitdata.time_step)
+            return any([len(orbitdata.get_target_accesses(req.target[0], req.target[1], instrument, req.t_start, t_end)[0]) > 0
+                        for instrument in req.observation_types])
         else:
             raise NotImplementedError(f"listing of available requests for agents with state of type {type(state)} not yet supported.")
 
@@ -6,7 +6,9 @@ from dmas.utils import runtime_tracker
 from dmas.clocks import *
 
 from chess3d.agents.actions import ObservationAction
-from chess3d.agents.orbitdata import OrbitData, TimeInterval
+from chess3d.agents.orbitdata import OrbitData
+from chess3d.agents.planning.feasibility import ManeuverFeasibility
+from chess3d.agents.planning.opportunities import AccessOpportunityProvider
 from chess3d.agents.planning.plan import Plan, Replan
 from chess3d.agents.planning.planners.consensus.acbba import ACBBAPlanner
 from chess3d.agents.planning.planners.consensus.bids import Bid
@@ -260,66 +262,10 @@ class DynamicProgrammingACBBAReplanner(ACBBAPlanner):
         # define planning horizon
         t_start = state.t
         t_end = self.preplan.t_next
-        t_index_start = t_start / orbitdata.time_step
-        t_index_end = t_end / orbitdata.time_step
-
-        # compile coverage data
-        orbitdata_columns : list = list(orbitdata.gp_access_data.columns.values)
-        raw_coverage_data = [(t_index*orbitdata.time_step, *_)
-                             for t_index, *_ in orbitdata.gp_access_data.values
-                             if t_index_start < t_index <= t_index_end]
-        raw_coverage_data.sort(key=lambda a : a[0])
-
-        # initiate accestimes 
-        access_opportunities = {}
-        ground_points = {}
-        
-        for data in raw_coverage_data:
-            t_img = data[orbitdata_columns.index('time index')]
-            grid_index = data[orbitdata_columns.index('grid index')]
-            gp_index = data[orbitdata_columns.index('GP index')]
-            lat = data[orbitdata_columns.index('lat [deg]')]
-            lon = data[orbitdata_columns.index('lon [deg]')]
-            instrument = data[orbitdata_columns.index('instrument')]
-            look_angle = data[orbitdata_columns.index('look angle [deg]')]
-            
-            # initialize dictionaries if needed
-            if grid_index not in access_opportunities:
-                access_opportunities[grid_index] = {}
-                ground_points[grid_index] = {}
-            if gp_index not in access_opportunities[grid_index]:
-                access_opportunities[grid_index][gp_index] = {instr.name : [] 
-                                                        for instr in specs.instrument}
-                ground_points[grid_index][gp_index] = (lat, lon)
-
-            # compile time interval information 
-            found = False
-            for interval, t, th in access_opportunities[grid_index][gp_index][instrument]:
-                interval : TimeInterval
-                t : list
-                th : list
-
-                if (   interval.is_during(t_img - orbitdata.time_step) 
-                    or interval.is_during(t_img + orbitdata.time_step)):
-                    interval.extend(t_img)
-                    t.append(t_img)
-                    th.append(look_angle)
-                    found = True
-                    break                        
-
-            if not found:
-                access_opportunities[grid_index][gp_index][instrument].append([TimeInterval(t_img, t_img), [t_img], [look_angle]])
-
-        # convert to `list`
-        access_opportunities = [    (grid_index, gp_index, instrument, interval, t, th)
-                                    for grid_index in access_opportunities
-                                    for gp_index in access_opportunities[grid_index]
-                                    for instrument in access_opportunities[grid_index][gp_index]
-                                    for interval, t, th in access_opportunities[grid_index][gp_index][instrument]
-                                ]
-                
-        # return access times and grid information
-        return access_opportunities, ground_points
+
+        # compile access intervals from the agent's shared access opportunity provider; excludes accesses at the current time
+        provider : AccessOpportunityProvider = AccessOpportunityProvider.get(orbitdata)
+        return provider.get_access_opportunities(t_start, t_end, [instr.name for instr in specs.instrument], include_start=False)
         
     @runtime_tracker
     def populate_adjacency_matrix(self, 
@@ -337,41 +283,38 @@ class DynamicProgrammingACBBAReplanner(ACBBAPlanner):
         curr_target = [lat_curr,lon_curr,0.0]
 
         # get any possibly prior observation
-        prev_opportunities : list[tuple] = [prev_opportunity for prev_opportunity in access_opportunities
-                                            if prev_opportunity[3].end <= curr_opportunity[3].end
-                                            and prev_opportunity != curr_opportunity
-                                            ]
-
-        # construct adjacency matrix
-        for prev_opportunity in prev_opportunities:
-            prev_opportunity : tuple
-
-            # get previous observation opportunity's target 
-            lat_prev,lon_prev = ground_points[prev_opportunity[0]][prev_opportunity[1]]
-            prev_target = [lat_prev,lon_prev,0.0]
-
-            # assume earliest observation time from previous observation
-            earliest_prev_observation = ObservationAction(prev_opportunity[2], 
-                                                        prev_target, 
-                                                        prev_opportunity[5][0], 
-                                                        prev_opportunity[4][0])
-            
-            # check if observation can be reached from previous observation
-            adjacent = any([self.is_observation_path_valid(state, 
-                                                        specs, 
-                                                        [earliest_prev_observation,
-                                                            ObservationAction(curr_opportunity[2], 
-                                                                            curr_target, 
-                                                                            curr_opportunity[5][k], 
-                                                                            curr_opportunity[4][k])])
-                            for k in range(len(curr_opportunity[4]))
-                            ])                               
-
-            # update adjacency matrix
-            adjacency[access_opportunities.index(prev_opportunity)][j] = adjacent
-
-            # update progress bar
-            if pbar is not None: pbar.update(1)    
+        prev_indeces : list[int] = [i for i,prev_opportunity in enumerate(access_opportunities)
+                                    if prev_opportunity[3].end <= curr_opportunity[3].end
+                                    and prev_opportunity != curr_opportunity
+                                    ]
+        if not prev_indeces: return
+
+        # assume earliest observation time from previous observations
+        earliest_prev_observations = [ObservationAction(access_opportunities[i][2], 
+                                                        [*ground_points[access_opportunities[i][0]][access_opportunities[i][1]], 0.0], 
+                                                        access_opportunities[i][5][0], 
+                                                        access_opportunities[i][4][0])
+                                      for i in prev_indeces]
+        
+        # calculate all possible observation actions for the current observation opportunity
+        curr_observations = [ObservationAction(curr_opportunity[2], 
+                                               curr_target, 
+                                               curr_opportunity[5][k], 
+                                               curr_opportunity[4][k])
+                             for k in range(len(curr_opportunity[4]))]
+        
+        # check if observation can be reached from previous observations
+        feasibility : ManeuverFeasibility = self.get_maneuver_feasibility(specs)
+        adjacent = feasibility.calc_state_feasibility(state, earliest_prev_observations) \
+                    & np.any(feasibility.calc_feasibility_matrix(earliest_prev_observations, curr_observations) 
+                             & np.array([curr_opportunity[2] in feasibility.instruments]), axis=1)
+
+        # update adjacency matrix
+        for i, adjacent_i in zip(prev_indeces, adjacent):
+            adjacency[i][j] = bool(adjacent_i)
+
+        # update progress bar
+        if pbar is not None: pbar.update(len(prev_indeces))
 
     def update_results(self, 
                       state : SimulationAgentState, 
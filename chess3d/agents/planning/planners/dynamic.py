@@ -2,6 +2,7 @@ from logging import Logger
 from orbitpy.util import Spacecraft
 from tqdm import tqdm
 import concurrent.futures
+import numpy as np
 
 from dmas.clocks import ClockConfig
 from dmas.utils import runtime_tracker
@@ -16,19 +17,107 @@ from chess3d.agents.orbitdata import OrbitData
 from chess3d.agents.planning.planner import AbstractPreplanner
 from chess3d.messages import *
 
+def find_window_predecessors(t_0 : np.ndarray, 
+                             th_0 : np.ndarray,
+                             t0_order : np.ndarray,
+                             t0_sorted : np.ndarray,
+                             candidate_bounds : np.ndarray,
+                             candidate_t : np.ndarray,
+                             candidate_th : np.ndarray,
+                             max_slew_rate : float,
+                             dt_max_maneuver : float,
+                             j_start : int,
+                             j_end : int
+                             ) -> list:
+    """
+    Finds the observation opportunities that may precede each opportunity `j` in `[j_start, j_end)` 
+    and whose feasibility depends on the slew constraint. Opportunities with an earliest observation 
+    time earlier than `dt_max_maneuver` before any candidate observation of `j` are always feasible 
+    and are therefore not listed.
+
+    Defined at module level so it may be evaluated by a process pool.
+
+    ### Arguments:
+        - t_0 (`np.ndarray`): earliest observation time of every opportunity
+        - th_0 (`np.ndarray`): look angle of the earliest observation of every opportunity
+        - t0_order (`np.ndarray`): opportunity indeces sorted by `t_0`
+        - t0_sorted (`np.ndarray`): values of `t_0` sorted in ascending order
+        - candidate_bounds (`np.ndarray`): bounds of each opportunity's candidate observations in the candidate arrays
+        - candidate_t (`np.ndarray`): observation time of every candidate observation 
+        - candidate_th (`np.ndarray`): look angle of every candidate observation
+        - max_slew_rate (`float`): maximum slew rate of the agent in [deg/s]
+        - dt_max_maneuver (`float`): longest possible maneuver time in [s]
+        - j_start (`int`): first opportunity to be evaluated
+        - j_end (`int`): last opportunity to be evaluated (not inclusive)
+        
+    ### Returns:
+        - `list` of arrays containing the predecessor indeces of every evaluated opportunity
+    """
+    predecessors = []
+    for j in range(j_start, j_end):
+        window_predecessors = []
+        for k in range(candidate_bounds[j], candidate_bounds[j+1]):
+            # find opportunities whose earliest observation lies within the maneuver window
+            i_lo = np.searchsorted(t0_sorted, candidate_t[k] - dt_max_maneuver, side='right')
+            i_hi = np.searchsorted(t0_sorted, candidate_t[k], side='right')
+            window : np.ndarray = t0_order[i_lo:i_hi]
+
+            # check slew constraint
+            dt_measurements = candidate_t[k] - t_0[window]
+            dt_maneuvers = np.abs(candidate_th[k] - th_0[window]) / max_slew_rate
+            window_predecessors.append(window[dt_maneuvers <= dt_measurements + 1e-6])
+
+        # only opportunities ordered before `j` can precede it
+        window_predecessors = np.unique(np.concatenate(window_predecessors)) if window_predecessors else np.array([], dtype=int)
+        predecessors.append(window_predecessors[window_predecessors < j])
+
+    return predecessors
+
 class DynamicProgrammingPlanner(AbstractPreplanner):
+    DEFAULT = 'default'
+    MATRIX = 'matrix'
+
     def __init__(self, 
                  sharing : bool = False,
                  horizon: float = np.Inf, 
                  period : float = np.Inf, 
+                 engine : str = 'default',
+                 max_workers : int = 1,
                  debug : bool = False,
                  logger: Logger = None
                  ) -> None:
+        """
+        ## Dynamic Programming Preplanner
+
+        #### Arguments:
+            - sharing (`bool`) : toggle for sharing plans
+            - horizon (`float`) : planning horizon in seconds [s]
+            - period (`float`) : period of replanning in seconds [s]
+            - engine (`str`) : DP implementation to be used; `default` or `matrix` for the array-based implementation
+            - max_workers (`int`) : number of processes used to build the adjacency of the `matrix` engine
+            - logger (`logging.Logger`) : debugging logger
+        """
         super().__init__(horizon, period, debug, logger)
 
+        # check parameters
+        if engine not in [self.DEFAULT, self.MATRIX]: raise ValueError(f'DP engine `{engine}` not supported.')
+        if max_workers < 1: raise ValueError(f'`max_workers` must be a positive integer. Is {max_workers}.')
+
         # toggle for sharing plans
         self.sharing = sharing 
 
+        # set engine parameters
+        self.engine = engine
+        self.max_workers = max_workers
+
+        # process pool used to build the adjacency of the `matrix` engine; created on first use
+        self.executor : concurrent.futures.ProcessPoolExecutor = None
+
+    def __del__(self) -> None:
+        # release the worker processes of the adjacency process pool
+        if getattr(self, 'executor', None) is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
     @runtime_tracker
     def populate_adjacency_matrix(self, 
                                   state : SimulationAgentState, 
@@ -95,6 +184,9 @@ class DynamicProgrammingPlanner(AbstractPreplanner):
         elif not isinstance(specs, Spacecraft):
             raise ValueError(f'`specs` needs to be of type `{Spacecraft}` for agents with states of type `{SatelliteAgentState}`')
 
+        if self.engine == self.MATRIX:
+            return self._schedule_observations_matrix(state, specs, reward_grid, orbitdata)
+
         t_0 = time.perf_counter()
         t_prev = t_0
 
@@ -102,14 +194,13 @@ class DynamicProgrammingPlanner(AbstractPreplanner):
         access_opportunities, ground_points = self.calculate_access_opportunities(state, specs, orbitdata)
         access_opportunities : list; ground_points : dict
 
-        # sort by observation time
-        access_opportunities.sort(key=lambda a: a[3])
+        # sort by end of access interval so that every predecessor is evaluated before its successors
+        access_opportunities.sort(key=lambda a: (a[3].end, a[3].start))
 
         # initiate results arrays
         t_imgs = [np.NAN for _ in access_opportunities]
         th_imgs = [np.NAN for _ in access_opportunities]
-        rewards = [0.0 for _ in access_opportunities]
-        cumulative_rewards = [0.0 for _ in access_opportunities]
+        cumulative_rewards = [-np.Inf for _ in access_opportunities]
         preceeding_observations = [np.NAN for _ in access_opportunities]
         adjancency = [[False for _ in access_opportunities] for _ in access_opportunities]
 
@@ -152,15 +243,13 @@ class DynamicProgrammingPlanner(AbstractPreplanner):
                                                         curr_opportunity[4][k])
                                          for k in range(len(curr_opportunity[4]))]
 
-            # update observation time and look angle
-            if not prev_opportunities: # there are no previous possible observations
-                possible_observations = [possible_observation for possible_observation in possible_observations
-                                         if self.is_observation_path_valid(state, specs, [possible_observation])]
-
-                if possible_observations:
-                    t_imgs[j] = possible_observations[0].t_start
-                    th_imgs[j] = possible_observations[0].look_angle
-                    rewards[j] = reward_grid.estimate_reward(possible_observations[0])
+            # start a new sequence from the agent's current state
+            reachable_observations = [possible_observation for possible_observation in possible_observations
+                                      if self.is_observation_path_valid(state, specs, [possible_observation])]
+            if reachable_observations:
+                t_imgs[j] = reachable_observations[0].t_start
+                th_imgs[j] = reachable_observations[0].look_angle
+                cumulative_rewards[j] = reward_grid.estimate_reward(reachable_observations[0])
             
             for prev_opportunity in prev_opportunities: # there are previous possible observations
                 # get previous observation opportunity
@@ -177,32 +266,28 @@ class DynamicProgrammingPlanner(AbstractPreplanner):
                                                     t_imgs[i])
                 
                 # get possible observation actions from the current observation opportuinty
-                possible_observations = [possible_observation for possible_observation in possible_observations
+                feasible_observations = [possible_observation for possible_observation in possible_observations
                                         if self.is_observation_path_valid(state, specs, [prev_observation, possible_observation])]
 
                 # check if an observation is possible
-                if possible_observations: 
-                    # update imaging time, look angle, and reward
-                    t_imgs[j] = possible_observations[0].t_start
-                    th_imgs[j] = possible_observations[0].look_angle
-                    rewards[j] = reward_grid.estimate_reward(possible_observations[0])
-
-                    # update results
-                    if cumulative_rewards[i] + rewards[j] > cumulative_rewards[j] and not np.isnan(t_imgs[i]):
-                        cumulative_rewards[j] += cumulative_rewards[i] + rewards[j]
-                        preceeding_observations[j] = i
+                if not feasible_observations: continue
+
+                # update results if the earliest feasible observation extends the best sequence found so far
+                reward = reward_grid.estimate_reward(feasible_observations[0])
+                if cumulative_rewards[i] + reward > cumulative_rewards[j]:
+                    cumulative_rewards[j] = cumulative_rewards[i] + reward
+                    preceeding_observations[j] = i
+                    t_imgs[j] = feasible_observations[0].t_start
+                    th_imgs[j] = feasible_observations[0].look_angle
             
         t_3 = time.perf_counter() - t_prev
         t_prev = time.perf_counter()
 
-        # extract sequence of observations from results
+        # extract sequence of observations from results; ends at the opportunity with the highest cumulative reward
         visited_observation_opportunities = set()
-
-        while preceeding_observations and np.isnan(preceeding_observations[-1]):
-            preceeding_observations.pop()
-        observation_sequence = [len(preceeding_observations)-1] if preceeding_observations else []
+        observation_sequence = [int(np.argmax(cumulative_rewards))] if any(np.isfinite(cumulative_rewards)) else []
         
-        while preceeding_observations and not np.isnan(preceeding_observations[observation_sequence[-1]]):
+        while observation_sequence and not np.isnan(preceeding_observations[observation_sequence[-1]]):
             prev_observation_index = preceeding_observations[observation_sequence[-1]]
             
             if prev_observation_index in visited_observation_opportunities:
@@ -232,6 +317,161 @@ class DynamicProgrammingPlanner(AbstractPreplanner):
         t_f = time.perf_counter() - t_0
         return observations
     
+    @runtime_tracker
+    def populate_adjacency_arrays(self,
+                                  state : SimulationAgentState,
+                                  t_0 : np.ndarray,
+                                  th_0 : np.ndarray,
+                                  candidate_bounds : np.ndarray,
+                                  candidate_t : np.ndarray,
+                                  candidate_th : np.ndarray,
+                                  max_slew_rate : float
+                                  ) -> tuple:
+        """
+        Builds a sparse adjacency representation for a set of time-sorted observation opportunities.
+
+        Opportunity `i` may precede opportunity `j` if `i < j` and one of `j`'s candidate observations can be 
+        reached from `i`'s earliest observation. All opportunities whose earliest observation occurs more than 
+        the longest possible maneuver time before `j`'s last candidate are always adjacent, so only opportunities 
+        within that time window are checked explicitly.
+
+        ### Returns:
+            - t0_order (`np.ndarray`): opportunity indeces sorted by earliest observation time
+            - n_unconditional (`np.ndarray`): number of opportunities in `t0_order` that can always precede each opportunity
+            - window_predecessors (`list`): arrays of additional predecessors for each opportunity
+        """
+        n = len(t_0)
+
+        # sort earliest observation times for sweeping
+        t0_order = np.argsort(t_0, kind='stable')
+        t0_sorted = t_0[t0_order]
+
+        # longest possible maneuver within this set of opportunities
+        look_angles = np.append(candidate_th, state.attitude[0])
+        dt_max_maneuver = (np.max(look_angles) - np.min(look_angles)) / max_slew_rate if n > 0 else 0.0
+
+        # count opportunities that are always able to precede the latest candidate of each opportunity
+        t_last = candidate_t[candidate_bounds[1:] - 1] if n > 0 else np.array([])
+        n_unconditional = np.searchsorted(t0_sorted, t_last - dt_max_maneuver, side='right')
+
+        # check slew constraint for opportunities within the maneuver window of each candidate
+        args = (t_0, th_0, t0_order, t0_sorted, candidate_bounds, candidate_t, candidate_th, max_slew_rate, dt_max_maneuver)
+        if self.max_workers > 1 and n > self.max_workers:
+            # reuse the same worker processes across planning calls
+            if self.executor is None:
+                self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers)
+
+            chunk_bounds = np.linspace(0, n, self.max_workers + 1, dtype=int)
+            futures = [self.executor.submit(find_window_predecessors, *args, chunk_bounds[c], chunk_bounds[c+1])
+                       for c in range(self.max_workers)]
+            window_predecessors = [predecessors 
+                                   for future in futures 
+                                   for predecessors in future.result()]
+        else:
+            window_predecessors = find_window_predecessors(*args, 0, n)
+
+        return t0_order, n_unconditional, window_predecessors
+
+    @runtime_tracker
+    def _schedule_observations_matrix(self,
+                                      state: SatelliteAgentState, 
+                                      specs: Spacecraft, 
+                                      reward_grid: RewardGrid,
+                                      orbitdata: OrbitData
+                                      ) -> list:
+        """ Array-based implementation of the dynamic programming observation scheduler """
+        # compile access times for this planning horizon
+        access_opportunities, ground_points = self.calculate_access_opportunities(state, specs, orbitdata)
+        access_opportunities : list; ground_points : dict
+
+        # sort by end of access interval so that every predecessor is evaluated before its successors
+        access_opportunities.sort(key=lambda a: (a[3].end, a[3].start))
+        n = len(access_opportunities)
+        if n == 0: return []
+
+        # get pointing agility specifications
+        max_slew_rate, _ = self.collect_agility_specs(specs)
+
+        # flatten candidate observations of every opportunity into contiguous arrays
+        candidate_bounds = np.cumsum([0] + [len(opportunity[4]) for opportunity in access_opportunities])
+        candidate_t = np.array([t for opportunity in access_opportunities for t in opportunity[4]], dtype=float)
+        candidate_th = np.array([th for opportunity in access_opportunities for th in opportunity[5]], dtype=float)
+        candidate_actions = [ObservationAction(instrument, [*ground_points[grid_index][gp_index], 0.0], th, t)
+                             for grid_index, gp_index, instrument, _, ts, ths in access_opportunities
+                             for t, th in zip(ts, ths)]
+        candidate_rewards = reward_grid.estimate_rewards(candidate_actions)
+
+        # check which candidate observations can be reached from the agent's current state
+        dt_measurements = candidate_t - state.t
+        dt_maneuvers = np.abs(candidate_th - state.attitude[0]) / max_slew_rate
+        reachable = (dt_measurements >= 0.0) & (dt_maneuvers <= dt_measurements + 1e-6)
+
+        # earliest observation of each opportunity
+        t_0 = candidate_t[candidate_bounds[:-1]]
+        th_0 = candidate_th[candidate_bounds[:-1]]
+
+        # build adjacency
+        t0_order, n_unconditional, window_predecessors \
+            = self.populate_adjacency_arrays(state, t_0, th_0, candidate_bounds, candidate_t, candidate_th, max_slew_rate)
+
+        # initiate results arrays
+        cumulative_rewards = np.full(n, -np.Inf)
+        selected_candidates = np.full(n, -1, dtype=int)
+        preceeding_observations = np.full(n, -1, dtype=int)
+        t_imgs = np.full(n, np.NAN)
+        th_imgs = np.full(n, np.NAN)
+
+        # calculate optimal path
+        for j in range(n):
+            k_start, k_end = candidate_bounds[j], candidate_bounds[j+1]
+            t_k = candidate_t[k_start:k_end]
+            th_k = candidate_th[k_start:k_end]
+            rewards_k = candidate_rewards[k_start:k_end]
+
+            # start a new sequence from the agent's current state
+            reachable_k = np.flatnonzero(reachable[k_start:k_end])
+            if reachable_k.size > 0:
+                k = reachable_k[0]
+                cumulative_rewards[j] = rewards_k[k]
+                selected_candidates[j] = k
+                t_imgs[j], th_imgs[j] = t_k[k], th_k[k]
+
+            # gather feasible predecessors
+            predecessors = np.concatenate((t0_order[:n_unconditional[j]], window_predecessors[j]))
+            predecessors = predecessors[(predecessors < j) & (selected_candidates[predecessors] >= 0)]
+            if predecessors.size == 0: continue
+
+            # check slew constraint from the predecessors' selected observations to each candidate
+            dt_measurements = t_k[np.newaxis,:] - t_imgs[predecessors][:,np.newaxis]
+            dt_maneuvers = np.abs(th_k[np.newaxis,:] - th_imgs[predecessors][:,np.newaxis]) / max_slew_rate
+            feasible = (dt_measurements >= 0.0) & (dt_maneuvers <= dt_measurements + 1e-6)
+            
+            # select earliest feasible candidate for each predecessor
+            has_feasible = np.any(feasible, axis=1)
+            if not np.any(has_feasible): continue
+
+            predecessors = predecessors[has_feasible]
+            earliest_k = np.argmax(feasible[has_feasible], axis=1)
+            path_rewards = cumulative_rewards[predecessors] + rewards_k[earliest_k]
+
+            # update results with best predecessor
+            best = np.argmax(path_rewards)
+            if path_rewards[best] > cumulative_rewards[j]:
+                cumulative_rewards[j] = path_rewards[best]
+                selected_candidates[j] = earliest_k[best]
+                preceeding_observations[j] = predecessors[best]
+                t_imgs[j], th_imgs[j] = t_k[earliest_k[best]], th_k[earliest_k[best]]
+
+        # extract sequence of observations from results
+        if np.all(selected_candidates < 0): return []
+        observation_sequence = [int(np.argmax(cumulative_rewards))]
+        while preceeding_observations[observation_sequence[-1]] >= 0:
+            observation_sequence.append(preceeding_observations[observation_sequence[-1]])
+        observation_sequence.reverse()
+
+        return [candidate_actions[candidate_bounds[j] + selected_candidates[j]] 
+                for j in observation_sequence]
+
     @runtime_tracker
     def _schedule_broadcasts(self, state: SimulationAgentState, observations: list, orbitdata: OrbitData) -> list:
         broadcasts =  super()._schedule_broadcasts(state, observations, orbitdata)
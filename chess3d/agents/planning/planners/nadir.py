@@ -31,11 +31,7 @@ class NadirPointingPlaner(NaivePlanner):
         cross_track_fovs = self.collect_fov_specs(specs)
 
         # get pointing agility specifications
-        adcs_specs : dict = specs.spacecraftBus.components.get('adcs', None)
-        if adcs_specs is None: raise ValueError('ADCS component specifications missing from agent specs object.')
-
-        max_slew_rate = float(adcs_specs['maxRate']) if adcs_specs.get('maxRate', None) is not None else None
-        if max_slew_rate is None: raise ValueError('ADCS `maxRate` specification missing from agent specs object.')
+        max_slew_rate, _ = self.collect_agility_specs(specs)
 
         # ensure no attitude manuvers are required in plan
         assert self.is_maneuver_path_valid(state, specs, observations, maneuvers, max_slew_rate, cross_track_fovs)
@@ -8,7 +8,9 @@ from orbitpy.util import Spacecraft
 from dmas.utils import runtime_tracker
 
 from chess3d.agents.actions import ObservationAction
+from chess3d.agents.orbitdata import GroundPointIndex
 from chess3d.agents.science.requests import MeasurementRequest
+from chess3d.agents.science.utility import utility_function, vectorized_utility_function
 
 class GridPoint(object):
     """ Describes the reward of performing an observation of a given ground point """
@@ -85,16 +87,36 @@ class GridPoint(object):
         return f'GridPoint_{self.grid_index}_{self.gp_index}_{self.instrument}'
 
 class RewardGrid(object):
+    OBJECTS = 'objects'
+    ARRAYS = 'arrays'
+
     def __init__(self, 
                  reward_function : Callable,
                  specs : object, 
                  grid_data : list, 
                  initial_reward : float,
+                 storage : str = 'objects',
+                 ground_points : GroundPointIndex = None,
                  **grid_params : dict,              
                  ) -> None:       
-        
+        """
+        ## Reward Grid
+
+        #### Arguments:
+            - reward_function (`Callable`) : utility function used to evaluate the reward of each grid point
+            - specs (`object`) : specifications of the agent using this reward grid
+            - grid_data (`list`) : list of dataframes containing the ground points of each grid
+            - initial_reward (`float`) : initial reward of every grid point
+            - storage (`str`) : grid point storage mode; `objects` for `GridPoint` objects or `arrays` for numpy arrays
+            - ground_points (`GroundPointIndex`) : spatial index of the ground points in `grid_data`. Built from `grid_data` if not given.
+            - grid_params (`dict`) : additional parameters passed on to the reward function
+        """
+        # check parameters
+        if storage not in [self.OBJECTS, self.ARRAYS]: raise ValueError(f'Reward grid storage mode `{storage}` not supported.')
+
         # save reward function
         self.reward_function = reward_function
+        self.storage = storage
 
         # load grid data
         self.grid_data : list[pd.DataFrame] = grid_data
@@ -111,8 +133,19 @@ class RewardGrid(object):
 
         self.stats = {}
 
-        # initiate reward grid vectors
+        # get names of instruments onboard
         if isinstance(specs, Spacecraft):
+            instruments = [instrument.name for instrument in specs.instrument]
+        elif isinstance(specs, dict):
+            instruments = [instrument['name'] for instrument in specs['payload']]
+        else:
+            raise ValueError(f'`specs` of type {type(specs)} not supported.')
+
+        # initiate reward grid vectors
+        if self.storage == self.ARRAYS:
+            self.rewards = None
+            self.__init_arrays(instruments)
+        elif isinstance(specs, Spacecraft):
             self.rewards = [ [{instrument.name : GridPoint(instrument.name, 
                                                            lat, 
                                                            lon, 
@@ -140,12 +173,127 @@ class RewardGrid(object):
         self.coordinate_map = {(round(lat, self.n_decimals),round(lon, self.n_decimals)) : (int(grid_index),int(gp_index))
                                for grid_datum in self.grid_data
                                for lat,lon,grid_index,gp_index in grid_datum.values}
+        self.ground_points : GroundPointIndex = ground_points if ground_points is not None \
+                                                else GroundPointIndex.from_grid_data(self.grid_data)
 
         # update previous observations and events (if they exist)
         prev_observations = grid_params.get('prev_observations', [])
         prev_events = grid_params.get('prev_events', [])
         self.update(np.NAN, prev_observations, prev_events)
 
+    def __init_arrays(self, instruments : list) -> None:
+        """ Initializes the array representation of the reward grid, indexed by ground point and instrument """
+        # find vectorized version of the reward function
+        reward_function_names = [name for name, function in utility_function.items() 
+                                 if function is self.reward_function]
+        if not reward_function_names or reward_function_names[0] not in vectorized_utility_function:
+            raise NotImplementedError(f'Array storage not yet supported for reward function `{self.reward_function.__name__}`.')
+        self.vectorized_reward_function : Callable = vectorized_utility_function[reward_function_names[0]]
+
+        # map grid and ground point indeces to array rows
+        self.grid_offsets = np.cumsum([0] + [len(grid_datum) for grid_datum in self.grid_data])
+        self.targets = np.array([[lat, lon] 
+                                 for grid_datum in self.grid_data
+                                 for lat,lon,*_ in grid_datum.values], dtype=float)
+
+        # map instrument names to array columns
+        self.instrument_index = {instrument : i for i, instrument in enumerate(instruments)}
+
+        # initialize arrays
+        n_points, n_instruments = self.grid_offsets[-1], len(instruments)
+        self.reward_array = np.full((n_points, n_instruments), float(self.initial_reward))
+        self.t_update_array = np.full((n_points, n_instruments), np.NAN)
+        self.n_observations_array = np.zeros((n_points, n_instruments), dtype=int)
+        self.t_last_observation_array = np.full((n_points, n_instruments), np.NAN)
+        self.event_start_array = np.full((n_points, n_instruments), np.NAN)
+        self.event_end_array = np.full((n_points, n_instruments), np.NAN)
+        self.n_event_observations_array = np.zeros((n_points, n_instruments), dtype=int)
+        self.t_last_event_observation_array = np.full((n_points, n_instruments), np.NAN)
+        self.n_events_array = np.zeros((n_points, n_instruments), dtype=int)
+
+        # observation and event intervals of each grid point; only populated for observed points or points with events
+        self.observation_times = {}
+        self.event_times = {}
+        self.history = []
+
+    def __get_instrument_column(self, instrument : str) -> int:
+        """ Returns the array column of an instrument, adding a new column if it is not yet in the grid """
+        if instrument not in self.instrument_index:
+            self.instrument_index[instrument] = len(self.instrument_index)
+
+            for name in ['reward_array', 't_update_array', 'n_observations_array', 't_last_observation_array',
+                         'event_start_array', 'event_end_array', 'n_event_observations_array', 't_last_event_observation_array',
+                         'n_events_array']:
+                array : np.ndarray = getattr(self, name)
+                column = np.full((array.shape[0], 1), self.initial_reward if name == 'reward_array' else 0 if array.dtype == int else np.NAN, dtype=array.dtype)
+                setattr(self, name, np.hstack((array, column)))
+
+        return self.instrument_index[instrument]
+
+    def __propagate_rewards(self, rows : np.ndarray, columns : np.ndarray, t : np.ndarray) -> np.ndarray:
+        """ Evaluates the reward function for a set of array entries at the given times """
+        event_start = self.event_start_array[rows, columns]
+        event_end = self.event_end_array[rows, columns]
+        n_event_observations = self.n_event_observations_array[rows, columns]
+        t_last_event_observation = self.t_last_event_observation_array[rows, columns]
+
+        # entries with multiple events are evaluated using their latest event started by the time of evaluation
+        for i in np.flatnonzero(self.n_events_array[rows, columns] > 1):
+            event_start[i], event_end[i], n_event_observations[i], t_last_event_observation[i] \
+                = self.__get_array_event_state(int(rows[i]), int(columns[i]), float(t[i]))
+
+        return self.vectorized_reward_function(t=t,
+                                               t_update=self.t_update_array[rows, columns],
+                                               reward=self.reward_array[rows, columns],
+                                               t_last_observation=self.t_last_observation_array[rows, columns],
+                                               event_start=event_start,
+                                               event_end=event_end,
+                                               n_event_observations=n_event_observations,
+                                               t_last_event_observation=t_last_event_observation,
+                                               **self.grid_params)
+
+    def __get_array_event_state(self, row : int, column : int, t : float) -> tuple:
+        """ Returns the interval and observation counters of the latest event of an array entry started by time `t` """
+        started_events = [(t_end, t_start) for t_start, t_end in self.event_times.get((row, column), []) if t_start <= t]
+        if not started_events: return np.NAN, np.NAN, 0, np.NAN
+
+        event_end, event_start = max(started_events)
+        return (event_start, event_end, *self.__count_array_event_observations(row, column, event_start, event_end))
+
+    def __count_array_event_observations(self, row : int, column : int, event_start : float, event_end : float) -> tuple:
+        """ Returns the number of observations of an array entry performed during an event and the end time of the latest one performed after it """
+        observation_times : list = self.observation_times.get((row, column), [])
+        event_observations = [t_end for t_start, t_end in observation_times if event_start <= t_start <= event_end]
+        post_event_observations = [t_end for t_start, t_end in observation_times if event_end <= t_start]
+        return len(event_observations), max(post_event_observations) if post_event_observations else np.NAN
+
+    def __update_array_reward(self, row : int, column : int, t : float) -> None:
+        """ Propagates and updates the reward of an array entry and records it in the grid's history """
+        reward = float(self.__propagate_rewards(np.array([row]), np.array([column]), np.array([t], dtype=float))[0])
+        self.reward_array[row, column] = reward
+        self.t_update_array[row, column] = t
+
+        # add to reward history
+        grid_index = int(np.searchsorted(self.grid_offsets, row, side='right') - 1)
+        gp_index = row - int(self.grid_offsets[grid_index])
+        lat, lon = self.targets[row]
+        instrument = [name for name, i in self.instrument_index.items() if i == column][0]
+        t_update = t if not np.isnan(t) else -1
+        self.history.append((t_update, grid_index, gp_index, lat, lon, instrument, reward, 
+                             int(self.n_observations_array[row, column]), int(self.n_events_array[row, column])))
+
+    def __update_array_observation_counters(self, row : int, column : int) -> None:
+        """ Recomputes the observation counters of an array entry from its observation history """
+        observation_times : list = self.observation_times.get((row, column), [])
+        event_start, event_end = self.event_start_array[row, column], self.event_end_array[row, column]
+
+        self.n_observations_array[row, column] = len(observation_times)
+        self.t_last_observation_array[row, column] = max([t_end for _, t_end in observation_times]) if observation_times else np.NAN
+
+        if not np.isnan(event_start):
+            self.n_event_observations_array[row, column], self.t_last_event_observation_array[row, column] \
+                = self.__count_array_event_observations(row, column, event_start, event_end)
+
     def count_decimals(self, grid_data : list) -> None:
         decimals = []
         for grid_datum in grid_data:
@@ -166,26 +314,24 @@ class RewardGrid(object):
             return self.coordinate_map[(lat_round, lon_round)]
         
         # search ground points with matching latitude and longitude
-        matches = [(int(grid_index),int(gp_index))
-                   for grid_datum in self.grid_data
-                   for gp_lat,gp_lon,grid_index,gp_index in grid_datum.values
-                   if abs(gp_lat - lat) <= 10**-self.n_decimals
-                   and abs(gp_lon - lon) <= 10**-self.n_decimals
-                   ]
+        matches = self.ground_points.query_box(lat, lon, 10**-self.n_decimals)
         
-        if matches:
+        if len(matches) > 0:
             # values found; return incedes
-            return matches.pop() 
+            grid_index, gp_index = self.ground_points.labels[matches[-1]]
+            return int(grid_index), int(gp_index)
         else:
             # values not found; raise exception
-            for grid_datum in self.grid_data:
-                for gp_lat,gp_lon,grid_index,gp_index in grid_datum.values:
-                    if abs(gp_lat - lat) <= 1e-1 and abs(gp_lon - lon) <= 1e-1:
-                        x = (grid_index,gp_index)
             raise ValueError(f'Could not find ground point indeces for coordinates ({lat}°,{lon}°,0.0)')
         
     @runtime_tracker
     def reset(self) -> None:
+        if self.storage == self.ARRAYS:
+            history = self.history
+            self.__init_arrays(list(self.instrument_index.keys()))
+            self.history = history
+            return
+
         for grid_rewards in self.rewards:
             for gp_rewards in grid_rewards:
                 for _, grid_point in gp_rewards.items():
@@ -215,6 +361,22 @@ class RewardGrid(object):
         lat,lon,_ = observation.target
         grid_index,gp_index = self.__get_target_indeces(lat,lon)
 
+        if self.storage == self.ARRAYS:
+            # get array entry
+            row = int(self.grid_offsets[grid_index]) + gp_index
+            column = self.__get_instrument_column(observation.instrument_name)
+
+            # update current reward
+            self.__update_array_reward(row, column, t)
+
+            # update observation counters
+            self.observation_times.setdefault((row, column), []).append((observation.t_start, observation.t_end))
+            self.__update_array_observation_counters(row, column)
+
+            # update reward
+            self.__update_array_reward(row, column, t)
+            return
+
         # check if reward grid point exists
         if observation.instrument_name not in self.rewards[grid_index][gp_index]:
             # add if needed
@@ -245,6 +407,30 @@ class RewardGrid(object):
         lat,lon,_ = event.target
         grid_index,gp_index = self.__get_target_indeces(lat,lon)
 
+        if self.storage == self.ARRAYS:
+            row = int(self.grid_offsets[grid_index]) + gp_index
+            for instrument in event.observation_types:
+                column = self.__get_instrument_column(instrument)
+
+                # update current reward
+                self.__update_array_reward(row, column, t)
+
+                # record event interval
+                event_times : list = self.event_times.setdefault((row, column), [])
+                if (event.t_start, event.t_end) not in event_times:
+                    event_times.append((event.t_start, event.t_end))
+                    self.n_events_array[row, column] = len(event_times)
+
+                # keep latest event; entries with multiple events select theirs when evaluated
+                if np.isnan(self.event_end_array[row, column]) or self.event_end_array[row, column] <= event.t_end:
+                    self.event_start_array[row, column] = event.t_start
+                    self.event_end_array[row, column] = event.t_end
+                    self.__update_array_observation_counters(row, column)
+
+                # update reward
+                self.__update_array_reward(row, column, t)
+            return
+
         for instrument in event.observation_types:
             # check if reward grid point exists
             if instrument not in self.rewards[grid_index][gp_index]:
@@ -279,14 +465,41 @@ class RewardGrid(object):
     
     @runtime_tracker
     def estimate_reward(self, observation : ObservationAction) -> float:
+        if self.storage == self.ARRAYS:
+            return float(self.estimate_rewards([observation])[0])
+
         lat,lon,_ = observation.target
         grid_index,gp_index = self.__get_target_indeces(lat,lon)
         grid_point : GridPoint = self.rewards[grid_index][gp_index][observation.instrument_name]
 
         return self.propagate_reward(grid_point, observation.t_start)
     
+    @runtime_tracker
+    def estimate_rewards(self, observations : list) -> np.ndarray:
+        """ Estimates the reward of performing each of a list of observations """
+        if self.storage == self.OBJECTS:
+            return np.array([self.estimate_reward(observation) for observation in observations], dtype=float)
+        
+        if not observations: return np.array([], dtype=float)
+
+        # find array entries of every observation
+        rows, columns = [], []
+        for observation in observations:
+            observation : ObservationAction
+            lat,lon,_ = observation.target
+            grid_index,gp_index = self.__get_target_indeces(lat,lon)
+            rows.append(int(self.grid_offsets[grid_index]) + gp_index)
+            columns.append(self.__get_instrument_column(observation.instrument_name))
+        t = np.array([observation.t_start for observation in observations], dtype=float)
+
+        # evaluate rewards
+        return self.__propagate_rewards(np.array(rows), np.array(columns), t)
+
     @runtime_tracker
     def get_history(self) -> list:
+        if self.storage == self.ARRAYS:
+            return sorted(self.history)
+
         history = []
 
         for grid_rewards in self.rewards:
@@ -0,0 +1,132 @@
+import heapq
+import numpy as np
+
+from chess3d.agents.orbitdata import ContactTimeline, TimeInterval
+
+
+class ContactGraphRouter:
+    """
+    ## Contact Graph Router
+
+    Finds earliest-arrival message relay routes over the time-expanded graph of inter-satellite
+    contacts described by a `ContactTimeline`.
+
+    Routes are found using Dijkstra's algorithm, where the cost of traversing a link is the time spent
+    waiting for its next contact window. Messages are assumed to be transmitted instantaneously once a
+    contact is available. Since waiting longer at a node can never lead to an earlier arrival, the
+    first time a node is reached is its earliest arrival time.
+
+    Routing trees are cached per source agent and send-time bucket. Send times are rounded up to the
+    end of their bucket, so cached routes are always feasible and deliver messages at most one bucket
+    later than the earliest possible arrival. Routes sent before the current simulation time are no longer
+    needed and are evicted from the cache through `evict`.
+    """
+    def __init__(self,
+                 contacts : ContactTimeline,
+                 agents : list,
+                 bucket_size : float = None
+                 ) -> None:
+        """
+        ### Arguments:
+            - contacts (`ContactTimeline`): contact windows of every link in the scenario
+            - agents (`list`): names of the agents that can relay messages
+            - bucket_size (`float`): width of the send-time buckets [s]. Defaults to the contact timeline's time-step.
+        """
+        # validate inputs
+        if bucket_size is not None and bucket_size <= 0.0:
+            raise ValueError(f'`bucket_size` must be a positive number. Is {bucket_size}.')
+
+        # set parameters
+        self.contacts : ContactTimeline = contacts
+        self.agents : list = list(agents)
+        self.bucket_size : float = bucket_size if bucket_size is not None else contacts.time_step
+
+        # only consider pairs of agents that share at least one contact window
+        self.neighbors : dict = {agent : [neighbor for neighbor in self.agents
+                                          if neighbor != agent and contacts.has_link(agent, neighbor)]
+                                 for agent in self.agents}
+
+        # initialize route cache
+        self.routes : dict = {}
+
+    def get_send_time(self, t : float) -> float:
+        """ Returns the end of the send-time bucket containing time `t` [s] """
+        return np.ceil(np.round(t / self.bucket_size, 6)) * self.bucket_size
+
+    def evict(self, t : float) -> None:
+        """ Removes cached routes for messages sent before the send-time bucket containing time `t` [s] """
+        t_send = self.get_send_time(t)
+        self.routes = {key : routes for key, routes in self.routes.items() if key[1] >= t_send}
+
+    def __earliest_arrival(self, src : str, t : float) -> tuple:
+        """
+        Runs an earliest-arrival search from agent `src` starting at time `t`
+
+        ### Returns:
+            - arrivals (`dict`): earliest arrival time [s] of a message to every reachable agent
+            - predecessors (`dict`): agent relaying the message to every reachable agent
+        """
+        arrivals = {src : t}
+        predecessors = {src : None}
+        visited = set()
+
+        # initialize queue
+        q = [(t, src)]
+
+        while q:
+            # get earliest reached agent
+            t_arrival, agent = heapq.heappop(q)
+            if agent in visited: continue
+            visited.add(agent)
+
+            # relay message to neighbors at their next contact
+            for neighbor in self.neighbors[agent]:
+                if neighbor in visited: continue
+
+                window : TimeInterval = self.contacts.next_window(agent, neighbor, t_arrival)
+                if window.start < arrivals.get(neighbor, np.Inf):
+                    arrivals[neighbor] = window.start
+                    predecessors[neighbor] = agent
+                    heapq.heappush(q, (window.start, neighbor))
+
+        return arrivals, predecessors
+
+    def flood(self, src : str, t : float) -> tuple:
+        """
+        Finds the earliest-arrival routes from agent `src` to every other agent for a message sent at time `t` [s]
+
+        ### Returns:
+            - arrivals (`dict`): earliest arrival time [s] of the message to every reachable agent
+            - predecessors (`dict`): agent relaying the message to every reachable agent
+        """
+        if src not in self.neighbors:
+            raise ValueError(f'Agent `{src}` is not part of the contact graph.')
+
+        # check cache
+        t_send = self.get_send_time(t)
+        key = (src, t_send)
+        if key not in self.routes:
+            self.routes[key] = self.__earliest_arrival(src, t_send)
+
+        return self.routes[key]
+
+    def route(self, src : str, dst : str, t : float) -> tuple:
+        """
+        Finds the earliest-arrival route from agent `src` to agent `dst` for a message sent at time `t` [s]
+
+        ### Returns:
+            - path (`list`): sequence of agents relaying the message, ending with `dst`. Empty if `dst` is unreachable.
+            - t_arrival (`float`): arrival time of the message to `dst`. Infinite if `dst` is unreachable.
+        """
+        arrivals, predecessors = self.flood(src, t)
+        if dst not in arrivals: return [], np.Inf
+
+        # backtrack route from destination
+        path = []
+        agent = dst
+        while agent != src:
+            path.append(agent)
+            agent = predecessors[agent]
+        path.reverse()
+
+        return path, arrivals[dst]
@@ -6,9 +6,11 @@ from dmas.modules import NetworkConfig
 from dmas.modules import *
 
 from chess3d.agents.actions import ObservationAction
+from chess3d.agents.orbitdata import GroundPointIndex
 from chess3d.agents.states import SimulationAgentState
 from chess3d.agents.science.requests import *
 from chess3d.messages import *
+from chess3d.transport import ContextElement
 
 from instrupy.base import Instrument
 
@@ -16,7 +18,7 @@ class ScienceModuleTypes(Enum):
     LOOKUP = 'LOOKUP'
     ORACLE = 'ORACLE'
 
-class ScienceModule(InternalModule):
+class ScienceModule(ContextElement, InternalModule):
     def __init__(   self, 
                     results_path : str,
                     parent_name : str,
@@ -265,6 +267,7 @@ class LookupTableScienceModule(ScienceModule):
 
         # load predefined events
         self.events : pd.DataFrame = self.load_events(events_path)
+        self.event_locations = GroundPointIndex(self.events.iloc[:,1].values, self.events.iloc[:,2].values)
 
         # initialize empty list of detected events
         self.events_detected = set()
@@ -283,14 +286,12 @@ class LookupTableScienceModule(ScienceModule):
                             **_
                             ) -> tuple:
         
-        # query known events
+        # query known events at the same location as the observation
+        nearby_events = self.events.values[self.event_locations.query_box(lat, lon, 1e-3)]
         observed_events = [ (lat_event,lon_event,t_start,duration,severity,measurements)
-                            for _,lat_event,lon_event,t_start,duration,severity,measurements in self.events.values
-                            # same location as the observation
-                            if abs(lat - lat_event) <= 1e-3
-                            and abs(lon - lon_event) <= 1e-3
+                            for _,lat_event,lon_event,t_start,duration,severity,measurements in nearby_events
                             # availability during the time of observation
-                            and t_start <= t_img <= t_start+duration
+                            if t_start <= t_img <= t_start+duration
                             # event requires observations of the same type as the one performed
                             and instrument.name in measurements
                             # event has not been detected before
@@ -159,6 +159,71 @@ def event_driven(
 
     return reward
 
+"""
+Vectorized utility functions used to evaluate the value of many observations of a reward grid at once
+"""
+
+def no_utility_vectorized(t : np.ndarray, **_) -> np.ndarray:
+    return np.zeros_like(np.asarray(t, dtype=float))
+
+def event_driven_vectorized(
+                t : np.ndarray,
+                t_update : np.ndarray,
+                reward : np.ndarray,
+                t_last_observation : np.ndarray,
+                event_start : np.ndarray,
+                event_end : np.ndarray,
+                n_event_observations : np.ndarray,
+                t_last_event_observation : np.ndarray,
+                min_reward : float, 
+                unobserved_reward_rate : float, 
+                max_unobserved_reward : float, 
+                reobservation_strategy : Callable,
+                event_reward : float,
+                **_) -> np.ndarray:
+    """
+    Array implementation of `event_driven`. Each ground point is described by the state of its latest 
+    observation and of its latest event started by time `t` rather than by sets of observations and events.
+
+    ### Arguments:
+        - t (`np.ndarray`): times at which the rewards are evaluated
+        - t_update (`np.ndarray`): latest update time of each ground point
+        - reward (`np.ndarray`): current reward of each ground point
+        - t_last_observation (`np.ndarray`): end time of the latest observation of each ground point
+        - event_start (`np.ndarray`): start time of the latest event of each ground point started by time `t`
+        - event_end (`np.ndarray`): end time of the latest event of each ground point started by time `t`
+        - n_event_observations (`np.ndarray`): number of observations performed during the latest event
+        - t_last_event_observation (`np.ndarray`): end time of the latest observation performed after the latest event
+    """
+    t = np.asarray(t, dtype=float)
+
+    # classify ground points by the state of their latest event
+    has_event = ~np.isnan(event_start) & (event_start <= t)
+    event_current = has_event & (t <= event_end)
+    event_passed = has_event & (t > event_end)
+
+    # calculate reward of current events
+    event_duration = event_end - event_start
+    event_fraction = np.divide(t - event_start, event_duration, 
+                               out=np.ones_like(t), where=event_current & (event_duration > 0))
+    reobservation_factor = np.array([reobservation_strategy(n) for n in n_event_observations], dtype=float) \
+                            if np.any(event_current) else np.ones_like(t)
+    current_reward = (event_reward + (min_reward - event_reward) * np.clip(event_fraction, 0.0, 1.0)) * reobservation_factor
+
+    # calculate reward of points with events that have already passed
+    t_init_passed = np.where(np.isnan(t_last_event_observation), event_end, np.fmax(event_end, t_last_event_observation))
+    passed_reward = np.minimum((t - t_init_passed) * unobserved_reward_rate / 3600 + min_reward, max_unobserved_reward)
+
+    # calculate reward of points with no events
+    t_init = np.where(np.isnan(t_last_observation), 0.0, t_last_observation)
+    unobserved_reward = np.minimum((t - t_init) * unobserved_reward_rate / 3600 + min_reward, max_unobserved_reward)
+
+    # compile rewards
+    rewards = np.where(event_current, current_reward, np.where(event_passed, passed_reward, unobserved_reward))
+    
+    # reward grid was just initialized; return initial reward
+    return np.where(np.isnan(t_update) & np.isnan(t), reward, rewards)
+
 utility_function = {
     "none" : no_utility,
     "fixed" : fixed_utility,
@@ -168,6 +233,11 @@ utility_function = {
     "event" : event_driven
 }
 
+vectorized_utility_function = {
+    "none" : no_utility_vectorized,
+    "event" : event_driven_vectorized
+}
+
 """
 List of reobservation strategy functions used to evalute the value of reobservations
 """
@@ -98,6 +98,18 @@ class SimulationAgentState(AbstractAgentState):
 
         return propagated
 
+    def propagate_batch(self, times : list) -> list:
+        """
+        Propagates the agent's state to multiple times at once.
+
+        ### Arguments 
+            - times (`list`) : propagation end times in [s]
+
+        ### Returns:
+            - propagated (`list`) : list of propagated states, one for each time in `times`
+        """
+        return [self.propagate(tf) for tf in times]
+
     @abstractmethod
     def kinematic_model(self, tf : Union[int, float], **kwargs) -> tuple:
         """
@@ -262,7 +274,23 @@ class GroundStationAgentState(SimulationAgentState):
 class SatelliteAgentState(SimulationAgentState):
     """
     Describes the state of a Satellite Agent
+
+    Position, velocity, and eclipse status are interpolated from the agent's pre-computed orbit data 
+    when it has been registered through `register_ephemeris()` and the desired time lies within its span.
+    Otherwise, the orbit is propagated with `propcov`. Keplerian elements are only updated by `propcov`.
     """
+    # pre-computed orbit data used for interpolating satellite states, indexed by agent name
+    ephemerides : dict = dict()
+
+    def register_ephemeris(agent_name : str, orbitdata : object) -> None:
+        """ Registers the pre-computed orbit data used to interpolate the states of a given satellite """
+        SatelliteAgentState.ephemerides[agent_name] = orbitdata
+
+    def get_ephemeris(self, t : Union[int, float]) -> object:
+        """ Returns this satellite's registered orbit data if it covers time `t`. Returns `None` otherwise. """
+        orbitdata = SatelliteAgentState.ephemerides.get(self.agent_name, None)
+        return orbitdata if orbitdata is not None and orbitdata.covers(t) else None
+
     def __init__( self, 
                     agent_name : str,
                     orbit_state : dict,
@@ -299,6 +327,7 @@ class SatelliteAgentState(SimulationAgentState):
         elif keplerian_state is not None:
             self.keplerian_state = keplerian_state
         
+        self.agent_name = agent_name
         self.time_step = time_step
         if eps:
             self.eps = eps
@@ -322,6 +351,15 @@ class SatelliteAgentState(SimulationAgentState):
         if abs(dt) < 1e-6:
             return self.pos, self.vel, self.attitude, self.attitude_rates
 
+        # interpolate from pre-computed orbit data if available
+        orbitdata = self.get_ephemeris(tf)
+        if orbitdata is not None:
+            pos, vel, eclipse = orbitdata.interpolate_orbit_states([tf])
+            self.eclipse = int(eclipse[0])
+
+            attitude = [self.attitude[i] + dt * self.attitude_rates[i] for i in range(len(self.attitude))]
+            return pos[0].tolist(), vel[0].tolist(), attitude, self.attitude_rates
+
         # form the propcov.Spacecraft object
         attitude = propcov.NadirPointingAttitude()
         interp = propcov.LagrangeInterpolator()
@@ -376,6 +414,29 @@ class SatelliteAgentState(SimulationAgentState):
        
         return pos, vel, attitude, self.attitude_rates
 
+    def propagate_batch(self, times: list) -> list:
+        # check if all times are covered by the pre-computed orbit data
+        orbitdata = SatelliteAgentState.ephemerides.get(self.agent_name, None)
+        if (orbitdata is None 
+            or self.engineering_module is not None
+            or not all([orbitdata.covers(tf) for tf in times])):
+            return super().propagate_batch(times)
+        
+        # interpolate all states at once
+        positions, velocities, eclipses = orbitdata.interpolate_orbit_states(times)
+
+        propagated_states = []
+        for tf, pos, vel, eclipse in zip(times, positions, velocities, eclipses):
+            propagated : SatelliteAgentState = self.copy()
+            if abs(tf - self.t) >= 1e-6:
+                propagated.pos, propagated.vel, propagated.eclipse = pos.tolist(), vel.tolist(), int(eclipse)
+                propagated.attitude = [self.attitude[i] + (tf - self.t) * self.attitude_rates[i] 
+                                       for i in range(len(self.attitude))]
+            propagated.t = tf
+            propagated_states.append(propagated)
+
+        return propagated_states
+
     def is_failure(self) -> None:
         if self.engineering_module:
             # agent only fails if internal components fail
@@ -450,6 +511,11 @@ class SatelliteAgentState(SimulationAgentState):
         """
         Calculates tolerance for position vector comparisons
         """
+        # interpolate from pre-computed orbit data if available
+        orbitdata = self.get_ephemeris(self.time_step)
+        if orbitdata is not None:
+            pos, _, _ = orbitdata.interpolate_orbit_states([self.time_step])
+            return np.linalg.norm(np.array(init_pos) - pos[0]) / 2.0
 
         # form the propcov.Spacecraft object
         attitude = propcov.NadirPointingAttitude()
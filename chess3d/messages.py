@@ -7,6 +7,7 @@ class SimulationMessageTypes(Enum):
     AGENT_STATE = 'AGENT_STATE'
     CONNECTIVITY_UPDATE = 'CONNECTIVITY_UPDATE'
     MEASUREMENT_BID = 'MEASUREMENT_BID'
+    MEASUREMENT_BID_TABLE = 'MEASUREMENT_BID_TABLE'
     PLAN = 'PLAN'
     SENSES = 'SENSES'
     OBSERVATION = 'OBSERVATION'
@@ -27,6 +28,8 @@ def message_from_dict(msg_type : str, **kwargs) -> SimulationMessage:
         return AgentConnectivityUpdate(**kwargs)
     elif msg_type == SimulationMessageTypes.MEASUREMENT_BID.value:
         return MeasurementBidMessage(**kwargs)
+    elif msg_type == SimulationMessageTypes.MEASUREMENT_BID_TABLE.value:
+        return MeasurementBidTableMessage(**kwargs)
     elif msg_type == SimulationMessageTypes.PLAN.value:
         return PlanMessage(**kwargs)
     elif msg_type == SimulationMessageTypes.SENSES.value:
@@ -191,6 +194,42 @@ class MeasurementBidMessage(SimulationMessage):
         super().__init__(src, dst, SimulationMessageTypes.MEASUREMENT_BID.value, id, path)
         self.bid = bid
 
+class MeasurementBidTableMessage(SimulationMessage):
+    """
+    ## Measurment Bid Table Message
+
+    Informs other agents of the bids held by the sender that changed since its last bid table broadcast or that respond to their bids
+
+    ### Attributes:
+        - src (`str`): name of the simulation element sending this message
+        - dst (`str`): name of the intended simulation element to receive this message
+        - bids (`list`): bid information being shared
+        - msg_type (`str`): type of message being sent
+        - id (`str`) : Universally Unique IDentifier for this message
+    """
+    def __init__(self, 
+                src: str, 
+                dst: str, 
+                bids: list, 
+                id: str = None,
+                path : list = [],
+                **_):
+        """
+        Creates an instance of a bid table message
+
+        ### Arguments:
+            - src (`str`): name of the simulation element sending this message
+            - dst (`str`): name of the intended simulation element to receive this message
+            - bids (`list`): bid information being shared
+            - id (`str`) : Universally Unique IDentifier for this message
+        """
+        super().__init__(src, dst, SimulationMessageTypes.MEASUREMENT_BID_TABLE.value, id, path)
+        
+        if not isinstance(bids, list):
+            raise AttributeError(f'`bids` must be of type `list`; is of type {type(bids)}')
+
+        self.bids = bids
+
 class PlanMessage(SimulationMessage):
     """
     # Plan Message
@@ -8,6 +8,7 @@ import random
 from typing import Any
 from tqdm import tqdm
 import zmq
+import zmq.asyncio
 import numpy as np
 import pandas as pd
 
@@ -24,10 +25,10 @@ from dmas.clocks import *
 from chess3d.agents.planning.planners.consensus.dynamic import DynamicProgrammingACBBAReplanner
 from chess3d.agents.planning.planners.dynamic import DynamicProgrammingPlanner
 from chess3d.agents.planning.planners.rewards import RewardGrid
-from chess3d.nodes.manager import SimulationManager
+from chess3d.nodes.manager import BatchedClockConfig, SimulationManager, TimeSkippingClockConfig
 from chess3d.nodes.monitor import ResultsMonitor
 from chess3d.nodes.environment import SimulationEnvironment
-from chess3d.agents.orbitdata import OrbitData
+from chess3d.agents.orbitdata import ContactTimeline, OrbitData
 from chess3d.agents.states import *
 from chess3d.agents.agent import SimulationAgent
 from chess3d.agents.planning.module import PlanningModule
@@ -40,6 +41,8 @@ from chess3d.agents.science.module import *
 from chess3d.agents.science.utility import utility_function, reobservation_strategy
 from chess3d.agents.states import SatelliteAgentState, SimulationAgentTypes, UAVAgentState
 from chess3d.agents.agent import SimulationAgent
+from chess3d.results import ResultsAnalysis
+from chess3d.transport import TransportTypes, get_address
 from chess3d.utils import *
 
 
@@ -50,7 +53,9 @@ class Mission:
                  manager : SimulationManager,
                  environment : SimulationEnvironment,
                  agents : list,
-                 monitor : ResultsMonitor
+                 monitor : ResultsMonitor,
+                 transport : TransportTypes = TransportTypes.TCP,
+                 context : zmq.asyncio.Context = None
             ) -> None:
         self.results_path : str = results_path
         self.orbitdata_dir : str = orbitdata_dir
@@ -58,12 +63,26 @@ class Mission:
         self.environment : SimulationEnvironment = environment
         self.agents : list[SimulationAgent] = agents
         self.monitor : ResultsMonitor = monitor
+        self.transport : TransportTypes = transport
+        self.context : zmq.asyncio.Context = context
+
+        # create every element's sockets from the shared context, if any
+        if self.context is not None:
+            for element in [self.manager, self.environment, self.monitor, *self.agents]:
+                element.use_context(self.context)
         
-    def from_dict(mission_specs : dict, level=logging.WARNING):
-        """ Loads simulation from input json """
+    def from_dict(mission_specs : dict, level=logging.WARNING, port : int = None):
+        """ 
+        Loads simulation from input json 
+
+        ### Arguments:
+            - mission_specs (`dict`): mission specifications
+            - level (`int`): logging level
+            - port (`int`): first port of the block used by the simulation elements. Chosen at random if not given.
+        """
 
         # select unsused ports
-        port = random.randint(5555, 9999)
+        port = random.randint(5555, 9999) if port is None else port
 
         # unpack agent info
         spacecraft_dict : dict = mission_specs.get('spacecraft', None)
@@ -94,6 +113,9 @@ class Mission:
         # create results directory
         results_path : str = setup_results_directory(scenario_path, scenario_name, agent_names, overwrite)
 
+        # load transport type
+        transport : TransportTypes = TransportTypes[settings_dict.get('transport', 'tcp').upper()]
+
         # precompute orbit data
         orbitdata_dir = OrbitData.precompute(mission_specs) if spacecraft_dict is not None else None
 
@@ -103,26 +125,63 @@ class Mission:
         # load events
         events_path = SimulationElementsFactory.load_events(scenario_dict, grid_dict, clock_config)
 
+        # ------------------------------------
+        # elements share a single zmq context when using in-process transport
+        context = zmq.asyncio.Context() if transport == TransportTypes.INPROC else None
+
+        return Mission.__from_dict(mission_specs, scenario_name, results_path, orbitdata_dir, 
+                                   clock_config, events_path, agent_names, port, transport, 
+                                   context, level)
+    
+    def __from_dict(mission_specs : dict,
+                    scenario_name : str,
+                    results_path : str,
+                    orbitdata_dir : str,
+                    clock_config : ClockConfig,
+                    events_path : str,
+                    agent_names : list,
+                    port : int,
+                    transport : TransportTypes,
+                    context : zmq.asyncio.Context,
+                    level : int
+                    ):
+        """ Initializes the simulation elements of a mission using a given transport """
+        # unpack agent info
+        spacecraft_dict : dict = mission_specs.get('spacecraft', None)
+        uav_dict        : dict = mission_specs.get('uav', None)
+        gstation_dict   : dict = mission_specs.get('groundStation', None)
+        scenario_dict   : dict = mission_specs.get('scenario', None)
+
+        # define address generators
+        bind = lambda p : get_address(transport, scenario_name, p, True)
+        connect = lambda p : get_address(transport, scenario_name, p, False)
+
         # ------------------------------------
         # initialize manager
         manager_network_config = NetworkConfig( scenario_name,
                                                 manager_address_map = {
-                                                                        zmq.REP: [f'tcp://*:{port}'],
-                                                                        zmq.PUB: [f'tcp://*:{port+1}'],
-                                                                        zmq.SUB: [f'tcp://*:{port+2}'],
-                                                                        zmq.PUSH: [f'tcp://localhost:{port+3}']
+                                                                        zmq.REP: [bind(port)],
+                                                                        zmq.PUB: [bind(port+1)],
+                                                                        zmq.SUB: [bind(port+2)],
+                                                                        zmq.PUSH: [connect(port+3)]
                                                                         }
                                                 )
 
 
-        manager = SimulationManager(results_path, agent_names, clock_config, manager_network_config, level)
+        # load orbit data once; shared by the manager's event times and the environment
+        orbitdata : dict = OrbitData.from_directory(orbitdata_dir) if orbitdata_dir is not None else None
+
+        event_times = SimulationElementsFactory.load_event_times(orbitdata) \
+                        if isinstance(clock_config, TimeSkippingClockConfig) else None
+        manager = SimulationManager(results_path, agent_names, clock_config, manager_network_config, level, 
+                                    event_times=event_times)
         logger = manager.get_logger()
 
         # ------------------------------------
         # create results monitor
         monitor_network_config = NetworkConfig( scenario_name,
-                                        external_address_map = {zmq.SUB: [f'tcp://localhost:{port+1}'],
-                                                                zmq.PULL: [f'tcp://*:{port+3}']}
+                                        external_address_map = {zmq.SUB: [connect(port+1)],
+                                                                zmq.PULL: [bind(port+3)]}
                                         )
         
         monitor = ResultsMonitor(clock_config, monitor_network_config, logger=logger)
@@ -143,7 +202,8 @@ class Mission:
                                                     agent_port, 
                                                     SimulationAgentTypes.SATELLITE, 
                                                     level,
-                                                    logger
+                                                    logger,
+                                                    transport
                                                 )
                 agents.append(agent)
                 agent_port += 7
@@ -170,18 +230,20 @@ class Mission:
         ## create network config
         env_network_config = NetworkConfig( manager.get_network_config().network_name,
                                                 manager_address_map = {
-                                                        zmq.REQ: [f'tcp://localhost:{port}'],
-                                                        zmq.SUB: [f'tcp://localhost:{port+1}'],
-                                                        zmq.PUB: [f'tcp://localhost:{port+2}'],
-                                                        zmq.PUSH: [f'tcp://localhost:{port+3}']},
+                                                        zmq.REQ: [connect(port)],
+                                                        zmq.SUB: [connect(port+1)],
+                                                        zmq.PUB: [connect(port+2)],
+                                                        zmq.PUSH: [connect(port+3)]},
                                                 external_address_map = {
-                                                        zmq.REP: [f'tcp://*:{port+4}'],
-                                                        zmq.PUB: [f'tcp://*:{port+5}'],
+                                                        zmq.REP: [bind(port+4)],
+                                                        zmq.PUB: [bind(port+5)],
                                                         zmq.SUB: env_subs
                                                 })
         
         ## initialize environment
         connectivity = scenario_dict.get('connectivity','full').upper()
+        settings_dict : dict = mission_specs.get('settings', None) or {}
+        results_buffer_size = int(settings_dict.get('resultsBufferSize', 1000))
         environment = SimulationEnvironment(results_path, 
                                             orbitdata_dir,
                                             spacecraft_dict,
@@ -191,11 +253,13 @@ class Mission:
                                             manager_network_config,
                                             connectivity,
                                             events_path,
+                                            results_buffer_size,
                                             level,
-                                            logger)
+                                            logger,
+                                            orbitdata)
         
         # return initialized mission
-        return Mission(results_path, orbitdata_dir, manager, environment, agents, monitor)
+        return Mission(results_path, orbitdata_dir, manager, environment, agents, monitor, transport, context)
     
     def execute(self, plot_results : bool = False, save_plot : bool = False) -> None:
         """ executes the simulation """
@@ -213,8 +277,8 @@ class Mission:
         # define file name
         summary_path = os.path.join(f"{self.results_path}","summary.csv")
 
-        # collect results
-        orbitdata : dict = OrbitData.from_directory(self.orbitdata_dir) if self.orbitdata_dir is not None else None
+        # collect results; reuse orbit data already loaded by the environment
+        orbitdata : dict = self.environment.orbitdata
         observations_performed = pd.read_csv((os.path.join(self.environment.results_path, 'measurements.csv')))
         events = self.environment.events
         measurement_reqs = pd.read_csv((os.path.join(self.environment.results_path, 'requests.csv')))
@@ -232,13 +296,16 @@ class Mission:
                           events : pd.DataFrame,
                           measurement_reqs : pd.DataFrame,
                           n_decimals : int = 5) -> pd.DataFrame:
+        # classify observations once for all metrics
+        analysis = ResultsAnalysis(observations_performed, events, measurement_reqs)
+
         # count observations performed
         # n_events, n_unique_event_obs, n_total_event_obs,
         n_gps, n_events, n_events_detected, n_events_observed, \
             n_total_event_obs, n_events_reobserved, n_total_event_re_obs, \
                 n_events_co_obs, n_events_partially_co_obs, n_events_fully_co_obs, \
                     n_total_event_co_obs, n_observations \
-                        = self.count_observations(orbitdata, observations_performed, events, measurement_reqs)
+                        = self.count_observations(orbitdata, observations_performed, events, measurement_reqs, analysis)
         
         # count probabilities of observations performed
         p_event_detected, p_event_observed, p_event_re_obs, \
@@ -246,14 +313,13 @@ class Mission:
                 p_event_co_obs_fully, p_event_at_gp, p_event_observed_if_detected, \
                     p_event_re_obs_if_detected, p_event_co_obs_if_detected, p_event_co_obs_partial_if_detected, \
                         p_event_co_obs_fully_if_detected \
-                            = self.calc_event_probabilities(orbitdata, observations_performed, events, measurement_reqs)
+                            = self.calc_event_probabilities(orbitdata, observations_performed, events, measurement_reqs, analysis)
         
         # get event revisit times
-        t_reobservation = self.calc_event_coverage_metrics(observations_performed, events, measurement_reqs)
+        t_reobservation = self.calc_event_coverage_metrics(observations_performed, events, measurement_reqs, analysis)
 
         # count number of GPs observed
-        gps_observed : set = {(lat,lon) for _,_,lat,lon,*_ in observations_performed.values}
-        n_gps_observed = len(gps_observed)
+        n_gps_observed = analysis.count_gps_observed()
 
         # Generate summary
         summary_headers = ['stat_name', 'val']
@@ -307,13 +373,15 @@ class Mission:
                            orbitdata : dict, 
                            observations_performed : pd.DataFrame, 
                            events : pd.DataFrame,
-                           measurement_reqs : list
+                           measurement_reqs : list,
+                           analysis : ResultsAnalysis = None
                            ) -> tuple:
         _, events_detected, events_observed, \
             events_re_obs, events_co_obs, events_co_obs_fully, \
                 events_co_obs_partially = self.classify_observations(observations_performed, 
                                                                      events, 
-                                                                     measurement_reqs)
+                                                                     measurement_reqs,
+                                                                     analysis)
         
         # count number of groundpoints
         for _,agent_orbitdata in orbitdata.items():
@@ -341,90 +409,33 @@ class Mission:
     def classify_observations(self, 
                               observations_performed : pd.DataFrame,
                               events : pd.DataFrame,
-                              measurement_reqs : pd.DataFrame
+                              measurement_reqs : pd.DataFrame,
+                              analysis : ResultsAnalysis = None
                               ) -> tuple:
-               
-        # count event presense, detections, and observations
-        events_per_gp : Dict[tuple, list] = {}
-        events_detected : Dict[tuple, list] = {}
-        events_observed : Dict[tuple, list] = {}
-
-        for event in tqdm(events.values, desc='Calssifying event observations', leave=False):
-            # unpackage event
-            event = tuple(event)
-            _, lat,lon,t_start,duration,severity,observations_req = event
-            
-            # classify events by their target groundpoint
-            if (lat,lon) not in events_per_gp:
-                events_per_gp[(lat,lon)] = []
-                
-            events_per_gp[(lat,lon)].append([t_start,duration,severity,observations_req])
-
-            # find measurement requests that match this event
-            matching_requests = [   (id_req, requester, lat_req, lon_req, severity_req, t_start_req, t_end_req, t_corr_req, observation_types)
-                                    for id_req, requester, lat_req, lon_req, severity_req, t_start_req, t_end_req, t_corr_req, observation_types in measurement_reqs.values
-                                    if  abs(lat - lat_req) < 1e-2 
-                                    and abs(lon - lon_req) < 1e-2
-                                    and t_start <= t_start_req <= t_end_req <= t_start+duration
-                                    and all([instrument in observations_req for instrument in str_to_list(observation_types)])
-                                ]          
-
-            if matching_requests:
-                events_detected[event] = matching_requests
-
-            # find observations that overlooked a given event's location
-            matching_observations = [(lat, lon, t_start, duration, severity, observer, t_img, instrument, observations_req)
-                                        for observer,t_img,lat_img,lon_img,*_,instrument in observations_performed.values
-                                        if abs(lat - lat_img) < 1e-3 
-                                    and abs(lon - lon_img) < 1e-3
-                                    and t_start <= t_img <= t_start+duration
-                                    and instrument in observations_req  #TODO include better reasoning!
-                                        ]  
-            if matching_observations:
-                events_observed[event] = matching_observations
-        
-        # find reobserved events
-        events_re_obs = {event: observations 
-                                for event,observations in events_observed.items()
-                                if len(observations) > 1}
-        
-        # find coobserved events
-        events_co_obs : Dict[tuple, list] = {}
-        events_co_obs_fully : Dict[tuple, list] = {}
-        events_co_obs_partially : Dict[tuple, list] = {}
-
-        for event,observations in tqdm(events_observed.items(), desc='Calssifying observations', leave=False):
-            # get required measurements for a given event
-            *_,observations_req = observations[-1]
-            observations_req : list = str_to_list(observations_req)
-            
-            # check if valid observations match this event
-            valid_observations = list({(lat, lon, t_start, duration, severity, observer, t_img, instrument, observations_req) 
-                                        for lat, lon, t_start, duration, severity, observer, t_img, instrument, observations_req in observations
-                                        if instrument in observations_req})
-            if valid_observations:
-                if len(valid_observations) == len(observations_req):
-                    events_co_obs_fully[event] = valid_observations
+        # match events to requests and observations if not done already
+        if analysis is None: 
+            analysis = ResultsAnalysis(observations_performed, events, measurement_reqs)
 
-                elif len(valid_observations) > 1:
-                    events_co_obs_partially[event] = valid_observations
-
-                events_co_obs[event] = valid_observations
-
-        return events_per_gp, events_detected, events_observed, events_re_obs, events_co_obs, events_co_obs_fully, events_co_obs_partially
+        return analysis.events_per_gp, analysis.events_detected, analysis.events_observed, \
+                analysis.events_re_obs, analysis.events_co_obs, analysis.events_co_obs_fully, \
+                    analysis.events_co_obs_partially
     
     def calc_event_probabilities(self,
                                  orbitdata : dict, 
                                  observations_performed : pd.DataFrame, 
                                  events : pd.DataFrame,
-                                 measurement_reqs : pd.DataFrame
+                                 measurement_reqs : pd.DataFrame,
+                                 analysis : ResultsAnalysis = None
                                  ) -> tuple:
         # classify performed observations
+        if analysis is None: 
+            analysis = ResultsAnalysis(observations_performed, events, measurement_reqs)
         events_per_gp, events_detected, events_observed, \
             events_re_obs, events_co_obs, events_co_obs_fully, \
                 events_co_obs_partially = self.classify_observations(observations_performed,
                                                                      events,
-                                                                     measurement_reqs)
+                                                                     measurement_reqs,
+                                                                     analysis)
     
         # count observations by type
         n_gps, n_events, n_events_detected, n_events_observed, \
@@ -434,7 +445,8 @@ class Mission:
                         = self.count_observations(orbitdata,
                                                   observations_performed,
                                                   events,
-                                                  measurement_reqs)
+                                                  measurement_reqs,
+                                                  analysis)
                     
         # count number of groundpoints with events
         n_gps_with_events = len(events_per_gp)
@@ -495,37 +507,13 @@ class Mission:
     def calc_event_coverage_metrics(self,
                                     observations_performed : pd.DataFrame, 
                                     events : pd.DataFrame,
-                                    measurement_reqs : pd.DataFrame
+                                    measurement_reqs : pd.DataFrame,
+                                    analysis : ResultsAnalysis = None
                                     ) -> tuple:
-        # classify performed observations
-        grouped_observations = {}
-        for observer,t_img,lat_img,lon_img,*_,instrument in observations_performed.values:
-            if (lat_img, lon_img) not in grouped_observations:
-                grouped_observations[(lat_img, lon_img)] = []
-
-            grouped_observations[(lat_img, lon_img)].append((observer,t_img,lat_img,lon_img,*_,instrument))
-
-        # event reobservation times
-        t_reobservations : list = []
-        for _,observations in grouped_observations.items():
-            prev_observation = None
-            for observation in observations:
-                if prev_observation is None:
-                    prev_observation = observation
-                    continue
-
-                # get observation times
-                _,t,*_ = observation
-                _,t_prev,*_ = prev_observation
-
-                # calculate revisit
-                t_reobservation = t-t_prev
-
-                # add to list
-                t_reobservations.append(t_reobservation)
-
-                # update previous observation
-                prev_observation = observation
+        # calculate revisit times of every observed location
+        if analysis is None: 
+            analysis = ResultsAnalysis(observations_performed, events, measurement_reqs)
+        t_reobservations : list = list(analysis.calc_reobservation_times())
         
         # compile statistical data
         t_reobservation : dict = {
@@ -551,7 +539,8 @@ class SimulationElementsFactory:
                             port : int, 
                             agent_type : SimulationAgentTypes,
                             level : int,
-                            logger : logging.Logger
+                            logger : logging.Logger,
+                            transport : TransportTypes = TransportTypes.TCP
                         ) -> SimulationAgent:
         """
         Creates an agent from a list of parameters
@@ -568,11 +557,13 @@ class SimulationElementsFactory:
         agent_network_config : NetworkConfig \
             = SimulationElementsFactory.create_agent_network_config(manager_network_config, 
                                                             scenario_name, 
-                                                            port)
+                                                            port,
+                                                            transport)
 
         # load orbitdata
         if orbitdata_dir is not None:
             agent_orbitdata : OrbitData = OrbitData.load(orbitdata_dir, agent_name)
+            agent_orbitdata.contacts = ContactTimeline.load(orbitdata_dir)
         else:
             agent_orbitdata = None
 
@@ -609,6 +600,10 @@ class SimulationElementsFactory:
             l : str = time_data.at[1,time_data.axes[1][0]]
             _, _, _, _, dt = l.split(' '); dt = float(dt)
 
+            # interpolate satellite states from pre-computed orbit data
+            if agent_orbitdata is not None:
+                SatelliteAgentState.register_ephemeris(agent_name, agent_orbitdata)
+
             initial_state = SatelliteAgentState(agent_name,
                                                 orbit_state_dict,
                                                 time_step=dt) 
@@ -630,7 +625,8 @@ class SimulationElementsFactory:
 
     def create_agent_network_config(manager_network_config : NetworkConfig, 
                                     scenario_name : str, 
-                                    port : int
+                                    port : int,
+                                    transport : TransportTypes = TransportTypes.TCP
                                     ) -> NetworkConfig:
         manager_addresses : dict = manager_network_config.get_manager_addresses()
         req_address : str = manager_addresses.get(zmq.REP)[0]
@@ -652,14 +648,14 @@ class SimulationElementsFactory:
                                         zmq.PUSH: [push_address]},
                                 external_address_map = {
                                         zmq.REQ: [],
-                                            zmq.SUB: [f'tcp://localhost:{port+1}'],
-                                            zmq.PUB: [f'tcp://*:{port+2}']},
+                                            zmq.SUB: [get_address(transport, scenario_name, port+1, False)],
+                                            zmq.PUB: [get_address(transport, scenario_name, port+2, True)]},
                                 internal_address_map = {
-                                        zmq.REP: [f'tcp://*:{port+3}'],
-                                        zmq.PUB: [f'tcp://*:{port+4}'],
+                                        zmq.REP: [get_address(transport, scenario_name, port+3, True)],
+                                        zmq.PUB: [get_address(transport, scenario_name, port+4, True)],
                                         zmq.SUB: [  
-                                                    f'tcp://localhost:{port+5}',
-                                                    f'tcp://localhost:{port+6}'
+                                                    get_address(transport, scenario_name, port+5, False),
+                                                    get_address(transport, scenario_name, port+6, False)
                                                 ]
                             })
 
@@ -681,7 +677,7 @@ class SimulationElementsFactory:
         end_date = start_date + delta
 
         # generate simulation clock config 
-        if clock_type.lower() == 'step': # generate fixed time-step clock
+        if clock_type.lower() in ['step', 'skip']: # generate fixed time-step clock
             
             # check if spacecraft are present in the simulation
             if spacecraft_dict: # use propagator time-step
@@ -702,12 +698,31 @@ class SimulationElementsFactory:
                 if dt is None: raise ValueError('`stepSize` not defined in input file.')
 
             # return clock config
+            if clock_type.lower() == 'skip': 
+                # skip time-steps in which no simulation element acts
+                return TimeSkippingClockConfig(start_date, end_date, dt)
             return FixedTimesStepClockConfig(start_date, end_date, dt)
 
+        elif clock_type.lower() == 'batched':
+            # return event-driven clock config with standing wake-up times
+            return BatchedClockConfig(start_date, end_date)
+
         else:
             # return event-driven clock config
             return EventDrivenClockConfig(start_date, end_date)
 
+    def load_event_times(orbitdata : dict) -> list:
+        """
+        Collects the times [s] at which the eclipse status, connectivity, or ground point accesses of any agent in the simulation may change
+        """
+        # check if orbitdata is available
+        if orbitdata is None: return []
+
+        # collect event times for every agent
+        event_times = [agent_orbitdata.get_event_times() for _,agent_orbitdata in orbitdata.items()]
+
+        return list(np.unique(np.concatenate(event_times))) if event_times else []
+
     def load_events(scenario_dict : dict, 
                     grid_dict : list,
                     clock_config : ClockConfig
@@ -893,6 +908,7 @@ class SimulationElementsFactory:
                 reward_grid_params['reward_function'] = reward_func
                 reward_grid_params['specs'] = agent_specs
                 reward_grid_params['grid_data'] = agent_orbitdata.grid_data
+                reward_grid_params['ground_points'] = agent_orbitdata.get_ground_point_index()
                 reward_grid_params['reobservation_strategy'] = reobs_strategy
 
                 # create reward gri
@@ -926,7 +942,9 @@ class SimulationElementsFactory:
                     if period > horizon: raise ValueError('replanning period must be greater than planning horizon.')
 
                     sharing = bool(preplanner_dict.get('sharing', 'false').lower() in ['true', 't'])
-                    preplanner = DynamicProgrammingPlanner(sharing, horizon, period, debug, logger)
+                    engine = preplanner_dict.get('engine', DynamicProgrammingPlanner.DEFAULT).lower()
+                    max_workers = int(preplanner_dict.get('max workers', 1))
+                    preplanner = DynamicProgrammingPlanner(sharing, horizon, period, engine, max_workers, debug, logger)
                 
                 # elif... # add more planners here
                 
@@ -949,20 +967,36 @@ class SimulationElementsFactory:
                     max_bundle_size = replanner_dict.get('bundle size', 3)
                     threshold = replanner_dict.get('threshold', 1)
                     horizon = replanner_dict.get('horizon', np.Inf)
+                    search_strategy = replanner_dict.get('search', ACBBAPlanner.BFS).lower()
+                    beam_width = int(replanner_dict.get('beam width', 3))
+                    memoize = bool(str(replanner_dict.get('memoize', 'true')).lower() in ['true', 't'])
+                    batch_bids = bool(str(replanner_dict.get('batch bids', 'false')).lower() in ['true', 't'])
 
                     replanner = ACBBAPlanner(max_bundle_size, 
                                              threshold, 
                                              horizon,
+                                             search_strategy,
+                                             beam_width,
+                                             memoize,
+                                             batch_bids,
                                              debug,
                                              logger)
                 elif replanner_type.lower() == 'acbba-dp': 
                     max_bundle_size = replanner_dict.get('bundle size', 3)
                     threshold = replanner_dict.get('threshold', 1)
                     horizon = replanner_dict.get('horizon', np.Inf)
+                    search_strategy = replanner_dict.get('search', ACBBAPlanner.BFS).lower()
+                    beam_width = int(replanner_dict.get('beam width', 3))
+                    memoize = bool(str(replanner_dict.get('memoize', 'true')).lower() in ['true', 't'])
+                    batch_bids = bool(str(replanner_dict.get('batch bids', 'false')).lower() in ['true', 't'])
 
                     replanner = DynamicProgrammingACBBAReplanner(max_bundle_size, 
                                                                 threshold, 
                                                                 horizon,
+                                                                search_strategy,
+                                                                beam_width,
+                                                                memoize,
+                                                                batch_bids,
                                                                 debug,
                                                                 logger)
                 
@@ -11,16 +11,18 @@ from instrupy.base import BasicSensorModel
 from instrupy.util import SphericalGeometry, ViewGeometry
 
 from chess3d.agents.science.requests import *
-from chess3d.agents.orbitdata import OrbitData
+from chess3d.agents.orbitdata import ConnectivityTimeline, ContactTimeline, GroundPointIndex, IntervalIndex, OrbitData
 from chess3d.agents.states import *
 from chess3d.agents.states import SimulationAgentState
 from chess3d.messages import *
+from chess3d.nodes.sinks import ResultsSink
+from chess3d.transport import ContextElement
 
 from dmas.environments import *
 from dmas.messages import *
 
 
-class SimulationEnvironment(EnvironmentNode):
+class SimulationEnvironment(ContextElement, EnvironmentNode):
     """
     ## Simulation Environment
 
@@ -33,6 +35,12 @@ class SimulationEnvironment(EnvironmentNode):
     UAV = 'UAV'
     GROUND_STATION = 'GROUND_STATION'
 
+    # columns of the results tables
+    BROADCAST_COLUMNS = ['t_msg', 'Sender', 'Message Type', 
+                        #  'Message'
+                         ]
+    REQUEST_COLUMNS = ['ID', 'Requester', 'lat [deg]', 'lon [deg]', 'Severity', 't start', 't end', 't corr', 'Measurment Types']
+
     def __init__(self, 
                 results_path : str, 
                 orbitdata_dir : str,
@@ -43,15 +51,19 @@ class SimulationEnvironment(EnvironmentNode):
                 manager_network_config: NetworkConfig, 
                 connectivity : str = 'full',
                 events_path : str = None,
+                results_buffer_size : int = 1000,
                 level: int = logging.INFO, 
-                logger: logging.Logger = None) -> None:
+                logger: logging.Logger = None,
+                orbitdata : dict = None) -> None:
         super().__init__(env_network_config, manager_network_config, [], level, logger)
 
         # setup results folder:
         self.results_path : str = os.path.join(results_path, self.get_element_name().lower())
 
-        # load observation data
-        self.orbitdata : dict = OrbitData.from_directory(orbitdata_dir) if orbitdata_dir is not None else None
+        # load observation data unless already loaded
+        if orbitdata is None and orbitdata_dir is not None:
+            orbitdata = OrbitData.from_directory(orbitdata_dir)
+        self.orbitdata : dict = orbitdata
 
         # load agent names and classify by type of agent
         self.agents = {}
@@ -89,10 +101,11 @@ class SimulationEnvironment(EnvironmentNode):
 
         # load events
         self.events : pd.DataFrame = self.load_events(events_path)
+        self.event_locations : GroundPointIndex = GroundPointIndex(self.events.iloc[:,1].values, self.events.iloc[:,2].values) \
+                                                  if self.events is not None else None
 
         # initialize parameters
         self.connectivity = connectivity
-        self.observation_history = []
         self.agent_connectivity = {}
         for src in agent_names:
             for target in agent_names:
@@ -100,14 +113,20 @@ class SimulationEnvironment(EnvironmentNode):
                     self.agent_connectivity[src] = {}    
                 
                 self.agent_connectivity[src][target] = -1
+        self.connectivity_timeline : ConnectivityTimeline = self.compile_connectivity_timeline()
         self.agent_state_update_times = {}
 
-        self.measurement_reqs = []
         self.stats = {}
         self.t_0 = None
         self.t_f = None
 
-        self.broadcasts_history = []
+        # initialize results sinks; rows are streamed to disk during the simulation
+        self.observations_sink = ResultsSink(os.path.join(self.results_path, 'measurements.csv'), 
+                                             buffer_size=results_buffer_size)
+        self.broadcasts_sink = ResultsSink(os.path.join(self.results_path, 'broadcasts.csv'), 
+                                           self.BROADCAST_COLUMNS, results_buffer_size)
+        self.requests_sink = ResultsSink(os.path.join(self.results_path, 'requests.csv'), 
+                                         self.REQUEST_COLUMNS, results_buffer_size)
         
     def load_events(self, events_path : str) -> pd.DataFrame:
         """ Loads events present in the simulation """
@@ -229,12 +248,12 @@ class SimulationEnvironment(EnvironmentNode):
             req_msg = MeasurementRequestMessage(**content)
             measurement_req : MeasurementRequest = MeasurementRequest.from_dict(req_msg.req)
 
-            # add to list of received measurement requests 
-            self.measurement_reqs.append(measurement_req)
+            # save received measurement request
+            self.requests_sink.append(self.compile_request(measurement_req))
 
-        # add to list of received broadcasts
+        # save received broadcast
         content['t_msg'] = self.get_current_time()
-        self.broadcasts_history.append(content)
+        self.broadcasts_sink.append(self.compile_broadcast(content))
 
         return True
 
@@ -288,7 +307,7 @@ class SimulationEnvironment(EnvironmentNode):
         resp.observation_data = observation_data
 
         # save observation
-        self.observation_history.append(resp)
+        self.observations_sink.extend(self.compile_observations(resp))
 
         # return observation response
         return resp
@@ -365,36 +384,46 @@ class SimulationEnvironment(EnvironmentNode):
         # look up orbit state
         return orbitdata.get_orbit_state(t)
     
+    def compile_connectivity_timeline(self) -> ConnectivityTimeline:
+        """ Compiles the link up/down events between every pair of agents in the simulation """
+        contacts : ContactTimeline = next(iter(self.orbitdata.values())).contacts if self.orbitdata else None
+        time_step = contacts.time_step if contacts is not None else 1.0
+
+        links = {}
+        for src_type in self.agents:
+            for src in self.agents[src_type]:
+                links[src] = {target : self.get_connectivity_windows(src, target, target_type)
+                              for target_type in self.agents
+                              for target in self.agents[target_type]
+                              if target != src}
+
+        return ConnectivityTimeline(time_step, links)
+
     @runtime_tracker
     def update_agent_connectivity(self, msg : SimulationMessage) -> list:
         # initiate update list
         resp_msgs = []
 
-        # check connectivity status
-        for target_type in self.agents:
-            for target in self.agents[target_type]:
-                # do not compare to self
-                if target == msg.src: continue
-                
-                # check updated connectivity
-                connected = self.check_agent_connectivity(msg.src, target, target_type)
-                
-                # check if it changes from previously known connectivity state
-                if connected == 0 and self.agent_connectivity[msg.src][target] == -1:
-                    # no change found; do not announce
-                    pass
+        # check links that changed status since the last update
+        for target, connected in self.connectivity_timeline.advance(msg.src, self.get_current_time()):
+            connected = int(connected)
+            
+            # check if it changes from previously known connectivity state
+            if connected == 0 and self.agent_connectivity[msg.src][target] == -1:
+                # no change found; do not announce
+                pass
 
-                    # update internal state
-                    self.agent_connectivity[msg.src][target] = connected
-                    continue
+                # update internal state
+                self.agent_connectivity[msg.src][target] = connected
+                continue
 
-                if self.agent_connectivity[msg.src][target] != connected:
-                    # change found; make announcement 
-                    connectivity_update = AgentConnectivityUpdate(msg.src, target, connected)
-                    resp_msgs.append(connectivity_update.to_dict())
+            if self.agent_connectivity[msg.src][target] != connected:
+                # change found; make announcement 
+                connectivity_update = AgentConnectivityUpdate(msg.src, target, connected)
+                resp_msgs.append(connectivity_update.to_dict())
 
-                    # update internal state
-                    self.agent_connectivity[msg.src][target] = connected
+                # update internal state
+                self.agent_connectivity[msg.src][target] = connected
 
         return resp_msgs
     
@@ -411,6 +440,25 @@ class SimulationEnvironment(EnvironmentNode):
         #### Returns:
             - connected (`int`): binary value representing if the `src` and `target` are connected
         """
+        windows = self.get_connectivity_windows(src, target, target_type)
+        
+        if isinstance(windows, IntervalIndex):
+            return int(windows.contains(self.get_current_time() / self.connectivity_timeline.time_step))
+
+        return int(windows)
+
+    def get_connectivity_windows(self, src : str, target : str, target_type : str) -> object:
+        """
+        Returns the windows in which an agent is in communication range with another agent
+
+        #### Arguments:
+            - src (`str`): name of agent starting the connection
+            - target (`str`): name of agent receving the connection
+            - target_type (`str`): type of agent receving the connection
+
+        #### Returns:
+            - windows (`IntervalIndex` or `bool`): access windows between `src` and `target` in time indeces, or `bool` if their connectivity is constant
+        """
         if self.connectivity == 'FULL': return True
 
         connected = False
@@ -418,23 +466,26 @@ class SimulationEnvironment(EnvironmentNode):
             if src in self.agents[self.SPACECRAFT]:
                 # check orbit data
                 src_data : OrbitData = self.orbitdata[src]
-                connected = src_data.is_accessing_agent(target, self.get_current_time())
+                if target in src_data.agent_name:
+                    connected = True
+                elif target in src_data.isl_data.keys():
+                    connected = src_data.contacts.get_windows(src, target) or False
                 
             elif src in self.agents[self.UAV]:
                 # check orbit data with nearest GS
                 target_data : OrbitData = self.orbitdata[target]
-                connected = target_data.is_accessing_ground_station(target, self.get_current_time())
+                connected = target_data.contacts.get_windows(target, target) or False
             
             elif src in self.agents[self.GROUND_STATION]:
                 # check orbit data
                 target_data : OrbitData = self.orbitdata[target]
-                connected = target_data.is_accessing_ground_station(target, self.get_current_time())
+                connected = target_data.contacts.get_windows(target, target) or False
         
         elif target_type == self.UAV:
             if src in self.agents[self.SPACECRAFT]:
                 # check orbit data with nearest GS
                 src_data : OrbitData = self.orbitdata[src]
-                connected = src_data.is_accessing_ground_station(target, self.get_current_time())
+                connected = src_data.contacts.get_windows(src, target) or False
 
             elif src in self.agents[self.UAV]:
                 # always connected
@@ -448,7 +499,7 @@ class SimulationEnvironment(EnvironmentNode):
             if src in self.agents[self.SPACECRAFT]:
                 # check orbit data
                 src_data : OrbitData = self.orbitdata[src]
-                connected = src_data.is_accessing_ground_station(target, self.get_current_time())
+                connected = src_data.contacts.get_windows(src, target) or False
 
             elif src in self.agents[self.UAV]:
                 # always connected
@@ -458,7 +509,7 @@ class SimulationEnvironment(EnvironmentNode):
                 # always connected
                 connected = True
 
-        return int(connected)
+        return connected
 
     @runtime_tracker
     def query_measurement_data( self,
@@ -468,84 +519,91 @@ class SimulationEnvironment(EnvironmentNode):
         """
         Queries internal models or data and returns observation information being sensed by the agent
         """
+        return self.query_measurement_data_batch([agent_state], [instrument])[0]
+
+    def __compile_measurement_data(self, coverage_data : dict, mask : np.ndarray, time_step : float) -> list:
+        """ Converts the selected rows of a set of ground point access column arrays into observation data entries """
+        columns = {key : coverage_data[column][mask].tolist()
+                   for key, column in [('t_img', 'time index'),
+                                       ('lat', 'lat [deg]'),
+                                       ('lon', 'lon [deg]'),
+                                       ('range', 'observation range [km]'),
+                                       ('look', 'look angle [deg]'),
+                                       ('incidence', 'incidence angle [deg]'),
+                                       ('zenith', 'solar zenith [deg]'),
+                                       ('instrument_name', 'instrument')]}
+        columns['t_img'] = [t_img*time_step for t_img in columns['t_img']]
+
+        return [dict(zip(columns.keys(), values)) for values in zip(*columns.values())]
 
-        if isinstance(agent_state, SatelliteAgentState):
-            agent_orbitdata : OrbitData = self.orbitdata[agent_state.agent_name]
+    @runtime_tracker
+    def query_measurement_data_batch(self, 
+                                     agent_states : list, 
+                                     instruments : list
+                                     ) -> list:
+        """
+        Queries the observation information being sensed by a batch of agents, 
+        where `instruments[i]` is the instrument being used by the agent in `agent_states[i]`.
 
-            # get time indexes and bounds
-            t = agent_state.t/agent_orbitdata.time_step
-            t_u = t + 1
-            t_l = t - 1
-            
-            # get names of the columns of the available coverage data
-            orbitdata_columns : list = list(agent_orbitdata.gp_access_data.columns.values)
-            
-            # get satellite's off-axis angle
-            satellite_off_axis_angle = agent_state.attitude[0]
+        ### Returns:
+            - `list` containing the observation data of each of the observations in the batch
+        """
+        if len(agent_states) != len(instruments):
+            raise ValueError(f'Number of agent states ({len(agent_states)}) and instruments ({len(instruments)}) must match.')
+
+        # group observations by observer and instrument
+        groups = {}
+        for i, (agent_state, instrument) in enumerate(zip(agent_states, instruments)):
+            agent_state : SimulationAgentState; instrument : Instrument
+            if not isinstance(agent_state, SatelliteAgentState):
+                raise NotImplementedError(f"Measurement results query not yet supported for agents with state of type {type(agent_state)}")
             
-            # collect data for every instrument model onboard
-            obs_data = []
-            for instrument_model in instrument.mode:
-                # get observation FOV from instrument model
-                if isinstance(instrument_model, BasicSensorModel):
-                    instrument_fov : ViewGeometry = instrument_model.get_field_of_view()
-                    instrument_fov_geometry : SphericalGeometry = instrument_fov.sph_geom
-                    instrument_off_axis_fov = instrument_fov_geometry.angle_width / 2.0
-                else:
-                    raise NotImplementedError(f'measurement data query not yet suported for sensor models of type {type(instrument_model)}.')
-
-                # query coverage data of everything that is within the field of view of the agent
-                raw_coverage_data = [list(data)
-                                    for data in agent_orbitdata.gp_access_data.values
-                                    if t_l < data[orbitdata_columns.index('time index')] < t_u # is being observed at this given time
-                                    and data[orbitdata_columns.index('instrument')] == instrument.name # is being observed by the correct instrument
-                                    and abs(satellite_off_axis_angle - data[orbitdata_columns.index('look angle [deg]')]) <= instrument_off_axis_fov # agent is pointing at the ground point
-                                    ]
-                
-                raw_coverage_data_no_fov = [
-                                    list(data)
-                                    for data in agent_orbitdata.gp_access_data.values
-                                    if t_l < data[orbitdata_columns.index('time index')] < t_u # is being observed at this given time
-                                    and data[orbitdata_columns.index('instrument')] == instrument.name # is being observed by the correct instrument
-                                    ]
+            key = (agent_state.agent_name, instrument.name)
+            if key not in groups: groups[key] = []
+            groups[key].append(i)
+
+        # resolve each group of observations 
+        obs_data = [[] for _ in agent_states]
+        for (agent_name, instrument_name), indices in groups.items():
+            agent_orbitdata : OrbitData = self.orbitdata[agent_name]
+            access_index : dict = agent_orbitdata.get_gp_access_index(instrument_name)
+
+            # find the time windows of all observations in the group at once
+            t = np.array([agent_states[i].t for i in indices]) / agent_orbitdata.time_step
+            i_starts = np.searchsorted(access_index['time index'], t - 1, side='right')
+            i_ends = np.searchsorted(access_index['time index'], t + 1, side='left')
+
+            for i, i_start, i_end in zip(indices, i_starts, i_ends):
+                agent_state : SatelliteAgentState = agent_states[i]
+                instrument : Instrument = instruments[i]
+                coverage_data = {column : values[i_start:i_end] for column, values in access_index.items()}
                 
-                # if not raw_coverage_data and raw_coverage_data_no_fov:
-                #     for data in raw_coverage_data_no_fov:
-                #         look_angle_index = orbitdata_columns.index('look angle [deg]')
-                #         look_angle = data[look_angle_index]
-                #         pointing_angle = satellite_off_axis_angle
-
-                #         in_fov = abs(look_angle - pointing_angle) <= instrument_off_axis_fov/2.0
-                #         x= 1
-                #     x = 1
-
-                # compile data
-                for data in raw_coverage_data:                    
-                    obs_data.append({
-                        "t_img"     : data[orbitdata_columns.index('time index')]*agent_orbitdata.time_step,
-                        "lat"       : data[orbitdata_columns.index('lat [deg]')],
-                        "lon"       : data[orbitdata_columns.index('lon [deg]')],
-                        "range"     : data[orbitdata_columns.index('observation range [km]')],
-                        "look"      : data[orbitdata_columns.index('look angle [deg]')],
-                        "incidence" : data[orbitdata_columns.index('incidence angle [deg]')],
-                        "zenith"         : data[orbitdata_columns.index('solar zenith [deg]')],
-                        "instrument_name": data[orbitdata_columns.index('instrument')]
-                    })
-
-            # return processed observation data
-            return obs_data
+                for instrument_model in instrument.mode:
+                    # get observation FOV from instrument model
+                    if isinstance(instrument_model, BasicSensorModel):
+                        instrument_fov : ViewGeometry = instrument_model.get_field_of_view()
+                        instrument_off_axis_fov = instrument_fov.sph_geom.angle_width / 2.0
+                    else:
+                        raise NotImplementedError(f'measurement data query not yet suported for sensor models of type {type(instrument_model)}.')
 
-        else:
-            raise NotImplementedError(f"Measurement results query not yet supported for agents with state of type {type(agent_state)}")
+                    # filter for ground points within the field of view of the agent
+                    in_fov = np.abs(agent_state.attitude[0] - coverage_data['look angle [deg]']) <= instrument_off_axis_fov
+
+                    # compile data
+                    obs_data[i].extend(self.__compile_measurement_data(coverage_data, in_fov, agent_orbitdata.time_step))
+
+        return obs_data
 
     def query_event_data(self, lat_img, lon_img, t_img, instrument_name) -> list:
         """ Checks any of the events in its database is being observed and return its severity and required measurements """
 
+        if self.events is None: return []
+
+        # only consider events located at the observed coordinates
+        located_events = self.events.values[self.event_locations.query_box(lat_img, lon_img, 0.0)]
         return [{"severity" : severity, "measurements" : measurements }
-                for lat,lon,t_start,duration,severity,measurements in self.events.values
-                if lat==lat_img 
-                and lon==lon_img
-                and t_start<= t_img <=t_start+duration
+                for _,_,_,t_start,duration,severity,measurements in located_events
+                if t_start<= t_img <=t_start+duration
                 and instrument_name in measurements  #TODO include better reasoning]
                 ]
     
@@ -558,26 +616,17 @@ class SimulationEnvironment(EnvironmentNode):
             # print final time
             self.log(f'Environment shutdown with internal clock of {self.get_current_time()}[s]', level=logging.WARNING)
             
-            # compile observations performed
-            observations_performed : pd.DataFrame = self.compile_observations()
-
-            # log and save results
-            self.log(f"MEASUREMENTS RECEIVED:\n{len(observations_performed.values)}\n\n", level=logging.WARNING)
-            observations_performed.to_csv(f"{self.results_path}/measurements.csv", index=False)
+            # write remaining observations performed and log results
+            self.observations_sink.close()
+            self.log(f"MEASUREMENTS RECEIVED:\n{self.observations_sink.n_rows}\n\n", level=logging.WARNING)
             
-            # commpile list of broadcasts performed
-            broadcasts_performed : pd.DataFrame = self.compile_broadcasts()
-
-            # log and save results
-            self.log(f"BROADCASTS RECEIVED:\n{len(broadcasts_performed.values)}\n\n", level=logging.WARNING)
-            broadcasts_performed.to_csv(f"{self.results_path}/broadcasts.csv", index=False)
+            # write remaining broadcasts performed and log results
+            self.broadcasts_sink.close()
+            self.log(f"BROADCASTS RECEIVED:\n{self.broadcasts_sink.n_rows}\n\n", level=logging.WARNING)
 
-            # compile list of measurement requests 
-            measurement_reqs : pd.DataFrame = self.compile_requests()
-
-            # log and save results
-            self.log(f"MEASUREMENT REQUESTS RECEIVED:\n{len(measurement_reqs.values)}\n\n", level=logging.WARNING)
-            measurement_reqs.to_csv(f"{self.results_path}/requests.csv", index=False)
+            # write remaining measurement requests and log results
+            self.requests_sink.close()
+            self.log(f"MEASUREMENT REQUESTS RECEIVED:\n{self.requests_sink.n_rows}\n\n", level=logging.WARNING)
 
             # log performance stats
             columns = ['routine','t_avg','t_std','t_med','n','t_total']
@@ -611,57 +660,30 @@ class SimulationEnvironment(EnvironmentNode):
             print(e.with_traceback())
             raise e        
             
-    def compile_observations(self) -> pd.DataFrame:
-        columns = None
-        data = []
-        for msg in self.observation_history:
-            msg : ObservationResultsMessage
-            observation_data : list = msg.observation_data
-            observer = msg.dst
-
-            for obs in observation_data:
-                
-                # find column names 
-                if columns is None:
-                    columns = [key for key in obs]
-                    columns.insert(0, 'observer')
-                    
-                # add observation to data list
-                obs['observer'] = observer
-                data.append([obs[key] for key in columns])
-
-        return pd.DataFrame(data=data, columns=columns)
+    def compile_observations(self, msg : ObservationResultsMessage) -> list:
+        """ Converts the observation data of an observation results message into rows of the measurements table """
+        observer = msg.dst
+        return [{'observer' : observer, **obs} for obs in msg.observation_data]
     
-    def compile_broadcasts(self) -> pd.DataFrame:
-        columns = ['t_msg', 'Sender', 'Message Type', 
-                #    'Message'
-                   ]
-        data = []
-
-        for msg in self.broadcasts_history:
-            msg : dict
-            data.append([msg['t_msg'],
-                         msg['src'],
-                         msg['msg_type'],
-                        #  json.dumps(msg)
-                         ]) 
-            
-        return pd.DataFrame(data=data, columns=columns)
+    def compile_broadcast(self, msg : dict) -> list:
+        """ Converts a received broadcast into a row of the broadcasts table """
+        return [msg['t_msg'],
+                msg['src'],
+                msg['msg_type'],
+                # json.dumps(msg)
+                ]
     
-    def compile_requests(self) -> pd.DataFrame:
-        columns = ['ID', 'Requester', 'lat [deg]', 'lon [deg]', 'Severity', 't start', 't end', 't corr', 'Measurment Types']
-        data = [[req.id,
-                 req.requester,
-                 req.target[0],
-                 req.target[1],
-                 req.severity,
-                 req.t_start,
-                 req.t_end,
-                 req.t_corr,
-                 req.observation_types] 
-                 for req in self.measurement_reqs]
-
-        return pd.DataFrame(data=data, columns=columns)
+    def compile_request(self, req : MeasurementRequest) -> list:
+        """ Converts a received measurement request into a row of the requests table """
+        return [req.id,
+                req.requester,
+                req.target[0],
+                req.target[1],
+                req.severity,
+                req.t_start,
+                req.t_end,
+                req.t_corr,
+                req.observation_types]
 
     def calc_coverage_metrics(self) -> tuple:
         # TODO improve performance or load precomputed vals
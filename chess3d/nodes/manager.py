@@ -1,3 +1,4 @@
+import heapq
 import logging
 import math
 import os
@@ -9,8 +10,85 @@ from dmas.elements import ClockConfig, NetworkConfig, logging
 from dmas.managers import *
 
 from chess3d.messages import *
+from chess3d.transport import ContextElement
 
-class SimulationManager(AbstractManager):
+class TimeSkippingClockConfig(FixedTimesStepClockConfig):
+    """
+    ## Time-Skipping Clock Configuration
+
+    Fixed time-step clock in which the simulation manager skips every time-step in which no 
+    element of the simulation has anything to do. Times announced by the manager remain 
+    on the fixed time-step grid.
+    """
+
+class BatchedClockConfig(EventDrivenClockConfig):
+    """
+    ## Batched Clock Configuration
+
+    Event-driven clock in which simulation elements register standing wake-up times with the simulation manager.
+    The manager announces the earliest registered wake-up time with a single toc broadcast, and only the elements
+    whose wake-up time has been reached need to register a new one before the clock advances again. Elements that
+    wake up early, e.g. when receiving a message, cancel their standing wake-up time and register a new one.
+    """
+
+class WakeUpQueue:
+    """
+    ## Wake-Up Queue
+
+    Keeps track of the standing wake-up times registered by the elements of a simulation.
+
+    Wake-up times are kept in a priority queue. Cancelled or replaced wake-up times are discarded lazily when they
+    reach the front of the queue. Elements without a standing wake-up time are pending, and the simulation clock
+    may only advance once no elements are pending.
+    """
+    def __init__(self, elements : list) -> None:
+        """
+        ### Arguments:
+            - elements (`list`): names of the elements that register wake-up times
+        """
+        self.wake_times : dict = dict()
+        self.queue : list = []
+        self.pending : set = set(elements)
+
+    def register(self, element : str, t_wake : float) -> None:
+        """ Registers the standing wake-up time [s] of an element, replacing any previous one """
+        self.wake_times[element] = t_wake
+        heapq.heappush(self.queue, (t_wake, element))
+        self.pending.discard(element)
+
+    def cancel(self, element : str) -> None:
+        """ Cancels the standing wake-up time of an element. The element must register a new one before the clock can advance. """
+        self.wake_times.pop(element, None)
+        self.pending.add(element)
+
+    def is_ready(self) -> bool:
+        """ Checks if every element has a standing wake-up time """
+        return not self.pending
+
+    def __discard_stale(self) -> None:
+        """ Removes cancelled or replaced wake-up times from the front of the queue """
+        while self.queue and self.wake_times.get(self.queue[0][1], None) != self.queue[0][0]:
+            heapq.heappop(self.queue)
+
+    def peek(self) -> float:
+        """ Returns the earliest standing wake-up time [s] """
+        self.__discard_stale()
+        return self.queue[0][0] if self.queue else np.Inf
+
+    def advance(self, t : float) -> list:
+        """ Wakes up every element with a standing wake-up time at or before `t` [s] and returns their names """
+        woken = []
+        self.__discard_stale()
+        while self.queue and self.queue[0][0] <= t:
+            _, element = heapq.heappop(self.queue)
+            self.wake_times.pop(element)
+            self.pending.add(element)
+            woken.append(element)
+            self.__discard_stale()
+
+        return woken
+
+class SimulationManager(ContextElement, AbstractManager):
     """
     ## Simulation Manager
 
@@ -28,14 +106,20 @@ class SimulationManager(AbstractManager):
                     clock_config: ClockConfig, 
                     network_config: NetworkConfig, 
                     level: int = logging.INFO, 
-                    logger: logging.Logger = None) -> None:
+                    logger: logging.Logger = None,
+                    event_times : list = None) -> None:
         super().__init__(simulation_element_name_list, clock_config, network_config, level, logger)
 
         self.results_path : str = results_path
+        self.event_times : np.ndarray = np.unique(np.array(event_times, dtype=float)) \
+                                            if event_times is not None else np.array([], dtype=float)
         self.stats = {f"{name}_wait" : [] for name in simulation_element_name_list}
         self.stats["clock_wait"] = []
         self.stats["sim_runtime"] = []
 
+        # number of messages received while waiting for clock updates
+        self.n_messages_received : int = 0
+
     def _check_element_list(self):
         env_count = 0
         for sim_element_name in self._simulation_element_name_list:
@@ -69,6 +153,47 @@ class SimulationManager(AbstractManager):
                 for _ in tqdm (range (10), desc=desc):
                     await asyncio.sleep(delay/10)
 
+            elif isinstance(self._clock_config, TimeSkippingClockConfig):
+                dt = self._clock_config.dt
+                t = 0
+                tf = delay
+
+                with tqdm(total=tf, desc=desc) as pbar:
+                    while t < tf:
+                        t_0 = time.perf_counter()
+
+                        # wait for everyone to ask to fast forward            
+                        self.log(f'waiting for tic requests...')
+                        reqs = await self.wait_for_tic_requests()
+                        self.log(f'tic requests received!')
+
+                        if reqs is None: break # an agent in the simulation is offline; terminate sim
+
+                        # find next time of interest
+                        t_next = self.get_next_time(t, dt, [reqs[src].tf for src in reqs], tf)
+
+                        # announce new time to simulation elements
+                        self.log(f'sending toc for time {t_next}[s]...', level=logging.INFO)
+                        toc = TocMessage(self.get_network_name(), t_next)
+
+                        await self.send_manager_broadcast(toc)
+
+                        # announce new time to simulation monitor
+                        self.log(f'sending toc for time {t_next}[s] to monitor...')
+                        toc.dst = SimulationElementRoles.MONITOR.value
+                        await self.send_monitor_message(toc) 
+
+                        self.log(f'toc for time {t_next}[s] sent!')
+
+                        # updete time and display
+                        pbar.update(t_next - t)
+                        t = t_next
+
+                        dt_wait = time.perf_counter() - t_0
+                        self.stats['clock_wait'].append(dt_wait)
+
+                    self.log('TIMER DONE!', level=logging.INFO)
+
             elif isinstance(self._clock_config, FixedTimesStepClockConfig):
                 dt = self._clock_config.dt
                 t = 0
@@ -107,6 +232,40 @@ class SimulationManager(AbstractManager):
 
                     self.log('TIMER DONE!', level=logging.INFO)
             
+            elif isinstance(self._clock_config, BatchedClockConfig):
+                t = 0
+                tf = self._clock_config.get_total_seconds()
+
+                # every element must register a wake-up time before the clock starts
+                wake_queue = WakeUpQueue([name.split('/')[-1] for name in self._simulation_element_name_list
+                                          if SimulationElementRoles.ENVIRONMENT.value not in name])
+
+                with tqdm(total=tf , desc=desc) as pbar:
+                    while t < tf:
+                        t_0 = time.perf_counter()
+
+                        # wait for every woken element to register its next wake-up time
+                        self.log(f'waiting for wake-up registrations...')
+                        if not await self.wait_for_wake_registrations(wake_queue): break
+                        self.log(f'wake-up registrations received!')
+
+                        # announce earliest wake-up time to simulation elements; the monitor does not track time
+                        t_next = min(wake_queue.peek(), tf)
+                        self.log(f'sending toc for time {t_next}[s]...', level=logging.INFO)
+                        toc = TocMessage(self.get_network_name(), t_next)
+                        await self.send_manager_broadcast(toc)
+                        self.log(f'toc for time {t_next}[s] sent!')
+
+                        # elements whose wake-up time was reached must register a new one
+                        wake_queue.advance(t_next)
+
+                        # updete time and display
+                        pbar.update(t_next - t)
+                        t = t_next
+                        
+                        dt = time.perf_counter() - t_0
+                        self.stats['clock_wait'].append(dt)
+
             elif isinstance(self._clock_config, EventDrivenClockConfig):  
                 t = 0
                 tf = self._clock_config.get_total_seconds()
@@ -156,6 +315,30 @@ class SimulationManager(AbstractManager):
         except asyncio.CancelledError:
             return
         
+    def get_next_time(self, t : float, dt : float, tic_reqs : list, tf : float) -> float:
+        """
+        Finds the next time-step in which an element of the simulation may act.
+
+        ### Arguments:
+            - t (`float`): current simulation time [s]
+            - dt (`float`): clock time-step [s]
+            - tic_reqs (`list`): times [s] requested by the simulation elements
+            - tf (`float`): simulation end time [s]
+
+        ### Returns:
+            - t_next (`float`): earliest requested or event time, rounded up to the fixed time-step grid
+        """
+        # find next event time after the current time
+        i_event = np.searchsorted(self.event_times, t, side='right')
+        t_event = self.event_times[i_event] if i_event < len(self.event_times) else np.Inf
+
+        # select earliest time of interest
+        t_next = min(min(tic_reqs, default=np.Inf), t_event, tf)
+
+        # round up to the fixed time-step grid; never skip less than one time-step
+        t_next = np.ceil(np.round(t_next / dt, 6)) * dt
+        return float(min(max(t_next, t + dt), tf))
+
     async def wait_for_tic_requests(self):
         """
         Awaits for all agents to send tic requests
@@ -181,6 +364,7 @@ class SimulationManager(AbstractManager):
                 await read_task
                 _, src, msg_dict = read_task.result()
                 msg_type = msg_dict['msg_type']
+                self.n_messages_received += 1
 
                 if NodeMessageTypes[msg_type] == NodeMessageTypes.DEACTIVATED:
                     return None
@@ -250,6 +434,56 @@ class SimulationManager(AbstractManager):
                 read_task.cancel()
                 await read_task
     
+    async def wait_for_wake_registrations(self, wake_queue : WakeUpQueue) -> bool:
+        """
+        Awaits for every pending element to register a wake-up time
+
+        #### Returns:
+            - `bool` indicating if all elements registered a wake-up time; `False` if an element went offline.
+        """
+        try:
+            t_0 = time.perf_counter()
+
+            while not wake_queue.is_ready():
+                # wait for incoming messages
+                _, src, msg_dict = await self._receive_manager_msg(zmq.SUB)
+                msg_type = msg_dict['msg_type']
+                self.n_messages_received += 1
+
+                if NodeMessageTypes[msg_type] == NodeMessageTypes.DEACTIVATED:
+                    return False
+
+                if ((NodeMessageTypes[msg_type] != NodeMessageTypes.TIC_REQ
+                    and NodeMessageTypes[msg_type] != NodeMessageTypes.CANCEL_TIC_REQ)
+                    or SimulationElementRoles.ENVIRONMENT.value in src):
+                    # ignore all incoming messages that are not of the desired type 
+                    self.log(f'Received {msg_type} message from node {src}! Ignoring message...')
+                    continue
+
+                if src not in self._simulation_element_name_list and self.get_network_name() + '/' + src not in self._simulation_element_name_list:
+                    # node is not a part of the simulation
+                    self.log(f'{src} is not part of this simulation. Pending elements: {len(wake_queue.pending)}')
+
+                elif NodeMessageTypes[msg_type] == NodeMessageTypes.TIC_REQ:
+                    # register standing wake-up time
+                    tic_req = TicRequest(**msg_dict)
+                    wake_queue.register(src, tic_req.tf)
+                    self.log(f'{src} registered wake-up time {tic_req.tf}[s]. Pending elements: {len(wake_queue.pending)}')
+
+                    dt = time.perf_counter() - t_0
+                    self.stats[f'{src}_wait'].append(dt)
+
+                else:
+                    # element woke up early; wait for its new wake-up time
+                    wake_queue.cancel(src)
+                    self.log(f'{src} cancelled its wake-up time. Pending elements: {len(wake_queue.pending)}')
+
+            return True
+
+        except asyncio.CancelledError:
+            # wait cancelled
+            return False
+
     async def teardown(self) -> None:
         # log performance stats
         n_decimals = 3
@@ -6,7 +6,9 @@ from dmas.clocks import ClockConfig
 from dmas.elements import SimulationElement
 from dmas.messages import ManagerMessageTypes, SimulationElementRoles
 
-class ResultsMonitor(SimulationElement):
+from chess3d.transport import ContextElement
+
+class ResultsMonitor(ContextElement, SimulationElement):
     def __init__(self, clock_config : ClockConfig, monitor_network_config : int, level: int = logging.INFO, logger: logging.Logger = None) -> None:
         
         super().__init__(SimulationElementRoles.MONITOR.value, monitor_network_config, level, logger)
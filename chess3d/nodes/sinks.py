@@ -0,0 +1,76 @@
+import os
+import pandas as pd
+
+
+class ResultsSink:
+    """
+    ## Results Sink
+
+    Streams the rows of a results table to a `csv` file during a simulation.
+
+    Rows are buffered in memory and appended to the file in chunks once the buffer is full, so memory usage is bounded
+    by the size of the buffer regardless of the duration of the simulation. The file is created on the first flush.
+    Closing the sink writes any remaining rows, or an empty table if no rows were ever written.
+
+    If no columns are given, they are taken from the keys of the first row appended to the sink.
+    """
+    def __init__(self,
+                 path : str,
+                 columns : list = None,
+                 buffer_size : int = 1000
+                 ) -> None:
+        """
+        ### Arguments:
+            - path (`str`): path of the `csv` file where rows will be written
+            - columns (`list`): names of the columns of the table
+            - buffer_size (`int`): maximum number of rows kept in memory before being written to the file
+        """
+        # validate inputs
+        if buffer_size < 1: raise ValueError(f'`buffer_size` must be a positive integer. Is {buffer_size}.')
+
+        # set parameters
+        self.path : str = path
+        self.columns : list = list(columns) if columns is not None else None
+        self.buffer_size : int = buffer_size
+
+        # initialize buffer
+        self.buffer : list = []
+        self.n_rows : int = 0
+        self.header_written : bool = False
+
+    def append(self, row) -> None:
+        """ Adds a row to the table. Rows may be given as a `list` of values or as a `dict` indexed by column name. """
+        if isinstance(row, dict):
+            # infer columns from first row
+            if self.columns is None: self.columns = list(row.keys())
+            row = [row[column] for column in self.columns]
+
+        self.buffer.append(row)
+        self.n_rows += 1
+
+        # write buffered rows if buffer is full
+        if len(self.buffer) >= self.buffer_size: self.flush()
+
+    def extend(self, rows : list) -> None:
+        """ Adds multiple rows to the table """
+        for row in rows: self.append(row)
+
+    def flush(self) -> None:
+        """ Appends all buffered rows to the file """
+        if not self.buffer and self.header_written: return
+
+        # create results directory if needed
+        directory = os.path.dirname(self.path)
+        if directory: os.makedirs(directory, exist_ok=True)
+
+        # write rows; the file is overwritten by the first write
+        pd.DataFrame(data=self.buffer, columns=self.columns).to_csv(self.path,
+                                                                     mode='a' if self.header_written else 'w',
+                                                                     header=not self.header_written,
+                                                                     index=False)
+        self.header_written = True
+        self.buffer = []
+
+    def close(self) -> None:
+        """ Writes any remaining buffered rows to the file """
+        self.flush()
@@ -0,0 +1,199 @@
+from typing import Dict
+import numpy as np
+import pandas as pd
+
+from chess3d.utils import str_to_list
+
+
+class ResultsAnalysis:
+    """
+    # Results Analysis
+
+    Parses the observations performed, events, and measurement requests of a simulation into typed arrays
+    and matches events to the requests and observations related to them in a single pass.
+
+    Matching is performed as an interval join: rows are sorted by latitude, candidate pairs within the
+    location tolerance are found via binary search, and pairs are then filtered by longitude, time, and
+    measurement type.
+    """
+    OBSERVATION_TOLERANCE = 1e-3
+    REQUEST_TOLERANCE = 1e-2
+
+    def __init__(self,
+                 observations_performed : pd.DataFrame,
+                 events : pd.DataFrame,
+                 measurement_reqs : pd.DataFrame
+                 ) -> None:
+        # store raw tables
+        self.observations_performed : pd.DataFrame = observations_performed
+        self.events : pd.DataFrame = events
+        self.measurement_reqs : pd.DataFrame = measurement_reqs
+
+        # parse event table
+        self.event_rows : list = [tuple(event) for event in events.values]
+        self.event_lat : np.ndarray = events.iloc[:,1].values.astype(float)
+        self.event_lon : np.ndarray = events.iloc[:,2].values.astype(float)
+        self.event_start : np.ndarray = events.iloc[:,3].values.astype(float)
+        self.event_end : np.ndarray = self.event_start + events.iloc[:,4].values.astype(float)
+        self.event_types, event_types = pd.factorize(events.iloc[:,6].values)
+
+        # parse observations table
+        self.observation_rows : list = [tuple(observation) for observation in observations_performed.values]
+        self.observation_t : np.ndarray = observations_performed.iloc[:,1].values.astype(float)
+        self.observation_lat : np.ndarray = observations_performed.iloc[:,2].values.astype(float)
+        self.observation_lon : np.ndarray = observations_performed.iloc[:,3].values.astype(float)
+        self.observation_instruments, instruments = pd.factorize(observations_performed.iloc[:,-1].values)
+
+        # parse measurement requests table
+        self.request_rows : list = [tuple(req) for req in measurement_reqs.values]
+        self.request_lat : np.ndarray = measurement_reqs.iloc[:,2].values.astype(float)
+        self.request_lon : np.ndarray = measurement_reqs.iloc[:,3].values.astype(float)
+        self.request_start : np.ndarray = measurement_reqs.iloc[:,5].values.astype(float)
+        self.request_end : np.ndarray = measurement_reqs.iloc[:,6].values.astype(float)
+        self.request_types, request_types = pd.factorize(measurement_reqs.iloc[:,-1].values)
+
+        # compile compatibility tables between unique measurement type lists
+        instrument_compatibility = np.array([[instrument in required for instrument in instruments]
+                                              for required in event_types], dtype=bool)\
+                                                .reshape((len(event_types), len(instruments)))
+        request_compatibility = np.array([[all([instrument in required for instrument in str_to_list(requested)])
+                                            for requested in request_types]
+                                           for required in event_types], dtype=bool)\
+                                            .reshape((len(event_types), len(request_types)))
+        self.n_required_types : np.ndarray = np.array([len(str_to_list(required)) for required in event_types], dtype=int)
+
+        # match events to observations
+        i_events, i_observations = self.__join(self.event_lat, self.event_lon,
+                                               self.observation_lat, self.observation_lon,
+                                               self.OBSERVATION_TOLERANCE)
+        t_img = self.observation_t[i_observations]
+        valid = ((self.event_start[i_events] <= t_img)
+                 & (t_img <= self.event_end[i_events])
+                 & instrument_compatibility[self.event_types[i_events],
+                                            self.observation_instruments[i_observations]])
+        self.event_observation_pairs : tuple = (i_events[valid], i_observations[valid])
+
+        # match events to measurement requests
+        i_events, i_requests = self.__join(self.event_lat, self.event_lon,
+                                           self.request_lat, self.request_lon,
+                                           self.REQUEST_TOLERANCE)
+        t_start_req = self.request_start[i_requests]
+        t_end_req = self.request_end[i_requests]
+        valid = ((self.event_start[i_events] <= t_start_req)
+                 & (t_start_req <= t_end_req)
+                 & (t_end_req <= self.event_end[i_events])
+                 & request_compatibility[self.event_types[i_events],
+                                         self.request_types[i_requests]])
+        self.event_request_pairs : tuple = (i_events[valid], i_requests[valid])
+
+        # classify observations
+        self.events_per_gp, self.events_detected, self.events_observed, \
+            self.events_re_obs, self.events_co_obs, self.events_co_obs_fully, \
+                self.events_co_obs_partially = self.__classify()
+
+    def __join(self,
+               lat_left : np.ndarray,
+               lon_left : np.ndarray,
+               lat_right : np.ndarray,
+               lon_right : np.ndarray,
+               tolerance : float
+               ) -> tuple:
+        """
+        Finds all pairs of rows whose latitude and longitude differ by less than a given tolerance.
+
+        ### Returns:
+            - i_left (`np.ndarray`): indeces of the matching left rows, sorted in ascending order
+            - i_right (`np.ndarray`): indeces of the matching right rows, sorted in ascending order for every left row
+        """
+        # sort right rows by latitude
+        order = np.argsort(lat_right, kind='stable')
+        lat_sorted = lat_right[order]
+
+        # find candidates within a latitude band slightly wider than the tolerance
+        lo = np.searchsorted(lat_sorted, lat_left - 2*tolerance, side='left')
+        hi = np.searchsorted(lat_sorted, lat_left + 2*tolerance, side='right')
+        counts = hi - lo
+
+        # expand candidate pairs
+        i_left = np.repeat(np.arange(len(lat_left)), counts)
+        offsets = np.arange(len(i_left)) - np.repeat(np.cumsum(counts) - counts, counts)
+        i_right = order[np.repeat(lo, counts) + offsets]
+
+        # filter by exact location tolerance
+        valid = ((np.abs(lat_left[i_left] - lat_right[i_right]) < tolerance)
+                 & (np.abs(lon_left[i_left] - lon_right[i_right]) < tolerance))
+        i_left, i_right = i_left[valid], i_right[valid]
+
+        # sort pairs by left then right index
+        pair_order = np.lexsort((i_right, i_left))
+        return i_left[pair_order], i_right[pair_order]
+
+    def __group_pairs(self, i_left : np.ndarray, i_right : np.ndarray) -> Dict[int, np.ndarray]:
+        """ Groups sorted index pairs by their left index """
+        if len(i_left) == 0: return {}
+        keys, starts = np.unique(i_left, return_index=True)
+        return {key : group for key, group in zip(keys, np.split(i_right, starts[1:]))}
+
+    def __classify(self) -> tuple:
+        # classify events by their target groundpoint
+        events_per_gp : Dict[tuple, list] = {}
+        for _,lat,lon,t_start,duration,severity,observations_req in self.event_rows:
+            if (lat,lon) not in events_per_gp:
+                events_per_gp[(lat,lon)] = []
+            events_per_gp[(lat,lon)].append([t_start,duration,severity,observations_req])
+
+        # compile detected events
+        events_detected : Dict[tuple, list] = {}
+        for i_event, i_requests in self.__group_pairs(*self.event_request_pairs).items():
+            events_detected[self.event_rows[i_event]] = [self.request_rows[i_req] for i_req in i_requests]
+
+        # compile observed events
+        events_observed : Dict[tuple, list] = {}
+        n_required_types : Dict[tuple, int] = {}
+        for i_event, i_observations in self.__group_pairs(*self.event_observation_pairs).items():
+            event = self.event_rows[i_event]
+            _, lat, lon, t_start, duration, severity, observations_req = event
+
+            events_observed[event] = [(lat, lon, t_start, duration, severity, observer, t_img, instrument, observations_req)
+                                      for observer,t_img,*_,instrument in [self.observation_rows[i_obs]
+                                                                          for i_obs in i_observations]]
+            n_required_types[event] = self.n_required_types[self.event_types[i_event]]
+
+        # find reobserved events
+        events_re_obs = {event: observations
+                                for event,observations in events_observed.items()
+                                if len(observations) > 1}
+
+        # find coobserved events
+        events_co_obs : Dict[tuple, list] = {}
+        events_co_obs_fully : Dict[tuple, list] = {}
+        events_co_obs_partially : Dict[tuple, list] = {}
+        for event, observations in events_observed.items():
+            # remove duplicate observations
+            valid_observations = list(set(observations))
+
+            if len(valid_observations) == n_required_types[event]:
+                events_co_obs_fully[event] = valid_observations
+            elif len(valid_observations) > 1:
+                events_co_obs_partially[event] = valid_observations
+
+            events_co_obs[event] = valid_observations
+
+        return events_per_gp, events_detected, events_observed, events_re_obs, events_co_obs, events_co_obs_fully, events_co_obs_partially
+
+    def count_gps_observed(self) -> int:
+        """ Counts the number of unique ground point locations observed """
+        return len(set(zip(self.observations_performed.iloc[:,2].values,
+                           self.observations_performed.iloc[:,3].values)))
+
+    def calc_reobservation_times(self) -> np.ndarray:
+        """ Calculates the time between consecutive observations of the same ground point location """
+        if len(self.observation_rows) < 2: return np.array([])
+
+        # group observations by location while keeping their order within each group
+        order = np.lexsort((np.arange(len(self.observation_lat)), self.observation_lon, self.observation_lat))
+        lat, lon, t = self.observation_lat[order], self.observation_lon[order], self.observation_t[order]
+
+        # calculate time between consecutive observations of the same location
+        same_location = (lat[1:] == lat[:-1]) & (lon[1:] == lon[:-1])
+        return (t[1:] - t[:-1])[same_location]
@@ -0,0 +1,186 @@
+import concurrent.futures
+import copy
+import logging
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+import pandas as pd
+
+from chess3d.agents.orbitdata import OrbitData
+from chess3d.transport import TransportTypes
+
+
+def get_results_path(mission_specs : dict) -> str:
+    """ Returns the directory where the results of a mission will be stored """
+    scenario_dict : dict = mission_specs['scenario']
+    return os.path.join(scenario_dict['scenarioPath'], 'results', scenario_dict.get('name', 'test'))
+
+def get_orbitdata_path(mission_specs : dict) -> str:
+    """ Returns the directory where the pre-computed orbit data of a mission will be stored """
+    settings_dict : dict = mission_specs.get('settings', None)
+    data_dir = settings_dict.get('outDir', None) if settings_dict is not None else None
+    return data_dir if data_dir is not None else os.path.join(mission_specs['scenario']['scenarioPath'], 'orbit_data')
+
+def count_ports(mission_specs : dict) -> int:
+    """ Counts the number of ports used by the simulation elements of a mission """
+    n_agents = sum([len(mission_specs.get(agent_type, None) or [])
+                    for agent_type in ['spacecraft', 'uav', 'groundStation']])
+    return 6 + 7 * n_agents
+
+def get_peak_memory() -> float:
+    """ Returns the peak resident memory of the current process in [MB] """
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # `ru_maxrss` is reported in bytes on macOS and in kilobytes elsewhere
+    return max_rss / 1024**2 if sys.platform == 'darwin' else max_rss / 1024
+
+def precompute_orbitdata(mission_specs : dict) -> str:
+    """ Pre-computes the orbit data of a mission """
+    return OrbitData.precompute(copy.deepcopy(mission_specs))
+
+def run_mission(mission_specs : dict, level : int, ports : object = None) -> dict:
+    """
+    Runs a single mission and prints its results.
+
+    ### Arguments:
+        - mission_specs (`dict`): mission specifications
+        - level (`int`): logging level
+        - ports (`Queue`): shared queue of free port blocks. Only required for TCP transport.
+
+    ### Returns:
+        - run_stats (`dict`): name, wall time [s], and peak memory [MB] of the run
+    """
+    # import here so that the pool workers only load the simulation library when needed
+    from chess3d.mission import Mission
+
+    # reserve a block of ports for this run
+    port = ports.get() if ports is not None else None
+
+    try:
+        t_0 = time.perf_counter()
+
+        # initialize, execute, and print results
+        mission : Mission = Mission.from_dict(mission_specs, level, port)
+        mission.execute()
+        mission.print_results()
+
+        dt = time.perf_counter() - t_0
+
+    finally:
+        # release block of ports
+        if ports is not None: ports.put(port)
+
+    return {'name' : mission_specs['scenario']['name'],
+            'wall time [s]' : dt,
+            'peak memory [MB]' : get_peak_memory()}
+
+class StudyRunner:
+    """
+    ## Study Runner
+
+    Executes a list of missions on a pool of processes.
+
+    - Runs whose results directory already contains a `summary.csv` file are skipped, allowing interrupted studies to be resumed.
+    - Orbit data is pre-computed once per orbit data directory before any run starts, so runs of identical constellations share it.
+    - Every run is assigned its own set of endpoints. In-process transport is used by default; for TCP transport, each
+      run reserves a block of ports not in use by any other concurrent run.
+    - The wall time and peak memory of every run is recorded.
+    """
+    def __init__(self,
+                 runs : list,
+                 max_workers : int = None,
+                 transport : str = TransportTypes.INPROC.value,
+                 base_port : int = 5555,
+                 overwrite : bool = False,
+                 level : int = logging.WARNING
+                 ) -> None:
+        """
+        ### Arguments:
+            - runs (`list`): list of mission specifications to be run
+            - max_workers (`int`): maximum number of runs performed in parallel. Defaults to the number of processors.
+            - transport (`str`): type of transport used by the simulation elements of each run
+            - base_port (`int`): first port available to runs using TCP transport
+            - overwrite (`bool`): toggles rerunning missions with existing results
+            - level (`int`): logging level
+        """
+        # validate inputs
+        names = [run['scenario']['name'] for run in runs]
+        if len(set(names)) != len(names): raise ValueError('Study runs must have unique scenario names.')
+        transport = TransportTypes[transport.upper()]
+
+        # set run transport
+        self.runs : list = [copy.deepcopy(run) for run in runs]
+        for run in self.runs:
+            run.setdefault('settings', {})['transport'] = transport.value.lower()
+
+        # set parameters
+        self.max_workers : int = max_workers if max_workers is not None else os.cpu_count()
+        self.transport : TransportTypes = transport
+        self.base_port : int = base_port
+        self.overwrite : bool = overwrite
+        self.level : int = level
+
+    def get_pending_runs(self) -> list:
+        """ Returns the runs that have not yet been completed """
+        if self.overwrite: return list(self.runs)
+        return [run for run in self.runs
+                if not os.path.isfile(os.path.join(get_results_path(run), 'summary.csv'))]
+
+    def run(self, stats_path : str = None) -> pd.DataFrame:
+        """
+        Executes all pending runs
+
+        ### Arguments:
+            - stats_path (`str`): path of the `csv` file where run stats will be saved. Not saved if not given.
+
+        ### Returns:
+            - stats (`pd.DataFrame`): wall time and peak memory of every completed run
+        """
+        pending = self.get_pending_runs()
+        print(f'STUDY RUNS: {len(self.runs)} total, {len(self.runs) - len(pending)} completed, {len(pending)} pending')
+        if not pending: return pd.DataFrame(columns=['name', 'wall time [s]', 'peak memory [MB]'])
+
+        # pre-compute orbit data once per orbit data directory
+        orbitdata_runs = {get_orbitdata_path(run) : run for run in pending}
+        with concurrent.futures.ProcessPoolExecutor(min(self.max_workers, len(orbitdata_runs))) as pool:
+            for _ in pool.map(precompute_orbitdata, orbitdata_runs.values()): pass
+
+        with multiprocessing.Manager() as manager:
+            # allocate blocks of ports for TCP runs
+            ports = None
+            if self.transport == TransportTypes.TCP:
+                block_size = max([count_ports(run) for run in pending])
+                if self.base_port + self.max_workers * block_size > 65535:
+                    raise ValueError(f'Not enough ports available to run {self.max_workers} simulations in parallel.')
+
+                ports = manager.Queue()
+                for i in range(self.max_workers):
+                    ports.put(self.base_port + i * block_size)
+
+            # run missions; one process per run so peak memory is measured per run
+            stats = []
+            with concurrent.futures.ProcessPoolExecutor(self.max_workers, max_tasks_per_child=1) as pool:
+                futures = {pool.submit(run_mission, run, self.level, ports) : run for run in pending}
+                for future in concurrent.futures.as_completed(futures):
+                    run : dict = futures[future]
+                    try:
+                        stats.append(future.result())
+                        print(f"Run `{run['scenario']['name']}` completed ({len(stats)}/{len(pending)})")
+                    except Exception as e:
+                        print(f"Run `{run['scenario']['name']}` failed: {e}")
+
+        # compile and save stats
+        stats_df = pd.DataFrame(stats, columns=['name', 'wall time [s]', 'peak memory [MB]'])
+        if stats_path is not None: 
+            # keep stats of runs completed in previous executions of the study
+            if os.path.isfile(stats_path):
+                previous_stats = pd.read_csv(stats_path)
+                previous_stats = previous_stats[~previous_stats['name'].isin(stats_df['name'])]
+                pd.concat([previous_stats, stats_df]).to_csv(stats_path, index=False)
+            else:
+                stats_df.to_csv(stats_path, index=False)
+
+        return stats_df
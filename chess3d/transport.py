@@ -0,0 +1,87 @@
+from enum import Enum
+
+import zmq
+import zmq.asyncio
+
+
+class TransportTypes(Enum):
+    """
+    # Transport Types
+
+    Describes the type of ZMQ endpoints used to connect the elements of a simulation
+    - TCP: localhost TCP sockets. Elements may run in separate processes or hosts.
+    - IPC: unix domain sockets. Elements may run in separate processes of the same host.
+    - INPROC: in-process endpoints. All elements must run in the same process and share one ZMQ context.
+    """
+    TCP = 'TCP'
+    IPC = 'IPC'
+    INPROC = 'INPROC'
+
+def get_address(transport : TransportTypes, scenario_name : str, port : int, bind : bool) -> str:
+    """
+    Generates the ZMQ endpoint address for a given port number
+
+    ### Arguments:
+        - transport (`TransportTypes`): type of transport being used
+        - scenario_name (`str`): name of the scenario being simulated
+        - port (`int`): port number assigned to the socket. Used as a unique identifier for non-TCP transports
+        - bind (`bool`): whether the address is to be bound (`True`) or connected to (`False`)
+    """
+    if transport == TransportTypes.TCP:
+        return f'tcp://*:{port}' if bind else f'tcp://localhost:{port}'
+    elif transport == TransportTypes.IPC:
+        return f'ipc:///tmp/chess3d-{scenario_name}-{port}'
+    elif transport == TransportTypes.INPROC:
+        return f'inproc://{scenario_name}-{port}'
+    else:
+        raise ValueError(f'Transport of type `{transport}` not supported.')
+
+class SharedSyncContext(zmq.Context):
+    """ Synchronous shadow of a ZMQ context shared by several simulation elements. Terminating it does not terminate the shared context. """
+    def term(self) -> None:
+        return
+
+    def destroy(self, linger : int = None) -> None:
+        return
+
+class SharedContext(zmq.asyncio.Context):
+    """
+    Shadow of a ZMQ context shared by several simulation elements. 
+    
+    Terminating it does not terminate the shared context, which is owned by the mission that created it.
+    """
+    def term(self) -> None:
+        return
+
+    def destroy(self, linger : int = None) -> None:
+        return
+
+class ContextElement:
+    """
+    Mixin for simulation elements whose ZMQ sockets can be created from an explicitly given context.
+
+    dmas network elements create their own ZMQ contexts and store them in the attributes listed in 
+    `CONTEXT_ATTRIBUTES`, as dmas does not accept a context as an argument. `use_context` releases these 
+    contexts and replaces them with shadows of the given context, so all elements given the same context 
+    can reach each other's `inproc://` endpoints. Only the element itself is affected.
+    """
+    CONTEXT_ATTRIBUTES = ['_network_context', '_external_context', '_internal_context', '_manager_context']
+
+    def use_context(self, context : zmq.asyncio.Context) -> None:
+        """ Replaces this element's own contexts with shadows of a given context. Must be called before the element creates its sockets. """
+        # find the contexts created by the element
+        own_contexts = {name : getattr(self, name) for name in ContextElement.CONTEXT_ATTRIBUTES
+                        if isinstance(getattr(self, name, None), zmq.Context)}
+        if not own_contexts:
+            raise AttributeError(f'`{type(self).__name__}` object has none of the context attributes {ContextElement.CONTEXT_ATTRIBUTES}.')
+
+        # shadow the given context once per flavour
+        shared_context = SharedContext(shadow=context.underlying)
+        shared_sync_context = SharedSyncContext(shadow=context.underlying)
+
+        for name, own_context in own_contexts.items():
+            # release the element's own context and its IO thread
+            if not own_context.closed: own_context.destroy(linger=0)
+
+            # match the flavour of the context the element created for itself
+            setattr(self, name, shared_context if isinstance(own_context, zmq.asyncio.Context) else shared_sync_context)
@@ -0,0 +1,78 @@
+import argparse
+import copy
+import json
+import os
+
+from chess3d.mission import Mission
+
+
+def build_mission_specs(template_specs : dict, n_agents : int, clock_type : str, duration : float) -> dict:
+    """
+    Builds a toy mission with `n_agents` copies of the template's first satellite evenly spaced along its orbit
+
+    ### Arguments:
+        - template_specs (`dict`): mission specifications used as a template
+        - n_agents (`int`): number of satellites in the mission
+        - clock_type (`str`): type of simulation clock used by the mission
+        - duration (`float`): simulated duration [days]
+    """
+    mission_specs : dict = copy.deepcopy(template_specs)
+    mission_specs['duration'] = duration
+
+    # place satellites evenly along the template satellite's orbit
+    template_spacecraft : dict = mission_specs['spacecraft'][0]
+    mission_specs['spacecraft'] = []
+    for i in range(n_agents):
+        spacecraft : dict = copy.deepcopy(template_spacecraft)
+        spacecraft['@id'] = f'sat_{i}'
+        spacecraft['name'] = f'sat_{i}'
+        spacecraft['orbitState']['state']['ta'] = 360.0 * i / n_agents
+        mission_specs['spacecraft'].append(spacecraft)
+
+    # store orbit data and results of every mission within the benchmark directory
+    benchmark_dir = os.path.dirname(os.path.abspath(__file__))
+    mission_specs['scenario']['scenarioPath'] = benchmark_dir
+    mission_specs['scenario']['name'] = f'{clock_type.lower()}_{n_agents}'
+    mission_specs['scenario']['clock'] = {'@type' : clock_type}
+    mission_specs['settings']['outDir'] = os.path.join(benchmark_dir, 'orbit_data', f'agents_{n_agents}')
+    mission_specs['settings']['overwrite'] = 'true'
+
+    return mission_specs
+
+def count_messages(template_specs : dict, n_agents : int, clock_type : str, duration : float) -> int:
+    """
+    Runs a toy mission and counts the messages received by the simulation manager while keeping time
+
+    ### Returns:
+        - n_messages (`int`): messages received by the manager during the mission
+    """
+    mission : Mission = Mission.from_dict(build_mission_specs(template_specs, n_agents, clock_type, duration))
+    mission.execute()
+    return mission.manager.n_messages_received
+
+if __name__ == "__main__":
+    # read system arguments
+    parser = argparse.ArgumentParser(prog='CLOCK BENCHMARK',
+                                     description='Compares the number of clock-synchronization messages received by the simulation manager.')
+    parser.add_argument('-a', '--agents', type=int, nargs='+', default=[1, 2, 4, 8], help='numbers of satellites in the toy mission')
+    parser.add_argument('-d', '--duration', type=float, default=1.0, help='simulated duration [h]')
+    parser.add_argument('-m', '--mission', type=str, default='./scenarios/algal_blooms/MissionSpecs.json',
+                        help='path to mission specifications whose first satellite is used as a template')
+    args = parser.parse_args()
+
+    with open(args.mission, 'r') as mission_file:
+        template_specs : dict = json.load(mission_file)
+
+    # run the toy mission with each clock type
+    results = {}
+    for n_agents in args.agents:
+        n_event = count_messages(template_specs, n_agents, 'EVENT', args.duration / 24.0)
+        n_batched = count_messages(template_specs, n_agents, 'BATCHED', args.duration / 24.0)
+        results[n_agents] = (n_event, n_batched)
+
+    print(f'Messages received by the manager per simulated hour ({args.duration} [h] simulated):')
+    print(f'\t{"agents":>6}\t{"event/h":>10}\t{"batched/h":>10}\t{"reduction":>9}')
+    for n_agents, (n_event, n_batched) in results.items():
+        print(f'\t{n_agents:>6}\t{n_event/args.duration:>10.1f}\t{n_batched/args.duration:>10.1f}\t{n_event/n_batched:>8.2f}x')
+
+    print('DONE')
@@ -0,0 +1,96 @@
+import argparse
+import json
+import pickle
+import random
+import time
+import uuid
+
+
+# serializers being compared; `pickle` stands in for a compiled binary encoding of the same dictionaries
+SERIALIZERS = {
+    'json' : (lambda msg : json.dumps(msg).encode('utf-8'), lambda data : json.loads(data.decode('utf-8'))),
+    'binary' : (lambda msg : pickle.dumps(msg, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads)
+}
+
+def generate_messages(n_satellites : int, seed : int) -> dict:
+    """
+    Generates representative message dictionaries exchanged during a satellite mission
+
+    ### Returns:
+        - messages (`dict`): sample messages indexed by message type
+    """
+    rng = random.Random(seed)
+    def vector() -> list: return [rng.uniform(-7000.0, 7000.0) for _ in range(3)]
+
+    def state(i : int) -> dict:
+        return {'agent_name' : f'sat_{i}', 'state_type' : 'SATELLITE', 'pos' : vector(), 'vel' : vector(),
+                'attitude' : [rng.uniform(-45.0, 45.0), 0.0, 0.0], 'attitude_rates' : [0.0, 0.0, 0.0],
+                'eclipse' : rng.randint(0, 1), 'engineering_module' : None, 'status' : 'IDLING',
+                't' : rng.uniform(0.0, 86400.0), 'time_step' : 10.0, 'eps' : 1e-6}
+
+    def envelope(msg_type : str, dst : str) -> dict:
+        return {'src' : f'sat_{rng.randrange(n_satellites)}', 'dst' : dst, 'msg_type' : msg_type,
+                'id' : str(uuid.UUID(int=rng.getrandbits(128))), 'path' : []}
+
+    def bid() -> dict:
+        return {'req_id' : str(uuid.UUID(int=rng.getrandbits(128))), 'bidder' : f'sat_{rng.randrange(n_satellites)}',
+                'main_measurement' : 'visual', 'winner' : f'sat_{rng.randrange(n_satellites)}', 'owner' : 'gs_0',
+                'bid' : rng.uniform(0.0, 100.0), 't_img' : rng.uniform(0.0, 86400.0),
+                'th_img' : rng.uniform(-45.0, 45.0), 't_update' : rng.uniform(0.0, 86400.0), 'performed' : False}
+
+    return {
+        'AGENT_STATE' : {**envelope('AGENT_STATE', 'environment'), 'state' : state(0)},
+        'MEASUREMENT_BID' : {**envelope('MEASUREMENT_BID', 'broadcast'), 'bid' : bid()},
+        'SENSES' : {**envelope('SENSES', 'sat_0'), 'state' : state(0),
+                    'senses' : [{**envelope('AGENT_STATE', 'sat_0'), 'state' : state(i)} for i in range(n_satellites)]},
+        'OBSERVATION' : {**envelope('OBSERVATION', 'sat_0'), 'agent_state' : state(0), 'instrument' : 'visual',
+                         'observation_action' : {'action_type' : 'OBSERVE', 'instrument_name' : 'visual',
+                                                 'look_angle' : 10.0, 't_start' : 100.0, 't_end' : 110.0},
+                         'observation_data' : [{'lat' : rng.uniform(-90.0, 90.0), 'lon' : rng.uniform(-180.0, 180.0),
+                                                'range' : rng.uniform(500.0, 900.0), 'look' : rng.uniform(-45.0, 45.0),
+                                                't_img' : rng.uniform(0.0, 86400.0), 'observer' : 'sat_0'}
+                                               for _ in range(20)]},
+        'BUS' : {**envelope('BUS', 'broadcast'), 'msgs' : [{**envelope('MEASUREMENT_BID', 'broadcast'), 'bid' : bid()}
+                                                           for _ in range(n_satellites)]},
+    }
+
+def benchmark(serializer : str, msg : dict, n_iterations : int) -> tuple:
+    """
+    Measures the cost of sending a message with a given serializer
+
+    ### Returns:
+        - n_bytes (`int`): size of the encoded message [B]
+        - dt_encode (`float`): average time needed to encode the message [us]
+        - dt_decode (`float`): average time needed to decode the message [us]
+    """
+    encode, decode = SERIALIZERS[serializer]
+
+    t_0 = time.perf_counter()
+    for _ in range(n_iterations): data = encode(msg)
+    dt_encode = time.perf_counter() - t_0
+
+    t_0 = time.perf_counter()
+    for _ in range(n_iterations): decode(data)
+    dt_decode = time.perf_counter() - t_0
+
+    return len(data), 1e6 * dt_encode / n_iterations, 1e6 * dt_decode / n_iterations
+
+if __name__ == "__main__":
+    # read system arguments
+    parser = argparse.ArgumentParser(prog='CODEC BENCHMARK',
+                                     description='Compares the size and serialization cost of JSON and binary message encodings.')
+    parser.add_argument('-n', '--satellites', type=int, default=8, help='number of satellites in the emulated constellation')
+    parser.add_argument('-i', '--iterations', type=int, default=2000, help='number of times each message is encoded and decoded')
+    parser.add_argument('-s', '--seed', type=int, default=1000, help='random seed')
+    args = parser.parse_args()
+
+    messages = generate_messages(args.satellites, args.seed)
+    print(f'Serializing messages of a {args.satellites} satellite constellation ({args.iterations} iterations):')
+    print(f'\t{"message":<16}\t{"codec":<6}\t{"size [B]":>9}\t{"encode [us]":>11}\t{"decode [us]":>11}\t{"size ratio":>10}')
+    for msg_type, msg in messages.items():
+        results = {serializer : benchmark(serializer, msg, args.iterations) for serializer in SERIALIZERS}
+        for serializer, (n_bytes, dt_encode, dt_decode) in results.items():
+            ratio = results['json'][0] / n_bytes
+            print(f'\t{msg_type:<16}\t{serializer:<6}\t{n_bytes:>9}\t{dt_encode:>11.1f}\t{dt_decode:>11.1f}\t{ratio:>9.2f}x')
+
+    print('DONE')
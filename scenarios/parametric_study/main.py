@@ -9,8 +9,8 @@ import numpy as np
 import pandas as pd
 import tqdm
 
-from chess3d.mission import Mission
-from chess3d.utils import print_welcome, LEVELS
+from chess3d.study import StudyRunner
+from chess3d.utils import LEVELS
 
 
 def main(
@@ -19,7 +19,9 @@ def main(
          upper_bound : int, 
          level : int, 
          overwrite : bool = True,
-         debug : bool = True):
+         debug : bool = True,
+         max_workers : int = None,
+         transport : str = 'inproc'):
     
     # set scenario name
     parent_scenario_name = 'parametric_study'
@@ -76,8 +78,9 @@ def main(
                             if not debug else 1
     print(F'NUMBER OF RUNS TO PERFORM: {n_runs}')
 
-    # run simulation for each set of parameters
-    with tqdm.tqdm(total=n_runs) as pbar:
+    # compile specifications for each set of parameters
+    runs = []
+    with tqdm.tqdm(total=n_runs, desc='Compiling study runs') as pbar:
         for experiment_i,row in experiments_df.iterrows():
             if experiment_i < lower_bound:
                 continue
@@ -141,13 +144,6 @@ def main(
                             orbitdata_dir = os.path.join('./scenarios', parent_scenario_name, 'orbit_data', row['Name'])
                             scenario_specs['settings']['outDir'] = orbitdata_dir
 
-                            # check overwrite toggle
-                            results_dir = os.path.join('./scenarios', parent_scenario_name, 'results', experiments_name)
-                            if not overwrite and os.path.exists(os.path.join(results_dir, 'summary.csv')):
-                                # scenario already simulated and told not to overwrite; skip
-                                pbar.update(1)
-                                continue
-
                             # set simulation duration
                             scenario_specs['duration'] = sim_duration
 
@@ -213,22 +209,19 @@ def main(
                             # update list of satellites
                             scenario_specs['spacecraft'] = sats
 
-                            # print welcome message
-                            print_welcome(experiment_name)
-
-                            # initialize mission
-                            mission : Mission = Mission.from_dict(scenario_specs)
-
-                            # execute mission
-                            mission.execute()
-
-                            # print results
-                            mission.print_results()
+                            # add to list of runs
+                            runs.append(scenario_specs)
                                 
                             # update progress bad
                             pbar.update(1)
 
-                            if debug: return
+    # only run one simulation when debugging
+    if debug: runs = runs[:1]
+
+    # run simulations in parallel; runs with existing results are skipped
+    runner = StudyRunner(runs, max_workers, transport, overwrite=overwrite, level=level)
+    stats_path = os.path.join(scenario_dir, 'results', f'{experiments_name}_runtime_stats.csv')
+    runner.run(stats_path)
 
 def clear_orbitdata(scenario_dir : str) -> None:
     orbitdata_path = os.path.join(scenario_dir, 'orbit_data')
@@ -407,6 +400,19 @@ if __name__ == "__main__":
                         help='results overwrite toggle',
                         required=False,
                         type=bool) 
+    parser.add_argument('-w', 
+                        '--workers',
+                        default=None,
+                        help='number of simulations run in parallel. Defaults to the number of processors',
+                        required=False,
+                        type=int) 
+    parser.add_argument('-t', 
+                        '--transport',
+                        choices=['tcp', 'ipc', 'inproc'],
+                        default='inproc',
+                        help='type of transport used by the simulation elements',
+                        required=False,
+                        type=str) 
     parser.add_argument('-debug', 
                         '--debug',
                         default=False,
@@ -424,6 +430,8 @@ if __name__ == "__main__":
     level = LEVELS.get(args.level)
     overwrite = args.overwrite
     debug = args.debug
+    max_workers = args.workers
+    transport = args.transport
 
     # run simulation
     main(scenario_name, 
@@ -431,7 +439,9 @@ if __name__ == "__main__":
          upper_bound, 
          level, 
          overwrite, 
-        #  debug
+         debug,
+         max_workers,
+         transport
          )
 
     # print DONE
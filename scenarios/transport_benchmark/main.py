@@ -0,0 +1,109 @@
+import argparse
+import asyncio
+import copy
+import json
+import os
+import time
+
+import zmq
+import zmq.asyncio
+
+from chess3d.transport import TransportTypes, get_address
+
+
+async def run_exchange(transport : TransportTypes, n_agents : int, n_steps : int, port : int) -> float:
+    """
+    Emulates the manager's clock-synchronization exchange: on every step the manager publishes a
+    `tic` message and waits for a `toc` message from every agent over a PUSH/PULL channel.
+    Messages are JSON serialized, as done by the simulation elements.
+
+    ### Returns:
+        - dt (`float`): wall-clock time [s] needed to complete every step
+    """
+    context = zmq.asyncio.Context()
+
+    # create manager sockets
+    pub : zmq.asyncio.Socket = context.socket(zmq.PUB)
+    pub.bind(get_address(transport, 'benchmark', port, True))
+    pull : zmq.asyncio.Socket = context.socket(zmq.PULL)
+    pull.bind(get_address(transport, 'benchmark', port+1, True))
+
+    # create agent sockets
+    agents = []
+    for _ in range(n_agents):
+        sub : zmq.asyncio.Socket = context.socket(zmq.SUB)
+        sub.connect(get_address(transport, 'benchmark', port, False))
+        sub.setsockopt(zmq.SUBSCRIBE, b'')
+        push : zmq.asyncio.Socket = context.socket(zmq.PUSH)
+        push.connect(get_address(transport, 'benchmark', port+1, False))
+        agents.append((sub, push))
+
+    async def agent_routine(sub : zmq.asyncio.Socket, push : zmq.asyncio.Socket, i : int) -> None:
+        for _ in range(n_steps):
+            tic : dict = json.loads(await sub.recv_string())
+            await push.send_string(json.dumps({'src' : f'agent_{i}', 'msg_type' : 'toc', 't' : tic['t']}))
+
+    async def manager_routine() -> None:
+        for t in range(n_steps):
+            await pub.send_string(json.dumps({'src' : 'manager', 'msg_type' : 'tic', 't' : t}))
+            for _ in range(n_agents):
+                await pull.recv_string()
+
+    # allow subscriptions to propagate
+    await asyncio.sleep(0.5)
+
+    # run exchange
+    t_0 = time.perf_counter()
+    await asyncio.gather(manager_routine(), *[agent_routine(sub, push, i)
+                                              for i,(sub,push) in enumerate(agents)])
+    dt = time.perf_counter() - t_0
+
+    # close sockets
+    context.destroy(linger=0)
+
+    return dt
+
+def run_mission(mission_specs : dict, transport : TransportTypes) -> float:
+    """ Runs a full mission using a given transport and returns its wall-clock runtime [s] """
+    # import here so the socket benchmark does not require the full simulation dependencies
+    from chess3d.mission import Mission
+
+    specs : dict = copy.deepcopy(mission_specs)
+    specs['settings']['transport'] = transport.value.lower()
+    specs['scenario']['name'] = f"{specs['scenario'].get('name', 'test')}_{transport.value.lower()}"
+
+    mission : Mission = Mission.from_dict(specs)
+    t_0 = time.perf_counter()
+    mission.execute()
+    return time.perf_counter() - t_0
+
+if __name__ == "__main__":
+    # read system arguments
+    parser = argparse.ArgumentParser(prog='TRANSPORT BENCHMARK',
+                                     description='Compares the runtime of the available simulation transports.')
+    parser.add_argument('-a', '--agents', type=int, default=8, help='number of emulated agents')
+    parser.add_argument('-s', '--steps', type=int, default=2000, help='number of emulated time steps')
+    parser.add_argument('-m', '--mission', type=str, default=None,
+                        help='path to mission specifications to run under each transport')
+    args = parser.parse_args()
+
+    print(f'Emulating {args.steps} clock steps with {args.agents} agents:')
+    port = 5555
+    results = {}
+    for transport in TransportTypes:
+        dt = asyncio.run(run_exchange(transport, args.agents, args.steps, port))
+        results[transport] = dt
+        port += 2
+
+        print(f'\t{transport.value:<6}\t{dt:.3f} [s]\t{1e6*dt/args.steps:.1f} [us/step]\tx{results[TransportTypes.TCP]/dt:.2f}')
+
+    if args.mission is not None:
+        with open(args.mission, 'r') as mission_file:
+            mission_specs : dict = json.load(mission_file)
+
+        print(f'\nRunning mission `{os.path.basename(args.mission)}`:')
+        for transport in TransportTypes:
+            dt = run_mission(mission_specs, transport)
+            print(f'\t{transport.value:<6}\t{dt:.3f} [s]')
+
+    print('DONE')
@@ -1,5 +1,8 @@
 import copy
+import os
 import unittest
+import numpy as np
+import pandas as pd
 
 from chess3d.mission import Mission
 from chess3d.utils import print_welcome
@@ -389,12 +392,104 @@ class ToyTestACBBAReplanner(unittest.TestCase):
         }
 
         # initialize mission
+        self.mission_specs : dict = mission_specs
         self.toy_mission : Mission = Mission.from_dict(mission_specs)
 
     def test_toy_mission(self) -> None:
         # execute mission
         self.toy_mission.execute()
 
+    def test_toy_mission_batched_bids(self) -> None:
+        # execute mission broadcasting individual bids
+        self.toy_mission.execute()
+
+        # broadcast bid tables instead of individual bids
+        mission_specs : dict = copy.deepcopy(self.mission_specs)
+        mission_specs['scenario']['name'] = 'toy_batched'
+        for spacecraft in mission_specs['spacecraft']:
+            spacecraft['planner']['replanner']['batch bids'] = 'true'
+
+        # execute mission
+        mission : Mission = Mission.from_dict(mission_specs)
+        mission.execute()
+
+        # compare bid exchange counters
+        for spacecraft in mission_specs['spacecraft']:
+            agent_name = spacecraft['name']
+            counters = pd.read_csv(os.path.join(self.toy_mission.results_path, agent_name, 'bid_exchange_stats.csv'))
+            batched_counters = pd.read_csv(os.path.join(mission.results_path, agent_name, 'bid_exchange_stats.csv'))
+
+            self.assertEqual(counters['suppressed'][0], 0)
+            self.assertGreater(batched_counters['sent'][0], 0)
+            self.assertGreaterEqual(batched_counters['suppressed'][0], 0)
+            self.assertLessEqual(batched_counters['sent'][0], counters['sent'][0])
+
+        # compare observations performed
+        columns = ['observer', 't_img', 'lat', 'lon', 'instrument_name']
+        observations = pd.read_csv(os.path.join(self.toy_mission.results_path, 'environment', 'measurements.csv'))
+        batched_observations = pd.read_csv(os.path.join(mission.results_path, 'environment', 'measurements.csv'))
+        pd.testing.assert_frame_equal(observations[columns].sort_values(by=columns).reset_index(drop=True),
+                                      batched_observations[columns].sort_values(by=columns).reset_index(drop=True))
+
+    def test_toy_mission_transports(self) -> None:
+        # execute mission over tcp
+        self.toy_mission.execute()
+        columns = ['observer', 't_img', 'lat', 'lon', 'instrument_name']
+        observations = pd.read_csv(os.path.join(self.toy_mission.results_path, 'environment', 'measurements.csv'))
+
+        for transport in ['inproc', 'ipc']:
+            # execute mission over single-host transport
+            mission_specs : dict = copy.deepcopy(self.mission_specs)
+            mission_specs['scenario']['name'] = f'toy_{transport}'
+            mission_specs['settings']['transport'] = transport
+
+            mission : Mission = Mission.from_dict(mission_specs)
+            mission.execute()
+
+            # compare observations performed
+            transport_observations = pd.read_csv(os.path.join(mission.results_path, 'environment', 'measurements.csv'))
+            pd.testing.assert_frame_equal(observations[columns].sort_values(by=columns).reset_index(drop=True),
+                                          transport_observations[columns].sort_values(by=columns).reset_index(drop=True))
+
+    def test_toy_mission_clocks(self) -> None:
+        # execute mission with a fixed-step and a time-skipping clock
+        missions = {}
+        for clock_type in ['STEP', 'SKIP']:
+            mission_specs : dict = copy.deepcopy(self.mission_specs)
+            mission_specs['scenario']['name'] = f'toy_{clock_type.lower()}'
+            mission_specs['scenario']['clock'] = {'@type' : clock_type}
+
+            mission : Mission = Mission.from_dict(mission_specs)
+            mission.execute()
+            missions[clock_type] = mission
+
+        # skipped time-steps do not change the observations performed
+        columns = ['observer', 't_img', 'lat', 'lon', 'instrument_name']
+        step_observations = pd.read_csv(os.path.join(missions['STEP'].results_path, 'environment', 'measurements.csv'))
+        skip_observations = pd.read_csv(os.path.join(missions['SKIP'].results_path, 'environment', 'measurements.csv'))
+        pd.testing.assert_frame_equal(step_observations[columns].sort_values(by=columns).reset_index(drop=True),
+                                      skip_observations[columns].sort_values(by=columns).reset_index(drop=True))
+
+        # agents reach the same states at every time both clocks stop at
+        state_columns = ['x_pos', 'y_pos', 'z_pos', 'x_vel', 'y_vel', 'z_vel', 'attitude', 'eclipse']
+        for spacecraft in self.mission_specs['spacecraft']:
+            agent_name = spacecraft['name'].lower()
+            step_states = pd.read_csv(os.path.join(missions['STEP'].results_path, agent_name, 'states.csv'))
+            skip_states = pd.read_csv(os.path.join(missions['SKIP'].results_path, agent_name, 'states.csv'))
+
+            shared_states = step_states.drop_duplicates('t', keep='last').merge(skip_states.drop_duplicates('t', keep='last'),
+                                                                                on='t', suffixes=('_step', '_skip'))
+            self.assertGreater(len(shared_states), 0)
+            for column in state_columns:
+                np.testing.assert_allclose(shared_states[f'{column}_step'].values, shared_states[f'{column}_skip'].values)
+
+            # eclipse transitions are not skipped
+            eclipse_changes = step_states['eclipse'].values[1:] != step_states['eclipse'].values[:-1]
+            self.assertTrue(np.all(np.isin(step_states['t'].values[1:][eclipse_changes], skip_states['t'].values)))
+
+        # time-skipping clock needs fewer clock updates
+        self.assertLess(len(missions['SKIP'].manager.stats['clock_wait']), len(missions['STEP'].manager.stats['clock_wait']))
+
 class MissionTestACBBAReplanner(unittest.TestCase):
     def setUp(self) -> None:
         # load scenario json file
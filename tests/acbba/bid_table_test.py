@@ -0,0 +1,83 @@
+import json
+import unittest
+
+from orbitpy.util import Spacecraft
+
+from chess3d.agents.actions import BroadcastMessageAction
+from chess3d.agents.orbitdata import OrbitData
+from chess3d.agents.planning.plan import Preplan
+from chess3d.agents.planning.planners.consensus.acbba import ACBBAPlanner
+from chess3d.agents.science.requests import MeasurementRequest
+from chess3d.agents.states import SatelliteAgentState
+from chess3d.messages import SimulationMessageTypes
+
+class TestBidTableBroadcasts(unittest.TestCase):
+    def setUp(self) -> None:
+        # load precomputed orbit data and the specifications of the agent that generated it
+        orbitdata : dict = OrbitData.from_directory('./tests/acbba/orbit_data/mission')
+        with open('./tests/acbba/orbit_data/mission/MissionSpecs.json', 'r') as mission_specs:
+            spacecraft : dict = json.load(mission_specs)['spacecraft'][0]
+
+        self.orbitdata : OrbitData = orbitdata[spacecraft['name']]
+        self.state = SatelliteAgentState(spacecraft['name'], 
+                                         spacecraft['orbitState'], 
+                                         self.orbitdata.time_step, 
+                                         eps=1e-6, 
+                                         pos=[0.0, 0.0, 0.0], 
+                                         vel=[0.0, 0.0, 0.0])
+
+        # create planner broadcasting bid tables
+        self.planner = ACBBAPlanner(max_bundle_size=3, batch_bids=True)
+        self.planner.preplan = Preplan(t=0.0)
+
+        # bid on requests observed by the agent's instrument
+        instrument : str = spacecraft['instrument']['name']
+        reqs = [MeasurementRequest('ADMIN', [lat, lon, 0.0], 1.0, [instrument], 0.0, 3600.0) 
+                for lat, lon in [[0.0, 0.0], [10.0, 10.0]]]
+        self.bids = [bid for req in reqs for bid in self.planner._generate_bids_from_request(req, self.state)]
+
+    def schedule_tables(self, planner_changes : list, bids_to_rebroadcast : list = []) -> list:
+        """ Schedules broadcasts for a set of planner changes and consensus responses and returns the bid tables scheduled """
+        self.planner.planner_changes = list(planner_changes)
+        self.planner.bids_to_rebroadcasts = list(bids_to_rebroadcast)
+        broadcasts = self.planner._schedule_broadcasts(self.state, None, self.orbitdata)
+        return [action for action in broadcasts 
+                if isinstance(action, BroadcastMessageAction)
+                and action.msg['msg_type'] == SimulationMessageTypes.MEASUREMENT_BID_TABLE.value]
+
+    def complete(self, tables : list) -> None:
+        """ Reports the completion of a set of bid table broadcasts to the planner """
+        self.planner._AbstractConsensusReplanner__record_completed_broadcasts(self.state, tables)
+
+    def test_unchanged_bids(self) -> None:
+        # every bid is shared in the first table
+        tables = self.schedule_tables(self.bids)
+        self.assertEqual(len(tables), 1)
+        self.assertEqual(len(tables[0].msg['bids']), len(self.bids))
+        self.assertNotIn('version', tables[0].msg)
+
+        # bids are shared again until their broadcast is completed
+        self.assertEqual(len(self.schedule_tables(self.bids)), 1)
+        self.complete(tables)
+        self.assertEqual(self.planner.bid_counters['sent'], len(self.bids))
+
+        # unchanged planner bids are suppressed
+        self.assertEqual(self.schedule_tables(self.bids), [])
+        self.assertEqual(self.planner.bid_counters['suppressed'], len(self.bids))
+
+    def test_consensus_responses(self) -> None:
+        tables = self.schedule_tables(self.bids)
+        self.complete(tables)
+
+        # bids queued by the consensus phase are shared even if unchanged since their last broadcast
+        tables = self.schedule_tables(self.bids, [self.bids[0]])
+        self.assertEqual(len(tables), 1)
+        self.assertEqual([(bid['req_id'], bid['main_measurement']) for bid in tables[0].msg['bids']], 
+                         [(self.bids[0].req_id, self.bids[0].main_measurement)])
+
+        # responses are shared every time they are queued
+        self.complete(tables)
+        self.assertEqual(len(self.schedule_tables([], [self.bids[0]])), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import json
+import unittest
+
+from orbitpy.util import Spacecraft
+
+from chess3d.agents.orbitdata import OrbitData
+from chess3d.agents.planning.plan import Preplan
+from chess3d.agents.planning.planners.consensus.acbba import ACBBAPlanner
+from chess3d.agents.planning.planners.rewards import RewardGrid
+from chess3d.agents.science.requests import MeasurementRequest
+from chess3d.agents.science.utility import reobservation_strategy, utility_function
+from chess3d.agents.states import SatelliteAgentState
+
+class TestBundleSearch(unittest.TestCase):
+    def setUp(self) -> None:
+        # load precomputed orbit data and the specifications of the agent that generated it
+        orbitdata : dict = OrbitData.from_directory('./tests/acbba/orbit_data/mission')
+        with open('./tests/acbba/orbit_data/mission/MissionSpecs.json', 'r') as mission_specs:
+            spacecraft : dict = json.load(mission_specs)['spacecraft'][0]
+
+        self.orbitdata : OrbitData = orbitdata[spacecraft['name']]
+        self.specs : Spacecraft = Spacecraft.from_dict(spacecraft)
+        self.state = SatelliteAgentState(spacecraft['name'], 
+                                         spacecraft['orbitState'], 
+                                         self.orbitdata.time_step, 
+                                         eps=1e-6, 
+                                         pos=[0.0, 0.0, 0.0], 
+                                         vel=[0.0, 0.0, 0.0])
+        self.reward_grid = RewardGrid(utility_function['event'], 
+                                      self.specs, 
+                                      self.orbitdata.grid_data, 
+                                      1.0,
+                                      ground_points=self.orbitdata.get_ground_point_index(),
+                                      min_reward=1.0,
+                                      unobserved_reward_rate=2.0,
+                                      max_unobserved_reward=10.0,
+                                      event_reward=10.0,
+                                      reobservation_strategy=reobservation_strategy['constant'])
+
+        # request observations of ground points accessed by the agent's instrument
+        instrument : str = spacecraft['instrument']['name']
+        accesses = self.orbitdata.gp_access_data[self.orbitdata.gp_access_data['instrument'] == instrument]
+        targets = accesses[['lat [deg]', 'lon [deg]']].drop_duplicates().values[::8][:6]
+        self.reqs = [MeasurementRequest('ADMIN', [lat, lon, 0.0], 1.0, [instrument], 0.0, 3600.0) 
+                     for lat, lon in targets]
+        self.available_reqs = [(req, instrument) for req in self.reqs]
+
+    def generate_path(self, search_strategy : str, beam_width : int = 3, memoize : bool = True) -> tuple:
+        planner = ACBBAPlanner(max_bundle_size=3, search_strategy=search_strategy, beam_width=beam_width, memoize=memoize)
+        planner.preplan = Preplan(t=0.0)
+        
+        # no other agent has bid on the requests
+        results = {req.id : {bid.main_measurement : bid for bid in planner._generate_bids_from_request(req, self.state)}
+                   for req in self.reqs}
+        
+        path = planner._generate_path(self.state, self.specs, results, self.available_reqs, self.reward_grid, self.orbitdata)
+        return planner, results, path, planner.calc_path_utility(self.state, self.specs, path, self.reward_grid)
+
+    def path_tasks(self, path : list) -> list:
+        return [(req.id, main_measurement, t_img, th_img) for req, main_measurement, t_img, th_img, _ in path]
+
+    def test_branch_and_bound(self) -> None:
+        _, _, path, utility = self.generate_path(ACBBAPlanner.BFS)
+        _, _, bnb_path, bnb_utility = self.generate_path(ACBBAPlanner.BRANCH_AND_BOUND)
+
+        # pruning must not change the optimal path
+        self.assertGreater(len(path), 0)
+        self.assertEqual(self.path_tasks(bnb_path), self.path_tasks(path))
+        self.assertAlmostEqual(bnb_utility, utility)
+
+    def test_greedy_beam(self) -> None:
+        planner, results, path, utility = self.generate_path(ACBBAPlanner.BEAM, beam_width=1)
+
+        # extend the best path on every level
+        greedy_path, greedy_utility = [], 0.0
+        path_i = []
+        while len(path_i) < planner.max_bundle_size:
+            children = []
+            for path_j in planner._expand_path(self.state, self.specs, path_i, self.available_reqs, self.reward_grid, self.orbitdata):
+                outbid, path_utility, outbids_competitors \
+                    = planner._evaluate_path(self.state, self.specs, results, path_j, self.reward_grid)
+                if outbid: continue
+                children.append((path_utility, path_j))
+                if path_utility > greedy_utility and outbids_competitors:
+                    greedy_path, greedy_utility = path_j, path_utility
+            if not children: break
+            _, path_i = max(children, key=lambda child : child[0])
+
+        self.assertGreater(len(path), 0)
+        self.assertEqual(self.path_tasks(path), self.path_tasks(greedy_path))
+        self.assertAlmostEqual(utility, greedy_utility)
+
+        # greedy search cannot outperform an exhaustive search
+        _, _, _, bfs_utility = self.generate_path(ACBBAPlanner.BFS)
+        self.assertLessEqual(utility, bfs_utility + 1e-6)
+
+    def test_memoization(self) -> None:
+        for search_strategy in [ACBBAPlanner.BFS, ACBBAPlanner.BRANCH_AND_BOUND, ACBBAPlanner.BEAM]:
+            _, _, path, utility = self.generate_path(search_strategy, memoize=True)
+            _, _, unmemoized_path, unmemoized_utility = self.generate_path(search_strategy, memoize=False)
+
+            self.assertEqual(self.path_tasks(path), self.path_tasks(unmemoized_path))
+            self.assertAlmostEqual(utility, unmemoized_utility)
+
+        # expanded paths must be reused from the memo
+        planner, _, _, _ = self.generate_path(ACBBAPlanner.BFS)
+        memo = {}
+        paths = planner._expand_path(self.state, self.specs, [], self.available_reqs, self.reward_grid, self.orbitdata, memo)
+        self.assertEqual(len(memo), len(self.available_reqs))
+        for path_i in paths:
+            expanded = planner._expand_path(self.state, self.specs, path_i, self.available_reqs, self.reward_grid, self.orbitdata)
+            memoized = planner._expand_path(self.state, self.specs, path_i, self.available_reqs, self.reward_grid, self.orbitdata, memo)
+            self.assertEqual([self.path_tasks(path_j) for path_j in memoized], [self.path_tasks(path_j) for path_j in expanded])
+            self.assertEqual([self.path_tasks(path_j) for path_j in planner._expand_path(self.state, self.specs, path_i, self.available_reqs, 
+                                                                                         self.reward_grid, self.orbitdata, memo)],
+                             [self.path_tasks(path_j) for path_j in memoized])
+
+if __name__ == '__main__':
+    unittest.main()
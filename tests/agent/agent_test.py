@@ -0,0 +1,88 @@
+import asyncio
+import time
+import unittest
+
+from chess3d.agents.agent import SimulationAgent
+from chess3d.messages import *
+
+class TestAgentMessageWaits(unittest.TestCase):
+    def setUp(self) -> None:
+        # only the wait-time counters are needed to receive messages
+        self.agent : SimulationAgent = SimulationAgent.__new__(SimulationAgent)
+        self.agent.t_wait = 0.0
+        self.agent.MESSAGE_GRACE_PERIOD = 5e-2
+
+    def message(self, target : str) -> tuple:
+        msg = AgentConnectivityUpdate('img_0', target, 1)
+        return (msg.src, msg.dst, msg.to_dict())
+
+    def wait_for_message(self, q : asyncio.Queue, timeout : float) -> tuple:
+        return self.agent._SimulationAgent__wait_for_message(q, timeout)
+    
+    def empty_queue(self, q : asyncio.Queue) -> list:
+        return self.agent._SimulationAgent__empty_queue(q)
+
+    def test_wait_for_message(self) -> None:
+        async def wait() -> tuple:
+            q = asyncio.Queue()
+
+            # message arrives mid-wait
+            asyncio.get_running_loop().call_later(1e-2, q.put_nowait, self.message('img_1'))
+            t_0 = time.perf_counter()
+            msg = await self.wait_for_message(q, 5.0)
+            dt_received = time.perf_counter() - t_0
+
+            # no message arrives
+            t_0 = time.perf_counter()
+            no_msg = await self.wait_for_message(q, 2e-2)
+            dt_timeout = time.perf_counter() - t_0
+
+            return msg, dt_received, no_msg, dt_timeout
+
+        msg, dt_received, no_msg, dt_timeout = asyncio.run(wait())
+
+        # returns as soon as the message arrives
+        self.assertEqual(msg[2]['target'], 'img_1')
+        self.assertLess(dt_received, 1.0)
+
+        # returns nothing once the timeout passes
+        self.assertIsNone(no_msg)
+        self.assertGreaterEqual(dt_timeout, 1e-2)
+
+        # wait time is left for the caller to track
+        self.assertEqual(self.agent.t_wait, 0.0)
+
+    def test_empty_queue(self) -> None:
+        async def empty() -> tuple:
+            q = asyncio.Queue()
+
+            # nothing to receive; no grace period is waited
+            t_0 = time.perf_counter()
+            no_msgs = await self.empty_queue(q)
+            dt_empty = time.perf_counter() - t_0
+            t_wait_empty = self.agent.t_wait
+
+            # messages still in flight arrive during the grace period
+            q.put_nowait(self.message('img_1'))
+            asyncio.get_running_loop().call_later(1e-2, q.put_nowait, self.message('img_2'))
+            t_0 = time.perf_counter()
+            msgs = await self.empty_queue(q)
+            dt = time.perf_counter() - t_0
+
+            return no_msgs, dt_empty, t_wait_empty, msgs, dt
+
+        no_msgs, dt_empty, t_wait_empty, msgs, dt = asyncio.run(empty())
+
+        self.assertEqual(no_msgs, [])
+        self.assertEqual(t_wait_empty, 0.0)
+        self.assertLess(dt_empty, self.agent.MESSAGE_GRACE_PERIOD)
+
+        self.assertEqual([msg.target for msg in msgs], ['img_1', 'img_2'])
+        self.assertTrue(all(isinstance(msg, AgentConnectivityUpdate) for msg in msgs))
+
+        # every grace-period wait is counted once
+        self.assertGreaterEqual(self.agent.t_wait, self.agent.MESSAGE_GRACE_PERIOD)
+        self.assertLessEqual(self.agent.t_wait, dt)
+
+if __name__ == '__main__':
+    unittest.main()
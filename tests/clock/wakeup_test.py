@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+
+from chess3d.nodes.manager import WakeUpQueue
+
+class TestWakeUpQueue(unittest.TestCase):
+    def test_advance(self) -> None:
+        wake_queue = WakeUpQueue(['agent_0', 'agent_1', 'agent_2'])
+        self.assertFalse(wake_queue.is_ready())
+
+        # clock can only advance once every element registered a wake-up time
+        wake_queue.register('agent_0', 10.0)
+        wake_queue.register('agent_1', 20.0)
+        self.assertFalse(wake_queue.is_ready())
+        wake_queue.register('agent_2', 10.0)
+        self.assertTrue(wake_queue.is_ready())
+        self.assertEqual(wake_queue.peek(), 10.0)
+
+        # only elements whose wake-up time is reached need to respond
+        self.assertEqual(sorted(wake_queue.advance(10.0)), ['agent_0', 'agent_2'])
+        self.assertEqual(wake_queue.pending, {'agent_0', 'agent_2'})
+        self.assertEqual(wake_queue.peek(), 20.0)
+
+    def test_cancel(self) -> None:
+        wake_queue = WakeUpQueue(['agent_0', 'agent_1'])
+        wake_queue.register('agent_0', 10.0)
+        wake_queue.register('agent_1', 20.0)
+
+        # cancelled elements must register a new wake-up time
+        wake_queue.cancel('agent_0')
+        self.assertFalse(wake_queue.is_ready())
+        self.assertEqual(wake_queue.peek(), 20.0)
+
+        wake_queue.register('agent_0', 30.0)
+        self.assertTrue(wake_queue.is_ready())
+        self.assertEqual(wake_queue.advance(25.0), ['agent_1'])
+        self.assertEqual(wake_queue.advance(np.Inf), ['agent_0'])
+        self.assertEqual(wake_queue.peek(), np.Inf)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,15 @@
+import json
 import unittest
+import numpy as np
 
+from orbitpy.util import Spacecraft
+
+from chess3d.agents.actions import ObservationAction
+from chess3d.agents.orbitdata import OrbitData
+from chess3d.agents.planning.planners.dynamic import DynamicProgrammingPlanner, find_window_predecessors
+from chess3d.agents.planning.planners.rewards import RewardGrid
+from chess3d.agents.science.utility import reobservation_strategy, utility_function
+from chess3d.agents.states import SatelliteAgentState
 from chess3d.mission import Mission
 from chess3d.utils import print_welcome
 
@@ -154,5 +164,175 @@ class TestDynamicProgrammingPlanner(unittest.TestCase):
         # TODO Check outputs
         self.assertTrue(True)
 
+class TestDefaultDynamicProgrammingPlanner(unittest.TestCase):
+    def setUp(self) -> None:
+        # load precomputed orbit data and the specifications of the agents that generated it
+        self.orbitdata : dict = OrbitData.from_directory('./tests/acbba/orbit_data/mission')
+        with open('./tests/acbba/orbit_data/mission/MissionSpecs.json', 'r') as mission_specs:
+            self.spacecraft : list = json.load(mission_specs)['spacecraft']
+
+    def search_observations(self, 
+                            planner : DynamicProgrammingPlanner, 
+                            state : SatelliteAgentState, 
+                            specs : Spacecraft, 
+                            reward_grid : RewardGrid, 
+                            orbitdata : OrbitData
+                            ) -> float:
+        """ Finds the reward of the best feasible sequence of observations through an exhaustive search """
+        # list every possible observation in the planning horizon
+        access_opportunities, ground_points = planner.calculate_access_opportunities(state, specs, orbitdata)
+        candidates = []
+        for n, access_opportunity in enumerate(access_opportunities):
+            lat,lon = ground_points[access_opportunity[0]][access_opportunity[1]]
+            for k in range(len(access_opportunity[4])):
+                observation = ObservationAction(access_opportunity[2], 
+                                                [lat,lon,0.0], 
+                                                access_opportunity[5][k], 
+                                                access_opportunity[4][k])
+                candidates.append((n, observation, reward_grid.estimate_reward(observation)))
+        candidates.sort(key=lambda candidate: candidate[1].t_start)
+
+        # extend every feasible sequence with every later observation of an unobserved opportunity
+        def search(prev_observation : ObservationAction, observed : set, i_start : int) -> float:
+            best_reward = 0.0
+            for i in range(i_start, len(candidates)):
+                n, observation, reward = candidates[i]
+                if n in observed: continue
+
+                path = [prev_observation, observation] if prev_observation is not None else [observation]
+                if planner.is_observation_path_valid(state, specs, path):
+                    best_reward = max(best_reward, reward + search(observation, observed | {n}, i+1))
+            return best_reward
+
+        return search(None, set(), 0)
+
+    def test_optimal_plan(self) -> None:
+        for spacecraft in self.spacecraft:
+            agent_orbitdata : OrbitData = self.orbitdata[spacecraft['name']]
+            specs : Spacecraft = Spacecraft.from_dict(spacecraft)
+            state = SatelliteAgentState(spacecraft['name'], 
+                                        spacecraft['orbitState'], 
+                                        agent_orbitdata.time_step, 
+                                        eps=1e-6, 
+                                        pos=[0.0, 0.0, 0.0], 
+                                        vel=[0.0, 0.0, 0.0],
+                                        t=500.0)
+            reward_grid = RewardGrid(utility_function['event'], 
+                                     specs, 
+                                     agent_orbitdata.grid_data, 
+                                     1.0,
+                                     ground_points=agent_orbitdata.get_ground_point_index(),
+                                     min_reward=1.0,
+                                     unobserved_reward_rate=2.0,
+                                     max_unobserved_reward=10.0,
+                                     event_reward=10.0,
+                                     reobservation_strategy=reobservation_strategy['constant'])
+
+            # plan over a short horizon that can still be searched exhaustively
+            planner = DynamicProgrammingPlanner(horizon=600.0, period=600.0)
+            observations = planner._schedule_observations(state, specs, reward_grid, None, agent_orbitdata)
+            reward = sum([reward_grid.estimate_reward(observation) for observation in observations])
+
+            # the plan must be feasible and as rewarding as the best sequence of observations
+            self.assertGreater(len(observations), 0)
+            self.assertTrue(planner.is_observation_path_valid(state, specs, observations))
+            self.assertAlmostEqual(reward, self.search_observations(planner, state, specs, reward_grid, agent_orbitdata))
+
+class TestDynamicProgrammingEngines(unittest.TestCase):
+    def setUp(self) -> None:
+        # load precomputed orbit data and the specifications of the agents that generated it
+        self.orbitdata : dict = OrbitData.from_directory('./tests/acbba/orbit_data/mission')
+        with open('./tests/acbba/orbit_data/mission/MissionSpecs.json', 'r') as mission_specs:
+            self.spacecraft : list = json.load(mission_specs)['spacecraft']
+
+    def schedule(self, engine : str, spacecraft : dict, max_workers : int = 1, planner : DynamicProgrammingPlanner = None) -> tuple:
+        agent_orbitdata : OrbitData = self.orbitdata[spacecraft['name']]
+        specs : Spacecraft = Spacecraft.from_dict(spacecraft)
+        state = SatelliteAgentState(spacecraft['name'], 
+                                    spacecraft['orbitState'], 
+                                    agent_orbitdata.time_step, 
+                                    eps=1e-6, 
+                                    pos=[0.0, 0.0, 0.0], 
+                                    vel=[0.0, 0.0, 0.0])
+        reward_grid = RewardGrid(utility_function['event'], 
+                                 specs, 
+                                 agent_orbitdata.grid_data, 
+                                 1.0,
+                                 ground_points=agent_orbitdata.get_ground_point_index(),
+                                 min_reward=1.0,
+                                 unobserved_reward_rate=2.0,
+                                 max_unobserved_reward=10.0,
+                                 event_reward=10.0,
+                                 reobservation_strategy=reobservation_strategy['constant'])
+        
+        if planner is None:
+            planner = DynamicProgrammingPlanner(horizon=1000.0, period=1000.0, engine=engine, max_workers=max_workers)
+        observations = planner._schedule_observations(state, specs, reward_grid, None, agent_orbitdata)
+        reward = sum([reward_grid.estimate_reward(observation) for observation in observations])
+
+        return observations, reward, planner.is_observation_path_valid(state, specs, observations)
+
+    def test_engines(self) -> None:
+        for spacecraft in self.spacecraft:
+            observations, reward, valid = self.schedule(DynamicProgrammingPlanner.DEFAULT, spacecraft)
+            matrix_observations, matrix_reward, matrix_valid = self.schedule(DynamicProgrammingPlanner.MATRIX, spacecraft)
+            
+            # both engines must find feasible plans with the same reward
+            self.assertGreater(len(matrix_observations), 0)
+            self.assertTrue(valid)
+            self.assertTrue(matrix_valid)
+            self.assertAlmostEqual(matrix_reward, reward)
+
+            # splitting the adjacency construction across processes must not change the plan
+            parallel_observations, parallel_reward, _ = self.schedule(DynamicProgrammingPlanner.MATRIX, spacecraft, max_workers=2)
+            self.assertEqual([(observation.t_start, observation.look_angle) for observation in parallel_observations],
+                             [(observation.t_start, observation.look_angle) for observation in matrix_observations])
+            self.assertAlmostEqual(parallel_reward, matrix_reward)
+
+    def test_process_pool(self) -> None:
+        planner = DynamicProgrammingPlanner(horizon=1000.0, period=1000.0, engine=DynamicProgrammingPlanner.MATRIX, max_workers=2)
+        self.assertIsNone(planner.executor)
+
+        executor = None
+        for spacecraft in self.spacecraft:
+            observations, _, _ = self.schedule(DynamicProgrammingPlanner.MATRIX, spacecraft, planner=planner)
+            serial_observations, _, _ = self.schedule(DynamicProgrammingPlanner.MATRIX, spacecraft)
+
+            # the planner must keep using the process pool it created for its first planning call
+            self.assertIsNotNone(planner.executor)
+            if executor is None: executor = planner.executor
+            self.assertIs(planner.executor, executor)
+
+            # reusing the process pool must not change the plan
+            self.assertEqual([(observation.t_start, observation.look_angle) for observation in observations],
+                             [(observation.t_start, observation.look_angle) for observation in serial_observations])
+
+    def test_window_predecessors(self) -> None:
+        # generate opportunities with a random number of candidate observations each
+        rng = np.random.default_rng(0)
+        n, max_slew_rate = 40, 1.0
+        candidate_bounds = np.cumsum([0] + list(rng.integers(1, 4, n)))
+        candidate_t = np.sort(rng.uniform(0.0, 200.0, candidate_bounds[-1]))
+        candidate_th = rng.uniform(-50.0, 50.0, candidate_bounds[-1])
+        t_0, th_0 = candidate_t[candidate_bounds[:-1]], candidate_th[candidate_bounds[:-1]]
+        t0_order = np.argsort(t_0, kind='stable')
+        dt_max_maneuver = (np.max(candidate_th) - np.min(candidate_th)) / max_slew_rate
+        args = (t_0, th_0, t0_order, t_0[t0_order], candidate_bounds, candidate_t, candidate_th, max_slew_rate, dt_max_maneuver)
+
+        predecessors = find_window_predecessors(*args, 0, n)
+        self.assertEqual(len(predecessors), n)
+        for j in range(n):
+            # predecessors within the maneuver window must be able to reach one of `j`'s candidates
+            expected = {i for i in range(j)
+                        for k in range(candidate_bounds[j], candidate_bounds[j+1])
+                        if candidate_t[k] - dt_max_maneuver < t_0[i] <= candidate_t[k]
+                        and abs(candidate_th[k] - th_0[i]) / max_slew_rate <= candidate_t[k] - t_0[i] + 1e-6}
+            self.assertEqual(set(predecessors[j].tolist()), expected)
+
+        # evaluating opportunities in chunks must not change the results
+        chunked = find_window_predecessors(*args, 0, n // 2) + find_window_predecessors(*args, n // 2, n)
+        for window, chunked_window in zip(predecessors, chunked):
+            self.assertTrue(np.array_equal(window, chunked_window))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
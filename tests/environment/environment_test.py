@@ -0,0 +1,84 @@
+import json
+import unittest
+import numpy as np
+
+from instrupy.base import Instrument, BasicSensorModel
+
+from chess3d.agents.orbitdata import OrbitData
+from chess3d.agents.states import SatelliteAgentState
+from chess3d.nodes.environment import SimulationEnvironment
+
+class TestMeasurementQueries(unittest.TestCase):
+    def setUp(self) -> None:
+        # only orbit data is needed to resolve observations
+        self.environment : SimulationEnvironment = SimulationEnvironment.__new__(SimulationEnvironment)
+        self.environment.orbitdata = OrbitData.from_directory('./tests/acbba/orbit_data/mission')
+        self.environment.stats = {}
+
+        # load spacecraft specifications
+        with open('./tests/acbba/orbit_data/mission/MissionSpecs.json', 'r') as mission_specs:
+            self.spacecraft = {spacecraft['name'] : spacecraft 
+                               for spacecraft in json.load(mission_specs)['spacecraft']}
+
+    def query_row_scan(self, agent_state : SatelliteAgentState, instrument : Instrument) -> list:
+        """ Resolves an observation by scanning every ground point access of the observer """
+        agent_orbitdata : OrbitData = self.environment.orbitdata[agent_state.agent_name]
+        t = agent_state.t / agent_orbitdata.time_step
+        columns : list = list(agent_orbitdata.gp_access_data.columns.values)
+
+        obs_data = []
+        for instrument_model in instrument.mode:
+            instrument_model : BasicSensorModel
+            instrument_off_axis_fov = instrument_model.get_field_of_view().sph_geom.angle_width / 2.0
+
+            obs_data.extend([{"t_img"     : data[columns.index('time index')]*agent_orbitdata.time_step,
+                              "lat"       : data[columns.index('lat [deg]')],
+                              "lon"       : data[columns.index('lon [deg]')],
+                              "range"     : data[columns.index('observation range [km]')],
+                              "look"      : data[columns.index('look angle [deg]')],
+                              "incidence" : data[columns.index('incidence angle [deg]')],
+                              "zenith"    : data[columns.index('solar zenith [deg]')],
+                              "instrument_name": data[columns.index('instrument')]}
+                             for data in agent_orbitdata.gp_access_data.values
+                             if t - 1 < data[columns.index('time index')] < t + 1
+                             and data[columns.index('instrument')] == instrument.name
+                             and abs(agent_state.attitude[0] - data[columns.index('look angle [deg]')]) <= instrument_off_axis_fov])
+        return obs_data
+
+    def sort(self, obs_data : list) -> list:
+        return sorted(obs_data, key=lambda obs : (obs['t_img'], obs['lat'], obs['lon']))
+
+    def test_queries(self) -> None:
+        agent_states, instruments = [], []
+        for agent_name, agent_orbitdata in self.environment.orbitdata.items():
+            agent_orbitdata : OrbitData
+            spacecraft : dict = self.spacecraft[agent_name]
+            instrument : Instrument = Instrument.from_dict(spacecraft['instrument'])
+
+            # observe while pointing at accessible ground points and while pointing at nadir
+            for t_img, look_angle in agent_orbitdata.gp_access_data[['time index', 'look angle [deg]']].values[::40]:
+                for roll in [look_angle, 0.0]:
+                    agent_states.append(SatelliteAgentState(agent_name, 
+                                                            spacecraft['orbitState'], 
+                                                            agent_orbitdata.time_step,
+                                                            eps=1e-6,
+                                                            pos=[0.0, 0.0, 0.0],
+                                                            vel=[0.0, 0.0, 0.0],
+                                                            attitude=[roll, 0.0, 0.0],
+                                                            t=t_img * agent_orbitdata.time_step))
+                    instruments.append(instrument)
+
+        # batched and single queries must match a full scan of the access data
+        batch_obs_data = self.environment.query_measurement_data_batch(agent_states, instruments)
+        self.assertEqual(len(batch_obs_data), len(agent_states))
+        self.assertTrue(any(batch_obs_data))
+        for agent_state, instrument, obs_data in zip(agent_states, instruments, batch_obs_data):
+            expected = self.sort(self.query_row_scan(agent_state, instrument))
+            self.assertEqual(self.sort(obs_data), expected)
+            self.assertEqual(self.sort(self.environment.query_measurement_data(agent_state, instrument)), expected)
+
+    def test_mismatched_batch(self) -> None:
+        self.assertRaises(ValueError, self.environment.query_measurement_data_batch, [], [None])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import types
+import unittest
+import numpy as np
+
+from chess3d.agents.actions import ObservationAction
+from chess3d.agents.planning.feasibility import ManeuverFeasibility
+
+
+class TestManeuverFeasibility(unittest.TestCase):
+    def setUp(self) -> None:
+        self.feasibility = ManeuverFeasibility(1.0, 1.0, ['thermal'])
+        self.state = types.SimpleNamespace(t=0.0, attitude=[0.0, 0.0, 0.0])
+        self.observations = [ObservationAction('thermal', [0.0, 0.0, 0.0], 10.0, 10.0),
+                             ObservationAction('thermal', [1.0, 1.0, 0.0], -10.0, 30.0),
+                             ObservationAction('thermal', [2.0, 2.0, 0.0], 20.0, 40.0)]
+
+    def test_path(self) -> None:
+        self.assertTrue(self.feasibility.is_path_valid(self.state, self.observations[:2]))
+        self.assertFalse(self.feasibility.is_path_valid(self.state, self.observations))
+        self.assertFalse(self.feasibility.is_path_valid(self.state, [ObservationAction('sar', [0.0, 0.0, 0.0], 0.0, 10.0)]))
+
+    def test_matrices(self) -> None:
+        matrix = self.feasibility.calc_feasibility_matrix(self.observations)
+        band = self.feasibility.calc_feasibility_band(self.observations, 2)
+
+        self.assertTrue(np.allclose(self.feasibility.calc_transition_matrix(self.observations)[0], [0.0, 20.0, 10.0]))
+        self.assertTrue(matrix[0,1] and not matrix[1,2] and not matrix[1,0])
+        self.assertTrue(np.array_equal(band, [[matrix[0,1], matrix[0,2]], [matrix[1,2], False], [False, False]]))
+
+    def test_insertion(self) -> None:
+        path = [self.observations[0], self.observations[2]]
+        observation = ObservationAction('thermal', [3.0, 3.0, 0.0], 15.0, 20.0)
+
+        self.assertTrue(self.feasibility.is_insertion_valid(self.state, path, observation, 1))
+        self.assertFalse(self.feasibility.is_insertion_valid(self.state, path, observation, 0))
+        self.assertFalse(self.feasibility.is_insertion_valid(self.state, path, self.observations[1], 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import numpy as np
+
+from chess3d.agents.orbitdata import OrbitData, TimeInterval
+from chess3d.agents.planning.opportunities import AccessOpportunityProvider
+
+class TestAccessOpportunityProvider(unittest.TestCase):
+    def setUp(self) -> None:
+        self.orbitdata : dict = OrbitData.from_directory('./tests/acbba/orbit_data/mission')
+
+    def test_shared(self) -> None:
+        for orbitdata in self.orbitdata.values():
+            self.assertIs(AccessOpportunityProvider.get(orbitdata), AccessOpportunityProvider.get(orbitdata))
+
+    def test_intervals(self) -> None:
+        for orbitdata in self.orbitdata.values():
+            orbitdata : OrbitData
+            instruments = list(set(orbitdata.gp_access_data['instrument'].values))
+            provider = AccessOpportunityProvider(orbitdata)
+
+            access_opportunities, ground_points = provider.get_access_opportunities(0.0, 3600.0, instruments)
+            self.assertGreater(len(access_opportunities), 0)
+
+            for grid_index, gp_index, instrument, interval, t, th in access_opportunities:
+                interval : TimeInterval
+                self.assertIn(gp_index, ground_points[grid_index])
+                self.assertIn(instrument, instruments)
+                self.assertEqual(len(t), len(th))
+
+                # intervals contain consecutive accesses within the horizon
+                self.assertEqual((interval.start, interval.end), (t[0], t[-1]))
+                self.assertTrue(0.0 <= interval.start and interval.end <= 3600.0)
+                self.assertTrue(np.all(np.diff(t) <= orbitdata.time_step))
+
+    def test_sliding_horizon(self) -> None:
+        for orbitdata in self.orbitdata.values():
+            orbitdata : OrbitData
+            instruments = list(set(orbitdata.gp_access_data['instrument'].values))
+            provider = AccessOpportunityProvider(orbitdata)
+
+            for t_start in [0.0, 500.0, 500.0, 2500.0, 1000.0, 7000.0]:
+                for t_end, include_start in [(t_start + 1000.0, False), (t_start + 4000.0, True)]:
+                    # moving the horizon must yield the same intervals as compiling it from scratch
+                    expected = AccessOpportunityProvider(orbitdata).get_access_opportunities(t_start, t_end, instruments, include_start)
+                    access_opportunities, ground_points = provider.get_access_opportunities(t_start, t_end, instruments, include_start)
+
+                    self.assertEqual(ground_points, expected[1])
+                    self.assertEqual(len(access_opportunities), len(expected[0]))
+                    for opportunity, expected_opportunity in zip(access_opportunities, expected[0]):
+                        self.assertEqual(opportunity, expected_opportunity)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,401 @@
+import copy
+import gc
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+
+from chess3d.agents.orbitdata import ConnectivityTimeline, ContactTimeline, GroundPointIndex, IntervalIndex, OrbitData, TimeInterval
+
+class TestIntervalIndex(unittest.TestCase):
+    def test_contains(self) -> None:
+        index = IntervalIndex([10, 0, 4], [12, 5, 6])
+
+        self.assertTrue(index.contains(0))
+        self.assertTrue(index.contains(5.5))
+        self.assertTrue(index.contains(12))
+        self.assertFalse(index.contains(-1))
+        self.assertFalse(index.contains(7))
+        self.assertFalse(index.contains(12.1))
+
+    def test_next_interval(self) -> None:
+        index = IntervalIndex([0, 4, 10], [5, 6, 12])
+
+        self.assertEqual(index.next_interval(0), 0)
+        self.assertEqual(index.next_interval(5), 0)
+        self.assertEqual(index.next_interval(5, strict=True), 1)
+        self.assertEqual(index.next_interval(7), 2)
+        self.assertEqual(index.next_interval(13), -1)
+
+    def test_merge(self) -> None:
+        index = IntervalIndex([0, 3, 10, 12, 20], [5, 4, 15, 13, 21]).merge()
+
+        self.assertTrue(np.array_equal(index.starts, [0, 10, 20]))
+        self.assertTrue(np.array_equal(index.ends, [5, 15, 21]))
+        self.assertTrue(np.array_equal(index.overlapping(4.5, 12), [0, 1]))
+        self.assertEqual(len(index.overlapping(16, 19)), 0)
+
+class TestGroundPointIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        # uniformly distributed points on the sphere
+        rng = np.random.default_rng(1000)
+        self.lats = np.degrees(np.arcsin(rng.uniform(-1.0, 1.0, 5000)))
+        self.lons = rng.uniform(-180.0, 180.0, 5000)
+        self.queries = list(zip(rng.uniform(-90.0, 90.0, 100), rng.uniform(-180.0, 180.0, 100)))
+        self.queries.extend([(89.99, 179.9), (-90.0, -180.0), (0.0, 180.0), (self.lats[0], self.lons[0])])
+        self.index = GroundPointIndex(self.lats, self.lons)
+
+    def test_nearest(self) -> None:
+        for lat, lon in self.queries:
+            distances = GroundPointIndex.angular_distance(lat, lon, self.lats, self.lons)
+            self.assertAlmostEqual(distances[self.index.nearest(lat, lon)], np.min(distances))
+
+        self.assertEqual(list(self.index.nearest_all(self.lats[:10], self.lons[:10])), list(range(10)))
+        self.assertEqual(GroundPointIndex([], []).nearest(0.0, 0.0), -1)
+
+    def test_released(self) -> None:
+        orbitdata : dict = OrbitData.from_directory('./tests/acbba/orbit_data/mission')
+        key = ContactTimeline.get_cache_key('./tests/acbba/orbit_data/mission')
+
+        # ground point indeces are shared by every agent loaded from the same directory
+        for agent_orbitdata in orbitdata.values():
+            self.assertIs(agent_orbitdata.ground_points, GroundPointIndex.indeces[key])
+
+        # cached indeces must be released with the orbit data using them
+        orbitdata = None
+        agent_orbitdata = None
+        gc.collect()
+        self.assertNotIn(key, GroundPointIndex.indeces)
+
+    def test_radius(self) -> None:
+        for lat, lon in self.queries:
+            distances = GroundPointIndex.angular_distance(lat, lon, self.lats, self.lons)
+            for radius in [0.5, 5.0, 45.0, 120.0]:
+                self.assertEqual(list(self.index.query_radius(lat, lon, radius)), list(np.flatnonzero(distances <= radius)))
+
+    def test_box(self) -> None:
+        for lat, lon in self.queries:
+            dlon = np.abs(np.mod(self.lons - lon + 180.0, 360.0) - 180.0)
+            for tolerance in [0.0, 1e-3, 2.0]:
+                expected = np.flatnonzero((np.abs(self.lats - lat) <= tolerance) & (dlon <= tolerance))
+                self.assertEqual(list(self.index.query_box(lat, lon, tolerance)), list(expected))
+
+class TestIndexedOrbitData(unittest.TestCase):
+    def setUp(self) -> None:
+        # load orbit data with and without array indexing
+        self.orbitdata : dict = OrbitData.from_directory('./tests/acbba/orbit_data/mission')
+        self.orbitdata_raw : dict = {agent_name : OrbitData(orbitdata.agent_name,
+                                                           {'time step': orbitdata.time_step, 
+                                                            'epoc type' : orbitdata.epoc_type, 
+                                                            'epoc' : orbitdata.epoc, 
+                                                            'duration' : orbitdata.duration},
+                                                           orbitdata.eclipse_data,
+                                                           orbitdata.position_data,
+                                                           orbitdata.isl_data,
+                                                           orbitdata.gs_access_data,
+                                                           orbitdata.gp_access_data,
+                                                           orbitdata.grid_data,
+                                                           indexed=False)
+                                    for agent_name, orbitdata in self.orbitdata.items()}
+        
+    def test_queries(self) -> None:
+        for agent_name, orbitdata in self.orbitdata.items():
+            orbitdata : OrbitData
+            orbitdata_raw : OrbitData = self.orbitdata_raw[agent_name]
+            self.assertTrue(orbitdata.indexed)
+            self.assertFalse(orbitdata_raw.indexed)
+
+            for t in np.arange(0.0, 3600.0, 35.0):
+                self.assertEqual(orbitdata.is_eclipse(t), orbitdata_raw.is_eclipse(t))
+                self.assertEqual(orbitdata.get_next_eclipse_interval(t), orbitdata_raw.get_next_eclipse_interval(t))
+                self.assertEqual(orbitdata.get_orbit_state(t), orbitdata_raw.get_orbit_state(t))
+
+                for target in orbitdata.isl_data:
+                    self.assertEqual(orbitdata.is_accessing_agent(target, t), orbitdata_raw.is_accessing_agent(target, t))
+                    
+                    interval : TimeInterval = orbitdata.get_next_isl_access_interval(target, t)
+                    self.assertEqual(interval, orbitdata_raw.get_next_isl_access_interval(target, t))
+
+    def test_interpolation(self) -> None:
+        for agent_name, orbitdata in self.orbitdata.items():
+            orbitdata : OrbitData
+            orbitdata_raw : OrbitData = self.orbitdata_raw[agent_name]
+
+            # interpolated states must match propagated states at propagation times
+            times = np.arange(0.0, 3600.0, orbitdata.time_step)
+            pos, vel, eclipse = orbitdata.interpolate_orbit_states(times)
+            pos_raw, vel_raw, eclipse_raw = orbitdata_raw.interpolate_orbit_states(times)
+            for i,t in enumerate(times):
+                pos_t, vel_t, eclipse_t = orbitdata.get_orbit_state(t)
+                self.assertTrue(np.allclose(pos[i], pos_t))
+                self.assertTrue(np.allclose(vel[i], vel_t))
+                self.assertEqual(bool(eclipse[i]), eclipse_t)
+            self.assertTrue(np.allclose(pos, pos_raw))
+            self.assertTrue(np.array_equal(eclipse, eclipse_raw))
+
+            # interpolated states must lie between neighboring propagated states
+            midpoints = times[:-1] + orbitdata.time_step / 2.0
+            pos_mid, _, _ = orbitdata.interpolate_orbit_states(midpoints)
+            step = np.linalg.norm(pos[1:] - pos[:-1], axis=1)
+            self.assertTrue(np.all(np.linalg.norm(pos_mid - pos[:-1], axis=1) < step))
+
+            # times outside of the propagated span cannot be interpolated
+            self.assertFalse(orbitdata.covers(-1.0))
+            self.assertRaises(ValueError, orbitdata.interpolate_orbit_states, [-1.0])
+
+    def test_event_times(self) -> None:
+        for _, orbitdata in self.orbitdata.items():
+            orbitdata : OrbitData
+            event_times : np.ndarray = orbitdata.get_event_times()
+            self.assertTrue(np.all(np.diff(event_times) > 0))
+
+            # eclipse and link status must not change between consecutive event times
+            steps = np.arange(0.0, orbitdata.duration * 24 * 3600, orbitdata.time_step)
+            for t_prev, t in zip(steps[:-1], steps[1:]):
+                if t in event_times: continue
+                self.assertEqual(orbitdata.is_eclipse(t), orbitdata.is_eclipse(t_prev))
+                for target in orbitdata.isl_data:
+                    self.assertEqual(orbitdata.is_accessing_agent(target, t), orbitdata.is_accessing_agent(target, t_prev))
+
+            # ground points must not start being accessed between consecutive event times
+            for _, accesses in orbitdata.gp_access_data.groupby(['grid index', 'GP index', 'instrument']):
+                access_times = np.unique(accesses['time index'].values)
+                window_starts = access_times[np.insert(np.diff(access_times) > 1, 0, True)] * orbitdata.time_step
+                self.assertTrue(np.all(np.isin(window_starts, event_times)))
+
+            # consecutive accesses within a window are not event times
+            self.assertLess(len(event_times), len(np.unique(orbitdata.gp_access_data['time index'].values)))
+
+    def test_target_accesses(self) -> None:
+        for _, orbitdata in self.orbitdata.items():
+            orbitdata : OrbitData
+
+            for t_img,_,_,lat,lon,*_,instrument,_ in orbitdata.gp_access_data.values[::50]:
+                t_start, t_end = t_img * orbitdata.time_step, t_img * orbitdata.time_step + 3600.0
+
+                # indexed accesses must match a full scan of the access data
+                expected = sorted([(t*orbitdata.time_step, th)
+                                   for t,_,_,lat_img,lon_img,_,th,_,_,_,instrument_img,_ in orbitdata.gp_access_data.values
+                                   if abs(lat - lat_img) <= 1e-3
+                                   and abs(lon - lon_img) <= 1e-3
+                                   and t_start <= t*orbitdata.time_step <= t_end
+                                   and instrument == instrument_img])
+                times, look_angles = orbitdata.get_target_accesses(lat + 5e-4, lon - 5e-4, instrument, t_start, t_end)
+                self.assertEqual(list(zip(times, look_angles)), expected)
+                self.assertGreater(len(times), 0)
+
+    def test_find_gp_index(self) -> None:
+        for _, orbitdata in self.orbitdata.items():
+            orbitdata : OrbitData
+            grid = pd.concat(orbitdata.grid_data)
+
+            for lat, lon, grid_index, gp_index in grid.values[::25]:
+                # ground points must be found at their own coordinates and close to them
+                self.assertEqual(orbitdata.find_gp_index(lat, lon), (grid_index, gp_index, lat, lon))
+                self.assertEqual(orbitdata.find_gp_index(lat + 1e-4, lon - 1e-4)[:2], (grid_index, gp_index))
+
+class TestContactTimeline(unittest.TestCase):
+    def setUp(self) -> None:
+        self.orbitdata : dict = OrbitData.from_directory('./tests/acbba/orbit_data/mission')
+
+    def test_shared(self) -> None:
+        contacts : ContactTimeline = ContactTimeline.load('./tests/acbba/orbit_data/mission')
+        for orbitdata in self.orbitdata.values():
+            self.assertIs(orbitdata.contacts, contacts)
+
+    def test_released(self) -> None:
+        key = ContactTimeline.get_cache_key('./tests/acbba/orbit_data/mission')
+        self.assertIn(key, ContactTimeline.timelines)
+
+        # cached timelines must be released with the orbit data using them
+        self.orbitdata = None
+        gc.collect()
+        self.assertNotIn(key, ContactTimeline.timelines)
+
+    def test_queries(self) -> None:
+        for agent_name, orbitdata in self.orbitdata.items():
+            orbitdata : OrbitData
+            contacts : ContactTimeline = orbitdata.contacts
+
+            for target, isl_data in orbitdata.isl_data.items():
+                # links are symmetric
+                self.assertTrue(contacts.has_link(target, agent_name))
+
+                for t in np.arange(0.0, 3600.0, 35.0):
+                    connected = any([t_start <= t / orbitdata.time_step <= t_end for t_start,t_end in isl_data.values])
+                    self.assertEqual(contacts.is_connected(agent_name, target, t), connected)
+                    self.assertEqual(contacts.is_connected(target, agent_name, t), connected)
+
+                    interval : TimeInterval = contacts.next_window(agent_name, target, t)
+                    self.assertEqual(interval.start, t if connected else interval.start)
+                    self.assertTrue(all([window.has_overlap(TimeInterval(t, t + 100.0))
+                                         for window in contacts.windows_between(agent_name, target, t, t + 100.0)]))
+
+class TestConnectivityTimeline(unittest.TestCase):
+    def setUp(self) -> None:
+        self.orbitdata : dict = OrbitData.from_directory('./tests/acbba/orbit_data/mission')
+        self.contacts : ContactTimeline = next(iter(self.orbitdata.values())).contacts
+        self.links = {agent_name : {target : self.contacts.get_windows(agent_name, target) for target in self.orbitdata if target != agent_name}
+                      for agent_name in self.orbitdata}
+        self.links['gs'] = {target : True for target in self.orbitdata}
+
+    def test_transitions(self) -> None:
+        timeline = ConnectivityTimeline(self.contacts.time_step, self.links)
+
+        for agent_name, targets in self.links.items():
+            # first update lists every link
+            self.assertEqual([target for target, _ in timeline.advance(agent_name, 0.0)], list(targets.keys()))
+            status = {target : (windows if isinstance(windows, bool) else self.contacts.is_connected(agent_name, target, 0.0))
+                      for target, windows in targets.items()}
+
+            # later updates only list links that changed status
+            for t in np.arange(0.0, 3600.0, 35.0):
+                transitions = timeline.advance(agent_name, t)
+                expected = {target : (windows if isinstance(windows, bool) else self.contacts.is_connected(agent_name, target, t))
+                            for target, windows in targets.items()}
+                self.assertEqual(dict(transitions), {target : connected for target, connected in expected.items() 
+                                                      if status[target] != connected})
+                status = expected
+
+class TestOrbitDataCache(unittest.TestCase):
+    def setUp(self) -> None:
+        # copy pre-computed data to temporary directory
+        self.tmp_dir = tempfile.mkdtemp()
+        self.orbitdata_dir = os.path.join(self.tmp_dir, 'orbit_data')
+        shutil.copytree('./tests/acbba/orbit_data/mission', self.orbitdata_dir)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp_dir)
+
+    def test_cache(self) -> None:
+        # compile cache
+        OrbitData._write_cache(self.orbitdata_dir)
+        self.assertTrue(os.path.exists(os.path.join(self.orbitdata_dir, OrbitData.CACHE_DIR, OrbitData.CACHE_MANIFEST)))
+
+        for agent_name in ['thermal_0', 'vis_0', 'sar_0']:
+            cached : OrbitData = OrbitData.load(self.orbitdata_dir, agent_name)
+            parsed : OrbitData = OrbitData.load(self.orbitdata_dir, agent_name, use_cache=False)
+
+            self.assertEqual(cached.time_step, parsed.time_step)
+            self.assertEqual(cached.duration, parsed.duration)
+            pd.testing.assert_frame_equal(cached.eclipse_data.reset_index(drop=True), parsed.eclipse_data.reset_index(drop=True), check_dtype=False)
+            pd.testing.assert_frame_equal(cached.position_data.reset_index(drop=True), parsed.position_data.reset_index(drop=True), check_dtype=False)
+            pd.testing.assert_frame_equal(cached.gp_access_data.reset_index(drop=True), parsed.gp_access_data.reset_index(drop=True), check_dtype=False)
+            self.assertEqual(set(cached.isl_data.keys()), set(parsed.isl_data.keys()))
+
+    def test_memory_mapped(self) -> None:
+        def is_memory_mapped(values : np.ndarray) -> bool:
+            while values is not None:
+                if isinstance(values, np.memmap): return True
+                values = values.base
+            return False
+
+        # compile cache
+        OrbitData._write_cache(self.orbitdata_dir)
+        cached : OrbitData = OrbitData.load(self.orbitdata_dir, 'thermal_0')
+
+        # tables are not copied into memory
+        self.assertTrue(is_memory_mapped(cached.position_data['time index'].values))
+        self.assertTrue(is_memory_mapped(cached.gp_access_data['time index'].values))
+
+        # query indeces use the memory-mapped arrays directly
+        self.assertTrue(np.shares_memory(cached._position_times, cached.position_data['time index'].values))
+        self.assertTrue(np.shares_memory(cached._position_states, cached.position_data['x [km]'].values))
+        self.assertTrue(np.shares_memory(cached._eclipse_index.starts, cached.eclipse_data['start index'].values))
+        for target, isl_index in cached._isl_index.items():
+            self.assertTrue(np.shares_memory(isl_index.starts, cached.isl_data[target]['start index'].values))
+
+        instrument = cached.gp_access_data['instrument'].values[0]
+        access_index : dict = cached.get_gp_access_index(instrument)
+        self.assertTrue(np.shares_memory(access_index['time index'], cached.gp_access_data['time index'].values))
+        self.assertTrue(np.shares_memory(access_index['GP index'], cached.gp_access_data['GP index'].values))
+
+class TestPrecomputeHashes(unittest.TestCase):
+    def setUp(self) -> None:
+        with open('./tests/acbba/orbit_data/mission/MissionSpecs.json', 'r') as mission_specs:
+            self.scenario_specs : dict = json.load(mission_specs)
+
+    def test_satellite_hashes(self) -> None:
+        manifest = OrbitData._hash_precompute_inputs(self.scenario_specs)
+        self.assertEqual(len(manifest['satellites']), 3)
+        self.assertEqual(len(manifest['pairs']), 3)
+
+        # planner changes do not invalidate orbit data
+        scenario_specs = copy.deepcopy(self.scenario_specs)
+        scenario_specs['spacecraft'][0]['planner'] = {'replanner' : {'@type' : 'acbba'}}
+        self.assertEqual(OrbitData._hash_precompute_inputs(scenario_specs), manifest)
+
+        # adding a satellite only adds new hashes
+        scenario_specs['spacecraft'].append(copy.deepcopy(scenario_specs['spacecraft'][0]))
+        scenario_specs['spacecraft'][-1]['@id'] = 'new_sat'
+        extended = OrbitData._hash_precompute_inputs(scenario_specs)
+        self.assertEqual(extended['satellites'][:3], manifest['satellites'])
+        self.assertEqual(len(extended['pairs']), 6)
+        self.assertTrue(all(extended['pairs'][pair_hash] == filename for pair_hash, filename in manifest['pairs'].items()))
+
+        # orbit changes invalidate a single satellite
+        scenario_specs['spacecraft'][1]['orbitState']['state']['raan'] += 10.0
+        modified = OrbitData._hash_precompute_inputs(scenario_specs)
+        self.assertEqual([a == b for a, b in zip(modified['satellites'], manifest['satellites'])], [True, False, True])
+
+        # changes to shared inputs invalidate every satellite
+        scenario_specs['duration'] *= 2
+        self.assertTrue(set(OrbitData._hash_precompute_inputs(scenario_specs)['satellites']).isdisjoint(manifest['satellites']))
+
+    def test_identical_satellites(self) -> None:
+        # satellites with identical inputs share a satellite hash but not their inter-satellite link hashes
+        scenario_specs = copy.deepcopy(self.scenario_specs)
+        scenario_specs['spacecraft'].append(copy.deepcopy(scenario_specs['spacecraft'][0]))
+        manifest = OrbitData._hash_precompute_inputs(scenario_specs)
+        self.assertEqual(manifest['satellites'][0], manifest['satellites'][-1])
+        self.assertEqual(len(manifest['pairs']), 6)
+        self.assertEqual(sorted(manifest['pairs'].values()), 
+                         sorted([f'sat{i}_to_sat{j}.csv' for i in range(4) for j in range(i+1, 4)]))
+
+class TestPrecomputeIncremental(unittest.TestCase):
+    def setUp(self) -> None:
+        with open('./tests/acbba/orbit_data/mission/MissionSpecs.json', 'r') as mission_specs:
+            self.scenario_specs : dict = json.load(mission_specs)
+
+        # copy pre-computed data to temporary directory
+        self.tmp_dir = tempfile.mkdtemp()
+        self.orbitdata_dir = os.path.join(self.tmp_dir, 'orbit_data')
+        shutil.copytree('./tests/acbba/orbit_data/mission', self.orbitdata_dir)
+        self.scenario_specs['settings']['outDir'] = self.orbitdata_dir
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp_dir)
+
+    def get_file_ids(self) -> dict:
+        """ Returns the inode and modification time of every satellite and inter-satellite link data file """
+        file_ids = dict()
+        for directory in ['sat0', 'sat1', 'sat2', 'comm']:
+            for f in os.listdir(os.path.join(self.orbitdata_dir, directory)):
+                stat = os.stat(os.path.join(self.orbitdata_dir, directory, f))
+                file_ids[os.path.join(directory, f)] = (stat.st_ino, stat.st_mtime_ns)
+        return file_ids
+
+    def test_single_satellite_change(self) -> None:
+        previous_manifest = OrbitData._hash_precompute_inputs(self.scenario_specs)
+        previous_ids = self.get_file_ids()
+
+        # change the orbit of a single satellite
+        scenario_specs = copy.deepcopy(self.scenario_specs)
+        scenario_specs['spacecraft'][1]['orbitState']['state']['raan'] += 10.0
+        manifest = OrbitData._hash_precompute_inputs(scenario_specs)
+        OrbitData._propagate_incremental(scenario_specs, self.orbitdata_dir, manifest, previous_manifest)
+        current_ids = self.get_file_ids()
+
+        # only the data of the modified satellite and of its inter-satellite links was recomputed
+        self.assertEqual(set(current_ids.keys()), set(previous_ids.keys()))
+        recomputed = {f for f in current_ids if current_ids[f] != previous_ids[f]}
+        expected = {f for f in current_ids 
+                    if f.startswith('sat1') or f in ['comm/sat0_to_sat1.csv', 'comm/sat1_to_sat2.csv']}
+        self.assertEqual(recomputed, expected)
+        self.assertFalse(os.path.exists(os.path.join(self.orbitdata_dir, OrbitData.PRECOMPUTE_DIR)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+from chess3d.agents.actions import BroadcastMessageAction, ManeuverAction, ObservationAction, WaitForMessages
+from chess3d.agents.planning.plan import Preplan
+
+
+class TestPlan(unittest.TestCase):
+    def setUp(self) -> None:
+        self.observations = [ObservationAction('thermal', [0.0, 0.0, 0.0], 0.0, 20.0),
+                             ObservationAction('thermal', [1.0, 1.0, 0.0], 10.0, 10.0)]
+        self.maneuvers = [ManeuverAction([10.0, 0.0, 0.0], [1.0, 0.0, 0.0], 0.0, 10.0),
+                          ManeuverAction([0.0, 0.0, 0.0], [-1.0, 0.0, 0.0], 10.0, 20.0)]
+        self.plan = Preplan(self.observations, self.maneuvers, t=0.0)
+
+    def test_order(self) -> None:
+        # zero-duration actions are placed before any other action starting at the same time
+        self.assertEqual([action.id for action in self.plan], 
+                         [self.maneuvers[0].id, self.observations[1].id, self.maneuvers[1].id, self.observations[0].id])
+
+    def test_add(self) -> None:
+        # broadcasts during maneuvers split them in two
+        broadcast = BroadcastMessageAction({}, 5.0)
+        self.plan.add(broadcast, 0.0)
+
+        self.assertEqual(len(self.plan), 6)
+        self.assertIs(self.plan.get_action(broadcast.id), broadcast)
+        self.assertEqual([action.t_start for action in self.plan], [0.0, 5.0, 5.0, 10.0, 10.0, 20.0])
+
+    def test_next_actions(self) -> None:
+        self.assertEqual([action['id'] for action in self.plan.get_next_actions(5.0)], [self.maneuvers[0].id])
+        self.assertEqual([action['id'] for action in self.plan.get_next_actions(10.0)], [self.observations[1].id])
+        self.assertEqual(self.plan.get_next_actions(25.0)[0]['action_type'], WaitForMessages(25.0).action_type)
+
+    def test_completion(self) -> None:
+        self.plan.update_action_completion([self.maneuvers[0]], [], [], 15.0)
+
+        self.assertEqual([action.id for action in self.plan], [self.maneuvers[1].id, self.observations[0].id])
+        self.assertIsNone(self.plan.get_action(self.maneuvers[0].id))
+
+        self.plan.remove(self.observations[0])
+        self.assertEqual(len(self.plan), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1 @@
+""" unittests for 3DCHESS """
@@ -0,0 +1,47 @@
+import unittest
+import numpy as np
+import pandas as pd
+
+from chess3d.results import ResultsAnalysis
+
+
+class TestResultsAnalysis(unittest.TestCase):
+    def setUp(self) -> None:
+        self.events = pd.DataFrame(data=[[0, 0.0, 0.0, 0.0, 100.0, 1.0, '[thermal,sar]'],
+                                         [1, 1.0, 1.0, 0.0, 100.0, 1.0, '[thermal]'],
+                                         [2, 2.0, 2.0, 0.0, 100.0, 1.0, '[sar]']],
+                                   columns=['gp_index', 'lat [deg]', 'lon [deg]', 'start time [s]', 
+                                            'duration [s]', 'severity', 'measurements'])
+        self.observations = pd.DataFrame(data=[['sat_0', 10.0, 0.0, 0.0, 800.0, 10.0, 12.0, 30.0, 'thermal'],
+                                               ['sat_1', 20.0, 0.0, 0.0, 800.0, 10.0, 12.0, 30.0, 'sar'],
+                                               ['sat_0', 50.0, 1.0005, 1.0, 800.0, 10.0, 12.0, 30.0, 'thermal'],
+                                               ['sat_0', 150.0, 2.0, 2.0, 800.0, 10.0, 12.0, 30.0, 'sar'],
+                                               ['sat_1', 60.0, 5.0, 5.0, 800.0, 10.0, 12.0, 30.0, 'sar']],
+                                         columns=['observer', 't_img', 'lat', 'lon', 'range', 
+                                                  'look', 'incidence', 'zenith', 'instrument_name'])
+        self.requests = pd.DataFrame(data=[['req_0', 'sat_0', 0.005, 0.0, 1.0, 5.0, 50.0, 45.0, '[thermal]'],
+                                           ['req_1', 'sat_0', 2.0, 2.0, 1.0, 5.0, 500.0, 495.0, '[sar]']],
+                                     columns=['ID', 'Requester', 'lat [deg]', 'lon [deg]', 'Severity', 
+                                              't start', 't end', 't corr', 'Measurment Types'])
+        
+        self.analysis = ResultsAnalysis(self.observations, self.events, self.requests)
+
+    def test_matching(self) -> None:
+        events = [tuple(event) for event in self.events.values]
+
+        # only the first request is contained within its event
+        self.assertEqual(list(self.analysis.events_detected.keys()), [events[0]])
+
+        # third event is observed after it ended
+        self.assertEqual(list(self.analysis.events_observed.keys()), events[:2])
+        self.assertEqual(len(self.analysis.events_observed[events[0]]), 2)
+        self.assertEqual(list(self.analysis.events_re_obs.keys()), [events[0]])
+        self.assertEqual(list(self.analysis.events_co_obs_fully.keys()), events[:2])
+        self.assertEqual(len(self.analysis.events_per_gp), 3)
+
+    def test_coverage(self) -> None:
+        self.assertEqual(self.analysis.count_gps_observed(), 4)
+        self.assertTrue(np.array_equal(self.analysis.calc_reobservation_times(), [10.0]))
+
+if __name__ == '__main__':
+    unittest.main()
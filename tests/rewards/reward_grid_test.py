@@ -312,6 +312,39 @@ class RewardGridTester(unittest.TestCase):
                         # check correct updated reward
                         self.assertAlmostEqual(reward_point.reward, ref_values[i])
 
+    def test_array_storage(self) -> None:
+        """ checks that the array storage mode estimates the same rewards as the object storage mode """
+        # load reward grids
+        grid_params = {key : val for key, val in self.grid_params.items()}
+        grid_params['reobservation_strategy'] = lambda a : 1.0
+        reward_grid = RewardGrid(event_driven, self.agent_specs, self.grid_data, **grid_params)
+        reward_grid_arrays = RewardGrid(event_driven, self.agent_specs, self.grid_data, storage=RewardGrid.ARRAYS, **grid_params)
+
+        # observation followed by an event; an event ending later than the first, known before it starts; an observation during the later event
+        updates = [(4.0, [ObservationAction('thermal', [0.0, 0.0, 0.0], 0.0, 4.0)], []),
+                   (6.0, [], [MeasurementRequest('ADMIN', [0.0,0.0,0.0], 1.0, ['thermal'], 6.0, 13.0)]),
+                   (14.0, [], [MeasurementRequest('ADMIN', [0.0,0.0,0.0], 1.0, ['thermal'], 20.0, 30.0)]),
+                   (22.0, [ObservationAction('thermal', [0.0, 0.0, 0.0], 0.0, 22.0)], [])]
+
+        for t_update, observations, events in updates:
+            # update grids
+            reward_grid.update(t_update, observations, events)
+            reward_grid_arrays.update(t_update, observations, events)
+
+            # estimate rewards of future observations
+            proposed_observations = [ObservationAction('thermal', [0.0, 0.0, 0.0], 0.0, t) 
+                                     for t in np.arange(t_update, 40.0, 1.0)]
+            expected = [reward_grid.estimate_reward(observation) for observation in proposed_observations]
+            estimated = reward_grid_arrays.estimate_rewards(proposed_observations)
+
+            for reward_expected, reward_estimated in zip(expected, estimated):
+                self.assertAlmostEqual(reward_expected, reward_estimated)
+
+        # both grids record the same history
+        self.assertEqual(len(reward_grid.get_history()), len(reward_grid_arrays.get_history()))
+        for entry, entry_arrays in zip(reward_grid.get_history(), reward_grid_arrays.get_history()):
+            self.assertEqual(entry[-2:], entry_arrays[-2:])
+
     def test_printout(self) -> None:
         # set params
         n_steps = 11
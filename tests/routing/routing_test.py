@@ -0,0 +1,47 @@
+import unittest
+import numpy as np
+
+from chess3d.agents.orbitdata import ContactTimeline, IntervalIndex
+from chess3d.agents.planning.routing import ContactGraphRouter
+
+
+class TestContactGraphRouter(unittest.TestCase):
+    def setUp(self) -> None:
+        # chain of contacts with a late direct link between the first and last agents
+        links = {('A', 'B') : [IntervalIndex([0], [10])],
+                 ('B', 'C') : [IntervalIndex([20], [30])],
+                 ('A', 'C') : [IntervalIndex([100], [110])],
+                 ('C', 'D') : [IntervalIndex([25, 200], [26, 300])]}
+        contacts = ContactTimeline(1.0, links)
+        self.router = ContactGraphRouter(contacts, ['A', 'B', 'C', 'D', 'E'])
+
+    def test_flood(self) -> None:
+        arrivals, predecessors = self.router.flood('A', 0.0)
+
+        self.assertEqual(arrivals, {'A' : 0.0, 'B' : 0.0, 'C' : 20.0, 'D' : 25.0})
+        self.assertEqual(predecessors['C'], 'B')
+        self.assertNotIn('E', arrivals)
+
+    def test_route(self) -> None:
+        self.assertEqual(self.router.route('A', 'D', 0.0), (['B', 'C', 'D'], 25.0))
+        self.assertEqual(self.router.route('A', 'D', 11.0), (['C', 'D'], 200.0))
+        self.assertEqual(self.router.route('A', 'E', 0.0), ([], np.Inf))
+
+        # send times within the same bucket share a cached route
+        self.router.route('A', 'D', 10.3)
+        self.assertEqual(len(self.router.routes), 2)
+
+    def test_evict(self) -> None:
+        self.router.route('A', 'D', 0.0)
+        self.router.route('A', 'D', 11.0)
+        self.router.route('B', 'D', 20.0)
+
+        # routes sent before the current time's bucket are removed
+        self.router.evict(10.5)
+        self.assertEqual(set(self.router.routes), {('A', 11.0), ('B', 20.0)})
+
+        # evicted routes are recomputed when requested again
+        self.assertEqual(self.router.route('A', 'D', 0.0), (['B', 'C', 'D'], 25.0))
+
+if __name__ == '__main__':
+    unittest.main()
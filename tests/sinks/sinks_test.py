@@ -0,0 +1,47 @@
+import os
+import shutil
+import tempfile
+import unittest
+import pandas as pd
+
+from chess3d.nodes.sinks import ResultsSink
+
+class TestResultsSink(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp_dir)
+
+    def read(self, path : str) -> str:
+        with open(path, 'r') as file:
+            return file.read()
+
+    def test_streaming(self) -> None:
+        rows = [{'observer' : f'sat_{i % 3}', 't_img' : i * 10.0, 'lat' : i / 7.0, 'instrument_name' : 'vis'}
+                for i in range(25)]
+
+        # streamed file must match a table written at once
+        expected_path = os.path.join(self.tmp_dir, 'expected.csv')
+        pd.DataFrame(data=[list(row.values()) for row in rows], columns=list(rows[0].keys())).to_csv(expected_path, index=False)
+
+        path = os.path.join(self.tmp_dir, 'environment', 'measurements.csv')
+        sink = ResultsSink(path, buffer_size=4)
+        for row in rows:
+            sink.append(row)
+            self.assertLess(len(sink.buffer), sink.buffer_size)
+        sink.close()
+
+        self.assertEqual(sink.n_rows, len(rows))
+        self.assertEqual(self.read(path), self.read(expected_path))
+
+    def test_empty(self) -> None:
+        path = os.path.join(self.tmp_dir, 'requests.csv')
+        sink = ResultsSink(path, ['ID', 'Requester'])
+        sink.close()
+
+        self.assertEqual(self.read(path), 'ID,Requester\n')
+        self.assertRaises(ValueError, ResultsSink, path, None, 0)
+
+if __name__ == '__main__':
+    unittest.main()
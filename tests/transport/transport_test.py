@@ -0,0 +1,78 @@
+import asyncio
+import unittest
+import zmq
+import zmq.asyncio
+
+from chess3d.transport import ContextElement, TransportTypes, get_address
+
+class ToyElement(ContextElement):
+    """ Creates its own contexts the same way dmas network elements do """
+    def __init__(self) -> None:
+        self._network_context = zmq.asyncio.Context()
+        self._manager_context = zmq.Context()
+
+    def close(self) -> None:
+        self._network_context.term()
+        self._manager_context.term()
+
+class TestContextElement(unittest.TestCase):
+    def setUp(self) -> None:
+        self.context = zmq.asyncio.Context()
+
+    def tearDown(self) -> None:
+        self.context.destroy(linger=0)
+
+    def test_own_context(self) -> None:
+        element = ToyElement()
+        network_context, manager_context = element._network_context, element._manager_context
+
+        # element's own contexts are released once a context is given
+        element.use_context(self.context)
+        self.assertTrue(network_context.closed)
+        self.assertTrue(manager_context.closed)
+        self.assertEqual(element._network_context.underlying, self.context.underlying)
+        self.assertEqual(element._manager_context.underlying, self.context.underlying)
+
+        # shadows are created once
+        self.assertIs(element._manager_context, element._manager_context)
+
+        # elements without known context attributes cannot be given a context
+        self.assertRaises(AttributeError, ContextElement().use_context, self.context)
+
+    def test_shared_context(self) -> None:
+        sender, receiver = ToyElement(), ToyElement()
+        sender.use_context(self.context)
+        receiver.use_context(self.context)
+
+        # context flavours are preserved
+        self.assertIsInstance(sender._network_context, zmq.asyncio.Context)
+        self.assertNotIsInstance(receiver._manager_context, zmq.asyncio.Context)
+
+        # elements reach each other's in-process endpoints
+        address = get_address(TransportTypes.INPROC, 'test', 5555, True)
+        push : zmq.asyncio.Socket = sender._network_context.socket(zmq.PUSH)
+        push.bind(address)
+        pull : zmq.Socket = receiver._manager_context.socket(zmq.PULL)
+        pull.connect(address)
+
+        async def send() -> None:
+            await push.send(b'tic')
+        asyncio.run(send())
+        self.assertEqual(pull.recv(), b'tic')
+        push.close(linger=0)
+        pull.close(linger=0)
+
+        # terminating an element's context leaves the shared context open
+        sender.close()
+        receiver.close()
+        self.assertFalse(self.context.closed)
+
+        # other elements are unaffected
+        element = ToyElement()
+        self.assertIsInstance(element._network_context, zmq.asyncio.Context)
+        self.assertNotEqual(element._network_context.underlying, self.context.underlying)
+
+        element.close()
+
+if __name__ == '__main__':
+    unittest.main()